@@ -9,8 +9,29 @@ from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 import logging
 
+from backend.core.stats_kernels import summary_stats, zscore_outliers
+
 logger = logging.getLogger(__name__)
 
+__all__ = ['PerformanceDataProcessor']
+
+# Optional faster parsers; fall back to the pandas defaults when not installed
+try:
+    import pyarrow  # noqa: F401
+    _CSV_ENGINE = 'pyarrow'
+except ImportError:
+    _CSV_ENGINE = 'c'
+
+# Source columns that become 'timestamp'; read as text so every engine hands
+# downstream code the same strings (pyarrow would otherwise infer datetimes)
+_TIMESTAMP_DTYPES = {name: str for name in ('timestamp', 'Timestamp', 'Time', 'Date')}
+
+try:
+    import python_calamine  # noqa: F401
+    _EXCEL_ENGINE = 'calamine'
+except ImportError:
+    _EXCEL_ENGINE = None
+
 class PerformanceDataProcessor:
     """Processes performance test data and calculates key metrics"""
     
@@ -18,13 +39,15 @@ class PerformanceDataProcessor:
         self.df = None
         self.metrics = {}
         
-    def load_test_data(self, file_path: str, file_type: str = 'auto') -> pd.DataFrame:
+    def load_test_data(self, file_path: str, file_type: str = 'auto',
+                       columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Load performance test data from various file formats
         
         Args:
             file_path: Path to the data file
             file_type: Type of file ('csv', 'excel', 'json', 'auto')
+            columns: Source columns to load; all columns when None
             
         Returns:
             pd.DataFrame: Loaded data
@@ -32,20 +55,20 @@ class PerformanceDataProcessor:
         try:
             if file_type == 'auto':
                 if file_path.endswith('.csv'):
-                    self.df = pd.read_csv(file_path)
+                    self.df = self._read_csv(file_path, columns)
                 elif file_path.endswith('.xlsx') or file_path.endswith('.xls'):
-                    self.df = pd.read_excel(file_path)
+                    self.df = self._read_excel(file_path, columns)
                 elif file_path.endswith('.json'):
-                    self.df = pd.read_json(file_path)
+                    self.df = self._read_json(file_path, columns)
                 else:
                     raise ValueError(f"Unsupported file type: {file_path}")
             else:
                 if file_type == 'csv':
-                    self.df = pd.read_csv(file_path)
+                    self.df = self._read_csv(file_path, columns)
                 elif file_type == 'excel':
-                    self.df = pd.read_excel(file_path)
+                    self.df = self._read_excel(file_path, columns)
                 elif file_type == 'json':
-                    self.df = pd.read_json(file_path)
+                    self.df = self._read_json(file_path, columns)
                 else:
                     raise ValueError(f"Unsupported file type: {file_type}")
             
@@ -59,6 +82,25 @@ class PerformanceDataProcessor:
             logger.error(f"Error loading data from {file_path}: {str(e)}")
             raise
     
+    def _read_csv(self, file_path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Read a CSV file, using the multithreaded pyarrow parser when available
+        """
+        return pd.read_csv(file_path, engine=_CSV_ENGINE, usecols=columns, dtype=_TIMESTAMP_DTYPES)
+    
+    def _read_excel(self, file_path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Read an Excel file, using the calamine reader when available
+        """
+        return pd.read_excel(file_path, engine=_EXCEL_ENGINE, usecols=columns)
+    
+    def _read_json(self, file_path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Read a JSON file; pandas has no column pushdown here, so select afterwards
+        """
+        df = pd.read_json(file_path)
+        return df[columns] if columns is not None else df
+    
     def _normalize_data_format(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Normalize different data formats to standard format
@@ -67,7 +109,7 @@ class PerformanceDataProcessor:
         if 'Average' in df.columns and 'Median' in df.columns:
             # This is JMeter summary format - convert to individual records
             normalized_df = self._convert_jmeter_summary_to_records(df)
-            return normalized_df
+            return self._ensure_contiguous_columns(self._downcast_columns(normalized_df))
         
         # Handle other common formats
         column_mapping = {
@@ -111,41 +153,80 @@ class PerformanceDataProcessor:
         if 'timestamp' not in df.columns:
             df['timestamp'] = pd.Timestamp.now()
         
+        return self._ensure_contiguous_columns(self._downcast_columns(df))
+    
+    def _downcast_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store hot columns in the narrowest dtype that holds their values
+        
+        Status codes fit in uint16, which cuts the bytes every downstream
+        aggregation has to scan. Response times stay float64 because they feed
+        the reported averages and percentiles, where float32 rounding shows up
+        in the output. Label columns such as endpoint and user_id are left as
+        loaded, since the ML feature preparation encodes object columns itself.
+        """
+        if 'status_code' in df.columns and pd.api.types.is_numeric_dtype(df['status_code']):
+            df['status_code'] = pd.to_numeric(df['status_code'], downcast='unsigned')
+        
+        return df
+    
+    def _ensure_contiguous_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Make sure every numeric column is backed by its own contiguous buffer
+        
+        Frames built from a row-major 2D array store each column as a strided
+        view, so column reductions stride across rows. Rebuild those frames so
+        each column can be scanned sequentially.
+        """
+        strided = any(
+            not df[column].to_numpy().flags['C_CONTIGUOUS']
+            for column in df.columns
+            if pd.api.types.is_numeric_dtype(df[column])
+        )
+        if strided:
+            df = pd.DataFrame({column: df[column].copy() for column in df.columns}, index=df.index)
         return df
     
     def _convert_jmeter_summary_to_records(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Convert JMeter summary format to individual records
         """
-        records = []
+        rng = np.random.default_rng()
         
-        for _, row in df.iterrows():
-            # Create multiple records based on # Samples
-            num_samples = int(row.get('# Samples', 1))
-            
-            # Generate response times around the average
-            avg_response_time = row.get('Average', 0)
-            std_dev = avg_response_time * 0.2  # 20% standard deviation
-            
-            response_times = np.random.normal(avg_response_time, std_dev, num_samples)
-            response_times = np.maximum(response_times, 0)  # Ensure non-negative
-            
-            # Generate status codes
-            error_rate = row.get('Error %', 0) / 100
-            status_codes = np.random.choice([200, 500], num_samples, p=[1-error_rate, error_rate])
-            
-            # Create records
-            for i in range(num_samples):
-                record = {
-                    'response_time': response_times[i],
-                    'status_code': status_codes[i],
-                    'timestamp': pd.Timestamp.now() - pd.Timedelta(seconds=i),
-                    'endpoint': row.get('Label', '/api/endpoint'),
-                    'user_id': np.random.randint(1, 100)
-                }
-                records.append(record)
+        # Create multiple records based on # Samples
+        if '# Samples' in df.columns:
+            samples = df['# Samples'].to_numpy(dtype=np.int64)
+        else:
+            samples = np.ones(len(df), dtype=np.int64)
+        total = int(samples.sum())
         
-        return pd.DataFrame(records)
+        # Generate response times around the average (20% standard deviation)
+        avg_response_time = np.repeat(df['Average'].to_numpy(dtype=np.float64), samples)
+        response_times = np.maximum(rng.normal(avg_response_time, avg_response_time * 0.2), 0)
+        
+        # Generate status codes
+        if 'Error %' in df.columns:
+            error_rate = np.repeat(df['Error %'].to_numpy(dtype=np.float64) / 100, samples)
+        else:
+            error_rate = np.zeros(total)
+        status_codes = np.where(rng.random(total) < error_rate, 500, 200)
+        
+        # Timestamps step back one second per sample within each label
+        offsets = np.arange(total) - np.repeat(np.cumsum(samples) - samples, samples)
+        timestamps = pd.Timestamp.now() - pd.to_timedelta(offsets, unit='s')
+        
+        if 'Label' in df.columns:
+            endpoints = np.repeat(df['Label'].to_numpy(), samples)
+        else:
+            endpoints = np.full(total, '/api/endpoint', dtype=object)
+        
+        return pd.DataFrame({
+            'response_time': response_times,
+            'status_code': status_codes,
+            'timestamp': timestamps,
+            'endpoint': endpoints,
+            'user_id': rng.integers(1, 100, total)
+        })
     
     def calculate_basic_metrics(self) -> Dict:
         """
@@ -161,18 +242,27 @@ class PerformanceDataProcessor:
         
         # Response time metrics
         if 'response_time' in self.df.columns:
-            response_times = self.df['response_time']
-            metrics['response_time'] = {
-                'min': float(response_times.min()),
-                'max': float(response_times.max()),
-                'mean': float(response_times.mean()),
-                'median': float(response_times.median()),
-                'std': float(response_times.std()),
-                'p50': float(response_times.quantile(0.5)),
-                'p90': float(response_times.quantile(0.9)),
-                'p95': float(response_times.quantile(0.95)),
-                'p99': float(response_times.quantile(0.99))
-            }
+            response_times = self.df['response_time'].to_numpy(dtype=np.float64)
+            response_times = response_times[~np.isnan(response_times)]
+            if response_times.size > 0:
+                # All percentiles from a single partition of the array
+                p50, p90, p95, p99 = np.quantile(response_times, [0.5, 0.9, 0.95, 0.99])
+                rt_min, rt_max, rt_mean, rt_std = summary_stats(response_times)
+                metrics['response_time'] = {
+                    'min': rt_min,
+                    'max': rt_max,
+                    'mean': rt_mean,
+                    'median': float(p50),
+                    'std': rt_std,
+                    'p50': float(p50),
+                    'p90': float(p90),
+                    'p95': float(p95),
+                    'p99': float(p99)
+                }
+            else:
+                metrics['response_time'] = dict.fromkeys(
+                    ['min', 'max', 'mean', 'median', 'std', 'p50', 'p90', 'p95', 'p99'], float('nan')
+                )
         
         # Throughput metrics
         if 'requests_per_sec' in self.df.columns:
@@ -229,28 +319,34 @@ class PerformanceDataProcessor:
             return []
         
         data = self.df[column].dropna()
-        mean = data.mean()
-        std = data.std()
         
         # Detect outliers using z-score
-        z_scores = np.abs((data - mean) / std)
-        anomalies = data[z_scores > threshold]
+        positions, z_scores = zscore_outliers(data.to_numpy(dtype=np.float64), threshold)
+        labels = data.index[positions]
+        values = data.to_numpy()[positions]
+        
+        # Map back to row positions and read columns directly, not row by row
+        rows = np.flatnonzero(self.df[column].notna().to_numpy())[positions]
+        timestamps = self.df['timestamp'].array if 'timestamp' in self.df.columns else None
         
         anomaly_list = []
-        for idx, value in anomalies.items():
+        for idx, row, value, z_score in zip(labels, rows, values, z_scores):
             anomaly_list.append({
                 'index': int(idx),
                 'value': float(value),
-                'z_score': float(z_scores[idx]),
-                'timestamp': self.df.iloc[idx].get('timestamp', None)
+                'z_score': float(z_score),
+                'timestamp': timestamps[row] if timestamps is not None else None
             })
         
         return anomaly_list
     
-    def get_data_summary(self) -> Dict:
+    def get_data_summary(self, deep: bool = False) -> Dict:
         """
         Get comprehensive data summary
         
+        Args:
+            deep: Measure the true size of object columns (scans every value)
+            
         Returns:
             Dict: Data summary including shape, columns, data types
         """
@@ -262,7 +358,7 @@ class PerformanceDataProcessor:
             'columns': list(self.df.columns),
             'data_types': self.df.dtypes.to_dict(),
             'missing_values': self.df.isnull().sum().to_dict(),
-            'memory_usage': self.df.memory_usage(deep=True).sum()
+            'memory_usage': int(self.df.memory_usage(deep=deep).sum())
         }
     
     def filter_data(self, filters: Dict) -> pd.DataFrame:
@@ -278,18 +374,20 @@ class PerformanceDataProcessor:
         if self.df is None:
             return pd.DataFrame()
         
-        filtered_df = self.df.copy()
+        # Combine all conditions into one mask and slice the frame once
+        mask = np.ones(len(self.df), dtype=bool)
         
         for column, condition in filters.items():
-            if column in filtered_df.columns:
+            if column in self.df.columns:
+                values = self.df[column]
                 if isinstance(condition, (list, tuple)):
-                    filtered_df = filtered_df[filtered_df[column].isin(condition)]
+                    mask &= values.isin(set(condition)).to_numpy()
                 elif isinstance(condition, dict):
                     if 'min' in condition:
-                        filtered_df = filtered_df[filtered_df[column] >= condition['min']]
+                        mask &= (values >= condition['min']).to_numpy()
                     if 'max' in condition:
-                        filtered_df = filtered_df[filtered_df[column] <= condition['max']]
+                        mask &= (values <= condition['max']).to_numpy()
                 else:
-                    filtered_df = filtered_df[filtered_df[column] == condition]
+                    mask &= (values == condition).to_numpy()
         
-        return filtered_df
\ No newline at end of file
+        return self.df.loc[mask]
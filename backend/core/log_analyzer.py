@@ -4,13 +4,28 @@ Handles log file parsing and analysis for performance testing
 """
 
 import pandas as pd
+import numpy as np
+import io
+import os
 import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from itertools import islice, repeat
+from typing import Dict, Iterator, List, Optional, Tuple
 import logging
 
+from backend.core.stats_kernels import grouped_stats, zscore_outliers
+from backend.core.timestamps import TIMESTAMP_FORMAT
+
 logger = logging.getLogger(__name__)
 
+# Files smaller than this are parsed in-process; pool start-up would dominate
+PARALLEL_PARSE_MIN_BYTES = 64 * 1024 * 1024
+
+# Messages are dictionary-encoded when at most this fraction of them is distinct
+MESSAGE_CATEGORY_MAX_RATIO = 0.5
+
 class LogAnalyzer:
     """Analyzes log files to extract performance metrics and error patterns"""
     
@@ -25,30 +40,42 @@ class LogAnalyzer:
             'endpoint': r'(GET|POST|PUT|DELETE)\s+([^\s]+)',
             'ip_address': r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
         }
+        self._compile_patterns()
         self.parsed_logs = []
+    
+    def _compile_patterns(self):
+        """Compile every log pattern once; level patterns are case-insensitive"""
+        self._compiled = {
+            name: re.compile(pattern, re.IGNORECASE if name in ('error', 'warning') else 0)
+            for name, pattern in self.log_patterns.items()
+        }
         
-    def parse_log_file(self, file_path: str) -> pd.DataFrame:
+    def parse_log_file(self, file_path: str, workers: Optional[int] = None) -> pd.DataFrame:
         """
         Parse log file and extract structured data
         
         Args:
             file_path: Path to the log file
+            workers: Worker processes for large files; defaults to the CPU count
             
         Returns:
             pd.DataFrame: Parsed log data
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
-            
-            parsed_data = []
+            workers = workers or os.cpu_count() or 1
+            if workers > 1 and os.path.getsize(file_path) >= PARALLEL_PARSE_MIN_BYTES:
+                df = self._parse_log_file_parallel(file_path, workers)
+            else:
+                chunks = list(self.parse_log_file_chunks(file_path))
+                if len(chunks) == 1:
+                    df = chunks[0]
+                elif chunks:
+                    df = pd.concat(chunks, ignore_index=True)
+                else:
+                    df = self._parse_lines(pd.Series([], dtype=object))
             
-            for line_num, line in enumerate(lines, 1):
-                parsed_line = self._parse_line(line.strip(), line_num)
-                if parsed_line:
-                    parsed_data.append(parsed_line)
+            df['message'] = self._encode_messages(df['message'])
             
-            df = pd.DataFrame(parsed_data)
             logger.info(f"Successfully parsed {len(df)} log entries from {file_path}")
             return df
             
@@ -56,81 +83,158 @@ class LogAnalyzer:
             logger.error(f"Error parsing log file {file_path}: {str(e)}")
             raise
     
-    def _parse_line(self, line: str, line_num: int) -> Optional[Dict]:
+    def _encode_messages(self, messages: pd.Series) -> pd.Series:
         """
-        Parse individual log line
+        Dictionary-encode repetitive log messages
         
         Args:
-            line: Log line to parse
-            line_num: Line number for reference
+            messages: Message column of the parsed log data
             
         Returns:
-            Dict: Parsed log entry or None if parsing fails
+            pd.Series: Categorical messages when duplicates dominate, otherwise unchanged
         """
-        try:
-            parsed = {
-                'line_number': line_num,
-                'raw_line': line,
-                'timestamp': None,
-                'log_level': None,
-                'message': line,
-                'response_time': None,
-                'status_code': None,
-                'request_id': None,
-                'endpoint': None,
-                'ip_address': None
-            }
-            
-            # Extract timestamp
-            timestamp_match = re.search(self.log_patterns['timestamp'], line)
-            if timestamp_match:
-                parsed['timestamp'] = timestamp_match.group(1)
-            
-            # Extract log level
-            if re.search(self.log_patterns['error'], line, re.IGNORECASE):
-                parsed['log_level'] = 'ERROR'
-            elif re.search(self.log_patterns['warning'], line, re.IGNORECASE):
-                parsed['log_level'] = 'WARN'
-            else:
-                parsed['log_level'] = 'INFO'
-            
-            # Extract response time
-            response_time_match = re.search(self.log_patterns['response_time'], line)
-            if response_time_match:
-                parsed['response_time'] = float(response_time_match.group(1))
-            
-            # Extract status code
-            status_match = re.search(self.log_patterns['status_code'], line)
-            if status_match:
-                parsed['status_code'] = int(status_match.group(1))
-            
-            # Extract request ID
-            request_id_match = re.search(self.log_patterns['request_id'], line)
-            if request_id_match:
-                parsed['request_id'] = request_id_match.group(1)
+        codes, uniques = pd.factorize(messages)
+        if len(messages) == 0 or len(uniques) > MESSAGE_CATEGORY_MAX_RATIO * len(messages):
+            return messages
+        
+        # Reuse the factorize pass instead of hashing again in astype('category')
+        return pd.Series(
+            pd.Categorical.from_codes(codes, categories=uniques),
+            index=messages.index, name=messages.name
+        )
+    
+    def _parse_log_file_parallel(self, file_path: str, workers: int) -> pd.DataFrame:
+        """
+        Parse a log file in byte ranges spread across worker processes
+        
+        Args:
+            file_path: Path to the log file
+            workers: Number of worker processes
             
-            # Extract endpoint
-            endpoint_match = re.search(self.log_patterns['endpoint'], line)
-            if endpoint_match:
-                parsed['endpoint'] = endpoint_match.group(2)
+        Returns:
+            pd.DataFrame: Parsed log data
+        """
+        ranges = _split_byte_ranges(file_path, workers)
+        if not ranges:
+            return self._parse_lines(pd.Series([], dtype=object))
+        starts = [start for start, _ in ranges]
+        ends = [end for _, end in ranges]
+        
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            frames = list(executor.map(
+                _parse_byte_range, repeat(self.log_patterns), repeat(file_path), starts, ends
+            ))
+        
+        # Workers number their lines from 1; shift each range after the previous one
+        first_line = 1
+        for frame in frames:
+            frame['line_number'] += first_line - 1
+            first_line += len(frame)
+        
+        return pd.concat(frames, ignore_index=True)
+    
+    def parse_log_file_chunks(self, file_path: str, chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+        """
+        Parse log file in fixed-size batches of lines
+        
+        Only one batch of raw lines is held in memory at a time, so callers that
+        fold aggregates across chunks can process files larger than RAM.
+        
+        Args:
+            file_path: Path to the log file
+            chunksize: Number of lines per yielded DataFrame
             
-            # Extract IP address
-            ip_match = re.search(self.log_patterns['ip_address'], line)
-            if ip_match:
-                parsed['ip_address'] = ip_match.group(1)
+        Yields:
+            pd.DataFrame: Parsed log data for each batch of lines
+        """
+        with open(file_path, 'r', encoding='utf-8') as file:
+            first_line = 1
+            while True:
+                lines = list(islice(file, chunksize))
+                if not lines:
+                    break
+                yield self._parse_lines(pd.Series(lines).str.strip(), first_line)
+                first_line += len(lines)
+    
+    def _parse_lines(self, lines: pd.Series, first_line: int = 1) -> pd.DataFrame:
+        """
+        Parse a batch of log lines using vectorized regex extraction
+        
+        Args:
+            lines: Stripped log lines
+            first_line: Line number of the first line in the batch
             
-            return parsed
+        Returns:
+            pd.DataFrame: Parsed log entries, one row per line
+        
+        Each field is extracted as its own column array and the frame is built
+        from those arrays without copying, rather than from per-line records.
+        """
+        patterns = self._compiled
+        
+        # Extract log level
+        is_error = lines.str.extract(patterns['error'], expand=False).notna().to_numpy()
+        is_warning = lines.str.extract(patterns['warning'], expand=False).notna().to_numpy()
+        log_level = np.where(is_error, 'ERROR', np.where(is_warning, 'WARN', 'INFO'))
+        
+        return pd.DataFrame({
+            'line_number': np.arange(first_line, first_line + len(lines)),
+            'raw_line': lines,
+            'timestamp': lines.str.extract(patterns['timestamp'], expand=False),
+            'log_level': log_level,
+            'message': lines,
+            'response_time': pd.to_numeric(
+                lines.str.extract(patterns['response_time'], expand=False), errors='coerce'
+            ),
+            'status_code': pd.to_numeric(
+                lines.str.extract(patterns['status_code'], expand=False),
+                errors='coerce', downcast='integer'
+            ),
+            'request_id': lines.str.extract(patterns['request_id'], expand=False),
+            'endpoint': lines.str.extract(patterns['endpoint'], expand=True)[1],
+            'ip_address': lines.str.extract(patterns['ip_address'], expand=False)
+        }, copy=False)
+    
+    def compute_summary_stats(self, df: pd.DataFrame) -> Dict:
+        """
+        Compute column statistics shared by the error and summary analyses
+        
+        Compute them once and pass the result to analyze_error_patterns and
+        generate_log_summary so the frame is scanned only once.
+        
+        Args:
+            df: Parsed log DataFrame
             
-        except Exception as e:
-            logger.warning(f"Failed to parse line {line_num}: {str(e)}")
-            return None
+        Returns:
+            Dict: Level counts, error messages, missing values and parsed timestamps
+        """
+        if 'log_level' in df.columns:
+            level_counts = df['log_level'].value_counts()
+            error_messages = df['message'].to_numpy()[(df['log_level'] == 'ERROR').to_numpy()]
+        else:
+            level_counts = pd.Series(dtype='int64')
+            error_messages = np.empty(0, dtype=object)
+        
+        timestamps = None
+        if 'timestamp' in df.columns:
+            timestamps = pd.to_datetime(
+                df['timestamp'], format=TIMESTAMP_FORMAT, errors='coerce', cache=True
+            ).dropna()
+        
+        return {
+            'level_counts': level_counts,
+            'error_messages': error_messages,
+            'missing_values': df.isnull().sum(),
+            'timestamps': timestamps
+        }
     
-    def analyze_error_patterns(self, df: pd.DataFrame) -> Dict:
+    def analyze_error_patterns(self, df: pd.DataFrame, stats: Optional[Dict] = None) -> Dict:
         """
         Analyze error patterns in log data
         
         Args:
             df: Parsed log DataFrame
+            stats: Result of compute_summary_stats(df); computed when omitted
             
         Returns:
             Dict: Error analysis results
@@ -138,10 +242,14 @@ class LogAnalyzer:
         if df.empty:
             return {}
         
+        if stats is None:
+            stats = self.compute_summary_stats(df)
+        level_counts = stats['level_counts']
+        
         error_analysis = {
             'total_entries': len(df),
-            'error_count': len(df[df['log_level'] == 'ERROR']),
-            'warning_count': len(df[df['log_level'] == 'WARN']),
+            'error_count': int(level_counts.get('ERROR', 0)),
+            'warning_count': int(level_counts.get('WARN', 0)),
             'error_rate': 0.0,
             'top_errors': [],
             'error_timeline': [],
@@ -155,10 +263,10 @@ class LogAnalyzer:
             )
         
         # Top error messages
-        error_messages = df[df['log_level'] == 'ERROR']['message'].value_counts().head(10)
+        error_messages = Counter(stats['error_messages']).most_common(10)
         error_analysis['top_errors'] = [
             {'message': msg, 'count': count} 
-            for msg, count in error_messages.items()
+            for msg, count in error_messages
         ]
         
         # Status code distribution
@@ -204,10 +312,15 @@ class LogAnalyzer:
                 }
         
         # Endpoint performance
-        if 'endpoint' in df.columns:
-            endpoint_stats = df.groupby('endpoint')['response_time'].agg([
-                'count', 'mean', 'min', 'max', 'std'
-            ]).round(2)
+        if 'endpoint' in df.columns and 'response_time' in df.columns:
+            # Group on categorical codes and aggregate everything in one pass
+            endpoints = df['endpoint'].astype('category')
+            stats = grouped_stats(
+                endpoints.cat.codes.to_numpy(),
+                df['response_time'].to_numpy(dtype=np.float64),
+                len(endpoints.cat.categories)
+            )
+            endpoint_stats = pd.DataFrame(stats, index=endpoints.cat.categories).round(2)
             performance_analysis['endpoint_performance'] = endpoint_stats.to_dict('index')
         
         return performance_analysis
@@ -232,34 +345,35 @@ class LogAnalyzer:
         if data.empty:
             return []
         
-        mean = data.mean()
-        std = data.std()
-        
-        if std == 0:
-            return []
-        
         # Detect outliers using z-score
-        z_scores = abs((data - mean) / std)
-        anomalies = data[z_scores > threshold]
+        positions, z_scores = zscore_outliers(data.to_numpy(dtype=np.float64), threshold)
+        values = data.to_numpy()[positions]
+        
+        # Map back to row positions and read columns directly, not row by row
+        rows = np.flatnonzero(df[column].notna().to_numpy())[positions]
+        line_numbers = df['line_number'].to_numpy()
+        timestamps = df['timestamp'].array if 'timestamp' in df.columns else None
+        messages = df['message'].array if 'message' in df.columns else None
         
         anomaly_list = []
-        for idx, value in anomalies.items():
+        for row, value, z_score in zip(rows, values, z_scores):
             anomaly_list.append({
-                'line_number': int(df.iloc[idx]['line_number']),
+                'line_number': int(line_numbers[row]),
                 'value': float(value),
-                'z_score': float(z_scores[idx]),
-                'timestamp': df.iloc[idx].get('timestamp'),
-                'message': df.iloc[idx].get('message', '')
+                'z_score': float(z_score),
+                'timestamp': timestamps[row] if timestamps is not None else None,
+                'message': messages[row] if messages is not None else ''
             })
         
         return anomaly_list
     
-    def generate_log_summary(self, df: pd.DataFrame) -> Dict:
+    def generate_log_summary(self, df: pd.DataFrame, stats: Optional[Dict] = None) -> Dict:
         """
         Generate comprehensive log summary
         
         Args:
             df: Parsed log DataFrame
+            stats: Result of compute_summary_stats(df); computed when omitted
             
         Returns:
             Dict: Log summary
@@ -276,20 +390,21 @@ class LogAnalyzer:
             'data_quality': {}
         }
         
+        if stats is None:
+            stats = self.compute_summary_stats(df)
+        
         # Time range
-        if 'timestamp' in df.columns:
-            timestamps = pd.to_datetime(df['timestamp'], errors='coerce').dropna()
-            if not timestamps.empty:
-                summary['time_range'] = {
-                    'start': timestamps.min().isoformat(),
-                    'end': timestamps.max().isoformat(),
-                    'duration_hours': (timestamps.max() - timestamps.min()).total_seconds() / 3600
-                }
+        timestamps = stats['timestamps']
+        if timestamps is not None and not timestamps.empty:
+            summary['time_range'] = {
+                'start': timestamps.min().isoformat(),
+                'end': timestamps.max().isoformat(),
+                'duration_hours': (timestamps.max() - timestamps.min()).total_seconds() / 3600
+            }
         
         # Log level distribution
         if 'log_level' in df.columns:
-            level_counts = df['log_level'].value_counts()
-            summary['log_level_distribution'] = level_counts.to_dict()
+            summary['log_level_distribution'] = stats['level_counts'].to_dict()
         
         # Unique counts
         if 'endpoint' in df.columns:
@@ -299,10 +414,59 @@ class LogAnalyzer:
             summary['unique_ips'] = df['ip_address'].nunique()
         
         # Data quality
-        missing_data = df.isnull().sum()
+        missing_data = stats['missing_values']
         summary['data_quality'] = {
             'missing_values': missing_data.to_dict(),
             'completeness_rate': (1 - missing_data.sum() / (len(df) * len(df.columns))) * 100
         }
         
-        return summary
\ No newline at end of file
+        return summary
+
+
+def _split_byte_ranges(file_path: str, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split a file into up to `parts` byte ranges that each start on a line boundary
+    
+    Args:
+        file_path: Path to the file
+        parts: Desired number of ranges
+        
+    Returns:
+        List[Tuple[int, int]]: Non-empty (start, end) byte offsets
+    """
+    size = os.path.getsize(file_path)
+    boundaries = [0]
+    with open(file_path, 'rb') as file:
+        for i in range(1, parts):
+            file.seek(max(size * i // parts, boundaries[-1]))
+            file.readline()
+            boundaries.append(file.tell())
+    boundaries.append(size)
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def _parse_byte_range(log_patterns: Dict, file_path: str, start: int, end: int) -> pd.DataFrame:
+    """
+    Parse the lines in one byte range of a log file (process pool worker)
+    
+    Args:
+        log_patterns: Patterns of the calling LogAnalyzer
+        file_path: Path to the log file
+        start: Offset of the first byte of the range
+        end: Offset one past the last byte of the range
+        
+    Returns:
+        pd.DataFrame: Parsed log data, line numbers starting at 1
+    """
+    analyzer = LogAnalyzer()
+    if log_patterns != analyzer.log_patterns:
+        analyzer.log_patterns = log_patterns
+        analyzer._compile_patterns()
+    
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    
+    # Decode with universal newlines to split lines exactly like text-mode reads
+    lines = io.StringIO(data.decode('utf-8'), newline=None).readlines()
+    return analyzer._parse_lines(pd.Series(lines).str.strip())
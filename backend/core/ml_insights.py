@@ -5,22 +5,52 @@ Machine learning-powered insights for performance testing
 
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
+from pandas.api.types import is_bool_dtype, is_numeric_dtype, is_object_dtype, is_string_dtype
+from sklearn.ensemble import RandomForestRegressor, HistGradientBoostingRegressor
+from sklearn.inspection import permutation_importance
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error, r2_score
-from sklearn.preprocessing import LabelEncoder
 from typing import Dict, List, Tuple, Optional
 import logging
+import warnings
+
+from backend.core.timestamps import parse_timestamps
 
 logger = logging.getLogger(__name__)
 
+# Optional ONNX Runtime inference for the trained forests
+try:
+    import onnxruntime
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+# Optional GPU forest inference (cuML FIL) for the random forest
+try:
+    import cupy
+    from cuml import ForestInference
+    CUML_AVAILABLE = True
+except ImportError:
+    CUML_AVAILABLE = False
+
+# Categorical columns with more distinct values than this are hash-encoded
+HASH_ENCODING_MIN_CARDINALITY = 1000
+HASH_ENCODING_BUCKETS = 1 << 20
+
 class MLInsights:
     """Machine learning insights for performance analysis"""
     
     def __init__(self):
-        self.response_time_model = RandomForestRegressor(n_estimators=100, random_state=42)
-        self.throughput_model = GradientBoostingRegressor(n_estimators=100, random_state=42)
+        self.response_time_model = RandomForestRegressor(n_estimators=100, n_jobs=-1, random_state=42)
+        self.throughput_model = HistGradientBoostingRegressor(max_iter=100, random_state=42)
         self.label_encoders = {}
+        self.inference_sessions = {}
+        self.feature_columns = {}
+        self.training_medians = {}
+        self._throughput_holdout = None
+        self._throughput_importance = None
         self.is_trained = False
         
     def prepare_features(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -36,39 +66,87 @@ class MLInsights:
         if df.empty:
             return pd.DataFrame()
             
-        features_df = df.copy()
+        # Shallow copy: columns are replaced below, never modified in place
+        features_df = df.copy(deep=False)
         
         # Handle timestamp features
         if 'timestamp' in features_df.columns:
-            features_df['timestamp'] = pd.to_datetime(features_df['timestamp'], errors='coerce')
+            features_df['timestamp'] = parse_timestamps(df['timestamp'])
             features_df['hour'] = features_df['timestamp'].dt.hour
             features_df['day_of_week'] = features_df['timestamp'].dt.dayofweek
             features_df['minute'] = features_df['timestamp'].dt.minute
             features_df.drop('timestamp', axis=1, inplace=True)
         
+        # Split columns by dtype in a single pass; encoded columns become numeric
+        categorical_cols = []
+        numeric_cols = []
+        for col, dtype in features_df.dtypes.items():
+            if is_object_dtype(dtype) or is_string_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+                categorical_cols.append(col)
+                numeric_cols.append(col)
+            elif is_numeric_dtype(dtype) and not is_bool_dtype(dtype):
+                numeric_cols.append(col)
+        
         # Encode categorical variables
-        categorical_cols = features_df.select_dtypes(include=['object']).columns
         for col in categorical_cols:
+            values = features_df[col].astype(str)
             if col not in self.label_encoders:
-                self.label_encoders[col] = LabelEncoder()
-                features_df[col] = self.label_encoders[col].fit_transform(features_df[col].astype(str))
+                if values.nunique(dropna=False) > HASH_ENCODING_MIN_CARDINALITY:
+                    # High-cardinality columns are hashed; None marks them in label_encoders
+                    self.label_encoders[col] = None
+                    features_df[col] = self._hash_encode(values)
+                    continue
+                
+                # Sorted categories give the same codes LabelEncoder would
+                categorical = values.astype('category')
+                categories = categorical.cat.categories
+                codes = categorical.cat.codes.to_numpy(dtype=np.int32)
+                # Missing values form their own class, sorted after all others
+                missing = codes == -1
+                if missing.any():
+                    categories = categories.append(pd.Index([np.nan], dtype=categories.dtype))
+                    codes[missing] = len(categories) - 1
+                self.label_encoders[col] = categories
+                features_df[col] = codes
+            elif self.label_encoders[col] is None:
+                features_df[col] = self._hash_encode(values)
             else:
-                # Handle unseen categories
-                try:
-                    features_df[col] = self.label_encoders[col].transform(features_df[col].astype(str))
-                except ValueError:
-                    # For unseen categories, assign -1
-                    features_df[col] = features_df[col].apply(
-                        lambda x: self.label_encoders[col].transform([str(x)])[0] 
-                        if str(x) in self.label_encoders[col].classes_ else -1
-                    )
-        
-        # Fill missing values
-        numeric_cols = features_df.select_dtypes(include=[np.number]).columns
-        features_df[numeric_cols] = features_df[numeric_cols].fillna(features_df[numeric_cols].median())
+                # Hash lookup against the known categories; unseen ones are assigned -1
+                features_df[col] = self.label_encoders[col].get_indexer(values).astype('int32')
+        
+        # Fill missing values with column medians, touching only columns that have gaps
+        if numeric_cols:
+            values = features_df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+            missing = np.isnan(values)
+            gap_cols = np.flatnonzero(missing.any(axis=0))
+            if gap_cols.size > 0:
+                gaps = values[:, gap_cols]
+                with warnings.catch_warnings():
+                    # All-NaN columns keep their NaNs, as with DataFrame.median
+                    warnings.simplefilter('ignore', RuntimeWarning)
+                    medians = np.nanmedian(gaps, axis=0)
+                rows, cols = np.nonzero(missing[:, gap_cols])
+                gaps[rows, cols] = medians[cols]
+                features_df[[numeric_cols[i] for i in gap_cols]] = gaps
         
         return features_df
     
+    def _hash_encode(self, values: pd.Series) -> np.ndarray:
+        """
+        Encode a high-cardinality column by hashing its values into fixed buckets
+        
+        Tree models only need stable codes with rare collisions, so no
+        vocabulary has to be built or stored.
+        
+        Args:
+            values: Column values as strings
+            
+        Returns:
+            np.ndarray: int32 bucket per value
+        """
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        return (hashes % HASH_ENCODING_BUCKETS).astype(np.int32)
+    
     def train_models(self, df: pd.DataFrame) -> Dict:
         """
         Train ML models for predictions
@@ -77,7 +155,9 @@ class MLInsights:
             df: Training data
             
         Returns:
-            Dict: Training results
+            Dict: Training results. feature_importance['throughput'] is None
+                when a throughput model was trained; its importances are
+                computed on request by throughput_feature_importance()
         """
         if df.empty:
             return {'error': 'No data provided for training'}
@@ -88,6 +168,9 @@ class MLInsights:
         if len(features_df) < 50:
             return {'error': 'Insufficient data for training (minimum 50 records required)'}
         
+        # Medians of the prepared features fill gaps in prediction scenarios
+        self.training_medians = features_df.median(numeric_only=True).to_dict()
+        
         training_results = {
             'response_time_model': {},
             'throughput_model': {},
@@ -100,12 +183,13 @@ class MLInsights:
             feature_cols = [col for col in features_df.columns if col != target_col]
             
             if len(feature_cols) > 0:
-                X = features_df[feature_cols]
+                X = features_df[feature_cols].astype(np.float32)
                 y = features_df[target_col]
                 
                 X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
                 
                 self.response_time_model.fit(X_train, y_train)
+                self.feature_columns['response_time'] = feature_cols
                 y_pred = self.response_time_model.predict(X_test)
                 
                 training_results['response_time_model'] = {
@@ -125,12 +209,13 @@ class MLInsights:
             feature_cols = [col for col in features_df.columns if col != target_col and col != 'response_time']
             
             if len(feature_cols) > 0:
-                X = features_df[feature_cols]
+                X = features_df[feature_cols].astype(np.float32)
                 y = features_df[target_col]
                 
                 X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
                 
                 self.throughput_model.fit(X_train, y_train)
+                self.feature_columns['throughput'] = feature_cols
                 y_pred = self.throughput_model.predict(X_test)
                 
                 training_results['throughput_model'] = {
@@ -139,14 +224,139 @@ class MLInsights:
                     'feature_count': len(feature_cols)
                 }
                 
-                # Feature importance
-                importance = self.throughput_model.feature_importances_
-                feature_importance = dict(zip(feature_cols, importance))
-                training_results['feature_importance']['throughput'] = feature_importance
+                # Histogram boosting has no built-in importances; keep the held-out
+                # split so throughput_feature_importance can measure them on request
+                self._throughput_holdout = (X_test, y_test)
+                self._throughput_importance = None
+                training_results['feature_importance']['throughput'] = None
         
         self.is_trained = True
+        self._build_inference_sessions()
         return training_results
     
+    def throughput_feature_importance(self) -> Dict:
+        """
+        Feature importance of the throughput model
+        
+        Permutation importance on the held-out split of the last training run,
+        negative values clipped and the rest normalized to sum to 1. Computed
+        on the first call after training, as it re-scores the model several
+        times per feature.
+        
+        Returns:
+            Dict: Importance per feature, empty if no throughput model is trained
+        """
+        if self._throughput_holdout is None:
+            return {}
+        
+        if self._throughput_importance is None:
+            X_test, y_test = self._throughput_holdout
+            importance = permutation_importance(
+                self.throughput_model, X_test, y_test, n_repeats=5, random_state=42
+            ).importances_mean.clip(min=0)
+            if importance.sum() > 0:
+                importance = importance / importance.sum()
+            self._throughput_importance = dict(zip(self.feature_columns['throughput'], importance))
+        return self._throughput_importance
+    
+    def _build_inference_sessions(self):
+        """Load the trained models into cuML FIL or ONNX Runtime when available"""
+        self.inference_sessions = {}
+        
+        for name, model in (('response_time', self.response_time_model),
+                            ('throughput', self.throughput_model)):
+            if not hasattr(model, 'feature_names_in_'):
+                continue
+            
+            # GPU forest inference takes precedence for the random forest
+            if CUML_AVAILABLE and isinstance(model, RandomForestRegressor):
+                try:
+                    self.inference_sessions[name] = ForestInference.load_from_sklearn(
+                        model, output_class=False, storage_type='sparse'
+                    )
+                    continue
+                except Exception as e:
+                    logger.warning(f"cuML FIL load of {name} model failed: {e}")
+            
+            if not ONNX_AVAILABLE:
+                continue
+            try:
+                onnx_model = convert_sklearn(
+                    model, initial_types=[('X', FloatTensorType([None, model.n_features_in_]))]
+                )
+                self.inference_sessions[name] = onnxruntime.InferenceSession(
+                    onnx_model.SerializeToString(), providers=['CPUExecutionProvider']
+                )
+            except Exception as e:
+                logger.warning(f"ONNX conversion of {name} model failed, using scikit-learn: {e}")
+    
+    def _predict(self, name: str, model, features_df: pd.DataFrame) -> np.ndarray:
+        """
+        Predict with the FIL or ONNX session of a model, falling back to scikit-learn
+        
+        Args:
+            name: Model name ('response_time' or 'throughput')
+            model: Trained scikit-learn model
+            features_df: Prepared features
+            
+        Returns:
+            np.ndarray: One prediction per row
+        """
+        session = self.inference_sessions.get(name)
+        # Only take the fast path when the columns match the fitted ones exactly;
+        # scikit-learn reports any mismatch
+        if session is not None and list(features_df.columns) == list(model.feature_names_in_):
+            inputs = features_df.to_numpy(dtype=np.float32)
+            if CUML_AVAILABLE and isinstance(session, ForestInference):
+                return cupy.asnumpy(session.predict(cupy.asarray(inputs))).ravel()
+            return session.run(None, {'X': inputs})[0].ravel()
+        return model.predict(features_df.astype(np.float32))
+    
+    def _scenario_features(self, scenarios: List[Dict], name: str) -> pd.DataFrame:
+        """
+        Build the feature matrix of a trained model directly from scenario dicts
+        
+        Columns are encoded with the fitted encoders and gaps are filled with the
+        training medians, so no scenario DataFrame has to be featurized.
+        
+        Args:
+            scenarios: List of scenario dictionaries
+            name: Model name ('response_time' or 'throughput')
+            
+        Returns:
+            pd.DataFrame: float32 features in the model's training column order
+        """
+        if name not in self.feature_columns:
+            raise ValueError(f"The {name} model has not been trained")
+        
+        columns = self.feature_columns[name]
+        features = np.empty((len(scenarios), len(columns)), dtype=np.float32)
+        
+        timestamps = None
+        if any(col in ('hour', 'day_of_week', 'minute') for col in columns):
+            timestamps = parse_timestamps(pd.Series([s.get('timestamp') for s in scenarios]))
+        
+        for j, col in enumerate(columns):
+            if col in self.label_encoders:
+                values = pd.Series([s.get(col) for s in scenarios]).astype(str)
+                encoder = self.label_encoders[col]
+                features[:, j] = self._hash_encode(values) if encoder is None else encoder.get_indexer(values)
+                continue
+            
+            if col == 'hour' and timestamps is not None:
+                values = timestamps.dt.hour.to_numpy(dtype=np.float64, na_value=np.nan)
+            elif col == 'day_of_week' and timestamps is not None:
+                values = timestamps.dt.dayofweek.to_numpy(dtype=np.float64, na_value=np.nan)
+            elif col == 'minute' and timestamps is not None:
+                values = timestamps.dt.minute.to_numpy(dtype=np.float64, na_value=np.nan)
+            else:
+                values = np.array(
+                    [np.nan if s.get(col) is None else s.get(col) for s in scenarios], dtype=np.float64
+                )
+            features[:, j] = np.where(np.isnan(values), self.training_medians.get(col, np.nan), values)
+        
+        return pd.DataFrame(features, columns=columns, copy=False)
+    
     def predict_performance(self, scenarios: List[Dict]) -> Dict:
         """
         Predict performance for given scenarios
@@ -168,54 +378,45 @@ class MLInsights:
             'summary': {}
         }
         
-        # Convert scenarios to DataFrame
-        scenarios_df = pd.DataFrame(scenarios)
-        features_df = self.prepare_features(scenarios_df)
+        # Predict all scenarios in one batch per model
+        try:
+            features_df = self._scenario_features(scenarios, 'response_time')
+            rt_preds = self._predict('response_time', self.response_time_model, features_df)
+        except Exception as e:
+            rt_preds = None
+            logger.warning(f"Response time prediction failed: {e}")
+        
+        try:
+            features_df = self._scenario_features(scenarios, 'throughput')
+            tp_preds = self._predict('throughput', self.throughput_model, features_df)
+        except Exception as e:
+            tp_preds = None
+            logger.warning(f"Throughput prediction failed: {e}")
+        
+        # Convert to Python floats in one call per model
+        rt_values = rt_preds.tolist() if rt_preds is not None else [None] * len(scenarios)
+        tp_values = tp_preds.tolist() if tp_preds is not None else [None] * len(scenarios)
         
         for i, scenario in enumerate(scenarios):
             scenario_pred = {
                 'scenario_id': i,
                 'input': scenario,
-                'predictions': {}
+                'predictions': {
+                    'response_time': rt_values[i],
+                    'throughput': tp_values[i]
+                }
             }
             
-            # Predict response time
-            try:
-                rt_pred = self.response_time_model.predict(features_df.iloc[[i]])[0]
-                scenario_pred['predictions']['response_time'] = float(rt_pred)
-            except Exception as e:
-                scenario_pred['predictions']['response_time'] = None
-                logger.warning(f"Response time prediction failed: {e}")
-            
-            # Predict throughput
-            try:
-                tp_pred = self.throughput_model.predict(features_df.iloc[[i]])[0]
-                scenario_pred['predictions']['throughput'] = float(tp_pred)
-            except Exception as e:
-                scenario_pred['predictions']['throughput'] = None
-                logger.warning(f"Throughput prediction failed: {e}")
-            
             predictions['scenarios'].append(scenario_pred)
         
-        # Calculate summary statistics
-        response_times = [s['predictions']['response_time'] for s in predictions['scenarios'] 
-                         if s['predictions']['response_time'] is not None]
-        throughputs = [s['predictions']['throughput'] for s in predictions['scenarios'] 
-                      if s['predictions']['throughput'] is not None]
-        
-        if response_times:
-            predictions['summary']['response_time'] = {
-                'min': float(min(response_times)),
-                'max': float(max(response_times)),
-                'avg': float(np.mean(response_times))
-            }
-        
-        if throughputs:
-            predictions['summary']['throughput'] = {
-                'min': float(min(throughputs)),
-                'max': float(max(throughputs)),
-                'avg': float(np.mean(throughputs))
-            }
+        # Calculate summary statistics on the prediction arrays
+        for metric, preds in (('response_time', rt_preds), ('throughput', tp_preds)):
+            if preds is not None and preds.size > 0:
+                predictions['summary'][metric] = {
+                    'min': float(preds.min()),
+                    'max': float(preds.max()),
+                    'avg': float(preds.mean(dtype=np.float64))
+                }
         
         return predictions
     
@@ -239,9 +440,14 @@ class MLInsights:
             'recommendations': []
         }
         
+        # Correlations of every resource column with response time in one pass
+        corr_cols = [col for col in ('concurrent_users', 'memory_usage', 'cpu_usage', 'response_time')
+                     if col in df.columns]
+        corr_matrix = df[corr_cols].corr() if 'response_time' in corr_cols else None
+        
         # Analyze concurrent users vs performance
-        if 'concurrent_users' in df.columns and 'response_time' in df.columns:
-            correlation = df['concurrent_users'].corr(df['response_time'])
+        if corr_matrix is not None and 'concurrent_users' in corr_cols:
+            correlation = corr_matrix.at['concurrent_users', 'response_time']
             if correlation > 0.7:
                 bottlenecks['scaling_problems'].append({
                     'issue': 'Strong correlation between concurrent users and response time',
@@ -251,8 +457,8 @@ class MLInsights:
                 bottlenecks['recommendations'].append('Consider horizontal scaling or load balancing')
         
         # Analyze memory usage patterns
-        if 'memory_usage' in df.columns and 'response_time' in df.columns:
-            correlation = df['memory_usage'].corr(df['response_time'])
+        if corr_matrix is not None and 'memory_usage' in corr_cols:
+            correlation = corr_matrix.at['memory_usage', 'response_time']
             if correlation > 0.6:
                 bottlenecks['resource_constraints'].append({
                     'issue': 'Memory usage affecting response time',
@@ -262,8 +468,8 @@ class MLInsights:
                 bottlenecks['recommendations'].append('Optimize memory usage or increase memory allocation')
         
         # Analyze CPU patterns
-        if 'cpu_usage' in df.columns and 'response_time' in df.columns:
-            correlation = df['cpu_usage'].corr(df['response_time'])
+        if corr_matrix is not None and 'cpu_usage' in corr_cols:
+            correlation = corr_matrix.at['cpu_usage', 'response_time']
             if correlation > 0.6:
                 bottlenecks['resource_constraints'].append({
                     'issue': 'CPU usage affecting response time',
@@ -274,17 +480,34 @@ class MLInsights:
         
         # Analyze time-based patterns
         if 'timestamp' in df.columns and 'response_time' in df.columns:
-            df_time = df.copy()
-            df_time['timestamp'] = pd.to_datetime(df_time['timestamp'], errors='coerce')
-            df_time['hour'] = df_time['timestamp'].dt.hour
+            timestamps = parse_timestamps(df['timestamp'])
+            valid = timestamps.notna().to_numpy()
+            hours = timestamps.dt.hour.to_numpy()[valid].astype(np.int64)
+            response_times = df['response_time'].to_numpy(dtype=np.float64, na_value=np.nan)[valid]
+            
+            # Hourly mean response time from weighted bincounts over the 24 hours
+            observed = np.bincount(hours, minlength=24) > 0
+            has_rt = ~np.isnan(response_times)
+            counts = np.bincount(hours[has_rt], minlength=24)
+            sums = np.bincount(hours[has_rt], weights=response_times[has_rt], minlength=24)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                hourly_mean = np.where(counts > 0, sums / counts, np.nan)
             
-            hourly_stats = df_time.groupby('hour')['response_time'].agg(['mean', 'std'])
-            peak_hours = hourly_stats[hourly_stats['mean'] > hourly_stats['mean'].quantile(0.8)]
+            means = hourly_mean[observed & (counts > 0)]
+            peak_hours = []
+            if means.size > 0:
+                # 0.8 quantile (linear interpolation) from a partial sort of at most 24 means
+                position = 0.8 * (means.size - 1)
+                lower = int(position)
+                upper = min(lower + 1, means.size - 1)
+                partitioned = np.partition(means, (lower, upper))
+                threshold = partitioned[lower] + (position - lower) * (partitioned[upper] - partitioned[lower])
+                peak_hours = np.flatnonzero(observed & (hourly_mean > threshold)).tolist()
             
             if len(peak_hours) > 0:
                 bottlenecks['timing_issues'].append({
                     'issue': 'Performance degradation during peak hours',
-                    'peak_hours': peak_hours.index.tolist(),
+                    'peak_hours': peak_hours,
                     'severity': 'medium'
                 })
                 bottlenecks['recommendations'].append('Consider auto-scaling during peak hours')
@@ -6,21 +6,39 @@ Advanced performance analysis using Scikit-learn for ML insights
 import pandas as pd
 import numpy as np
 from sklearn.ensemble import IsolationForest
-from sklearn.preprocessing import StandardScaler
 from sklearn.cluster import KMeans
 from typing import Dict, List, Tuple, Optional
 import logging
 
+from backend.core.stats_kernels import trend_correlation
+from backend.core.timestamps import parse_timestamps
+
 logger = logging.getLogger(__name__)
 
 class PerformanceAnalyzer:
     """Advanced performance analysis with machine learning capabilities"""
     
     def __init__(self):
-        self.scaler = StandardScaler()
-        self.anomaly_detector = IsolationForest(contamination=0.1, random_state=42)
+        self.anomaly_detector = IsolationForest(contamination=0.1, n_jobs=-1, random_state=42)
         self.clusterer = KMeans(n_clusters=3, random_state=42)
         
+    def _standardize(self, values: np.ndarray) -> np.ndarray:
+        """
+        Standardize columns to zero mean and unit variance in place
+        
+        Args:
+            values: 2-D float array, modified in place
+            
+        Returns:
+            np.ndarray: The same array, standardized; constant columns are only centered
+        """
+        mean = values.mean(axis=0)
+        std = values.std(axis=0)
+        std[std == 0] = 1.0
+        values -= mean
+        values /= std
+        return values
+    
     def analyze_performance_trends(self, df: pd.DataFrame) -> Dict:
         """
         Analyze performance trends over time
@@ -44,26 +62,25 @@ class PerformanceAnalyzer:
         
         # Response time trend analysis
         if 'response_time' in df.columns and 'timestamp' in df.columns:
-            df_time = df.copy()
-            df_time['timestamp'] = pd.to_datetime(df_time['timestamp'], errors='coerce')
-            df_time = df_time.dropna(subset=['timestamp', 'response_time'])
+            timestamps = parse_timestamps(df['timestamp'])
+            valid = (timestamps.notna() & df['response_time'].notna()).to_numpy()
             
-            if not df_time.empty:
-                df_time = df_time.sort_values('timestamp')
-                df_time['hour'] = df_time['timestamp'].dt.hour
-                df_time['day_of_week'] = df_time['timestamp'].dt.dayofweek
+            if valid.any():
+                timestamps = timestamps[valid]
+                response_times = df['response_time'].to_numpy()[valid]
                 
                 # Hourly patterns
-                hourly_avg = df_time.groupby('hour')['response_time'].mean()
+                hourly_avg = pd.Series(response_times).groupby(timestamps.dt.hour.to_numpy()).mean()
                 trends['response_time_trend']['hourly_pattern'] = hourly_avg.to_dict()
                 
                 # Daily patterns
-                daily_avg = df_time.groupby('day_of_week')['response_time'].mean()
+                daily_avg = pd.Series(response_times).groupby(timestamps.dt.dayofweek.to_numpy()).mean()
                 trends['response_time_trend']['daily_pattern'] = daily_avg.to_dict()
                 
                 # Trend direction
-                if len(df_time) > 1:
-                    correlation = np.corrcoef(range(len(df_time)), df_time['response_time'])[0, 1]
+                if len(response_times) > 1:
+                    order = np.argsort(timestamps.to_numpy())
+                    correlation = trend_correlation(response_times[order])
                     trends['response_time_trend']['trend_direction'] = 'increasing' if correlation > 0.1 else 'decreasing' if correlation < -0.1 else 'stable'
         
         return trends
@@ -91,14 +108,11 @@ class PerformanceAnalyzer:
         if len(ml_data) < 10:  # Need minimum data for ML
             return {'error': 'Insufficient data for ML analysis'}
             
-        # Scale the data
-        scaled_data = self.scaler.fit_transform(ml_data)
-        
-        # Detect anomalies
-        anomaly_labels = self.anomaly_detector.fit_predict(scaled_data)
+        # Detect anomalies; isolation trees are scale-invariant, so no scaling needed
+        anomaly_labels = self.anomaly_detector.fit_predict(ml_data.to_numpy(dtype=np.float32))
         
         # Find anomalous records
-        anomalies = df[anomaly_labels == -1].copy()
+        anomalies = df[anomaly_labels == -1]
         
         results = {
             'total_records': len(df),
@@ -110,14 +124,11 @@ class PerformanceAnalyzer:
         
         # Analyze anomaly characteristics
         if not anomalies.empty:
-            for col in numeric_cols:
-                if col in anomalies.columns:
-                    results['anomaly_summary'][col] = {
-                        'mean': float(anomalies[col].mean()),
-                        'std': float(anomalies[col].std()),
-                        'min': float(anomalies[col].min()),
-                        'max': float(anomalies[col].max())
-                    }
+            stats = anomalies[numeric_cols].agg(['mean', 'std', 'min', 'max'])
+            results['anomaly_summary'] = {
+                col: {stat: float(stats.at[stat, col]) for stat in ('mean', 'std', 'min', 'max')}
+                for col in numeric_cols
+            }
         
         return results
     
@@ -144,36 +155,35 @@ class PerformanceAnalyzer:
             return {'error': 'Insufficient data for clustering'}
             
         # Scale and cluster
-        scaled_data = self.scaler.fit_transform(ml_data)
+        scaled_data = self._standardize(ml_data.to_numpy(dtype=np.float32, copy=True))
         cluster_labels = self.clusterer.fit_predict(scaled_data)
         
-        # Analyze clusters
-        df_clustered = df.copy()
-        df_clustered['cluster'] = cluster_labels
+        # Analyze clusters: sizes and per-column statistics for all clusters at once
+        n_clusters = self.clusterer.n_clusters
+        sizes = np.bincount(cluster_labels, minlength=n_clusters)
+        stats = df[numeric_cols].groupby(cluster_labels).agg(['mean', 'std'])
+        stats = stats.reindex(range(n_clusters))
         
         cluster_analysis = {
-            'n_clusters': self.clusterer.n_clusters,
+            'n_clusters': n_clusters,
             'cluster_summary': {},
             'cluster_characteristics': {}
         }
         
-        for cluster_id in range(self.clusterer.n_clusters):
-            cluster_data = df_clustered[df_clustered['cluster'] == cluster_id]
-            
+        for cluster_id in range(n_clusters):
             cluster_analysis['cluster_summary'][f'cluster_{cluster_id}'] = {
-                'size': len(cluster_data),
-                'percentage': (len(cluster_data) / len(df)) * 100
+                'size': int(sizes[cluster_id]),
+                'percentage': float(sizes[cluster_id] / len(df)) * 100
             }
             
             # Analyze cluster characteristics
-            cluster_chars = {}
-            for col in numeric_cols:
-                if col in cluster_data.columns:
-                    cluster_chars[col] = {
-                        'mean': float(cluster_data[col].mean()),
-                        'std': float(cluster_data[col].std())
-                    }
-            cluster_analysis['cluster_characteristics'][f'cluster_{cluster_id}'] = cluster_chars
+            cluster_analysis['cluster_characteristics'][f'cluster_{cluster_id}'] = {
+                col: {
+                    'mean': float(stats.at[cluster_id, (col, 'mean')]),
+                    'std': float(stats.at[cluster_id, (col, 'std')])
+                }
+                for col in numeric_cols
+            }
         
         return cluster_analysis
     
@@ -190,12 +200,12 @@ class PerformanceAnalyzer:
         if df.empty or 'timestamp' not in df.columns:
             return {}
             
-        # Prepare time series data
-        df_ts = df.copy()
-        df_ts['timestamp'] = pd.to_datetime(df_ts['timestamp'], errors='coerce')
-        df_ts = df_ts.dropna(subset=['timestamp']).sort_values('timestamp')
+        # Prepare time series data: row positions with a timestamp, in time order
+        timestamps = parse_timestamps(df['timestamp'])
+        valid = np.flatnonzero(timestamps.notna().to_numpy())
+        order = valid[np.argsort(timestamps.to_numpy()[valid])]
         
-        if len(df_ts) < 20:  # Need sufficient history
+        if len(order) < 20:  # Need sufficient history
             return {'error': 'Insufficient historical data for prediction'}
             
         predictions = {
@@ -205,12 +215,11 @@ class PerformanceAnalyzer:
         }
         
         # Analyze response time trends
-        if 'response_time' in df_ts.columns:
-            rt_data = df_ts['response_time'].dropna()
+        if 'response_time' in df.columns:
+            rt_data = df['response_time'].iloc[order].dropna()
             if len(rt_data) > 10:
                 # Simple trend analysis
-                x = np.arange(len(rt_data))
-                correlation = np.corrcoef(x, rt_data)[0, 1]
+                correlation = trend_correlation(rt_data.to_numpy())
                 
                 predictions['trend_analysis']['response_time'] = {
                     'trend_strength': abs(correlation),
@@ -225,11 +234,10 @@ class PerformanceAnalyzer:
                     predictions['recommendations'].append("Response time shows slight increase. Monitor closely.")
         
         # Analyze error rate trends
-        if 'error_rate' in df_ts.columns:
-            error_data = df_ts['error_rate'].dropna()
+        if 'error_rate' in df.columns:
+            error_data = df['error_rate'].iloc[order].dropna()
             if len(error_data) > 10:
-                x = np.arange(len(error_data))
-                correlation = np.corrcoef(x, error_data)[0, 1]
+                correlation = trend_correlation(error_data.to_numpy())
                 
                 predictions['trend_analysis']['error_rate'] = {
                     'trend_strength': abs(correlation),
@@ -0,0 +1,264 @@
+"""
+Statistics Kernels Module
+Fused numeric kernels shared by the analysis modules, JIT-compiled with Numba when available
+"""
+
+import math
+import numpy as np
+from typing import Dict, Tuple
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _zscore_outliers_jit(values: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+        n = values.shape[0]
+
+        total = 0.0
+        for i in prange(n):
+            total += values[i]
+        mean = total / n
+
+        # Second pass over deviations keeps the variance numerically stable
+        squared = 0.0
+        for i in prange(n):
+            d = values[i] - mean
+            squared += d * d
+        std = math.sqrt(squared / (n - 1))
+
+        if std == 0.0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        count = 0
+        for i in range(n):
+            if abs(values[i] - mean) / std > threshold:
+                count += 1
+
+        positions = np.empty(count, dtype=np.int64)
+        z_scores = np.empty(count, dtype=np.float64)
+        j = 0
+        for i in range(n):
+            z = abs(values[i] - mean) / std
+            if z > threshold:
+                positions[j] = i
+                z_scores[j] = z
+                j += 1
+
+        return positions, z_scores
+
+
+def zscore_outliers(values: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find values whose absolute z-score exceeds a threshold
+
+    Mean, sample standard deviation and z-scores are computed in one fused
+    kernel, so no full-size intermediate array is allocated.
+
+    Args:
+        values: 1-D array of observations without NaNs
+        threshold: Standard deviation threshold
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Positions of the outliers and their z-scores
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    if values.shape[0] < 2:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+    if NUMBA_AVAILABLE:
+        return _zscore_outliers_jit(values, float(threshold))
+
+    mean = values.mean()
+    std = values.std(ddof=1)
+    if std == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+    z_scores = np.abs(values - mean) / std
+    positions = np.flatnonzero(z_scores > threshold)
+    return positions, z_scores[positions]
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _summary_stats_jit(values: np.ndarray) -> Tuple[float, float, float, float]:
+        minimum = values[0]
+        maximum = values[0]
+        mean = 0.0
+        m2 = 0.0
+
+        # Welford update: min, max, mean and variance in one pass over memory
+        for i in range(values.shape[0]):
+            x = values[i]
+            if x < minimum:
+                minimum = x
+            if x > maximum:
+                maximum = x
+            d = x - mean
+            mean += d / (i + 1)
+            m2 += d * (x - mean)
+
+        n = values.shape[0]
+        std = math.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+        return minimum, maximum, mean, std
+
+
+def summary_stats(values: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Compute min, max, mean and sample std of an array in a single pass
+
+    Args:
+        values: Non-empty 1-D array of observations without NaNs
+
+    Returns:
+        Tuple[float, float, float, float]: Minimum, maximum, mean and sample std
+            (NaN when fewer than two observations)
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+
+    if NUMBA_AVAILABLE:
+        minimum, maximum, mean, std = _summary_stats_jit(values)
+        return float(minimum), float(maximum), float(mean), float(std)
+
+    std = values.std(ddof=1) if values.shape[0] > 1 else np.nan
+    return float(values.min()), float(values.max()), float(values.mean()), float(std)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _grouped_moments_jit(codes: np.ndarray, values: np.ndarray, n_groups: int):
+        count = np.zeros(n_groups, dtype=np.int64)
+        mean = np.zeros(n_groups, dtype=np.float64)
+        m2 = np.zeros(n_groups, dtype=np.float64)
+        minimum = np.full(n_groups, np.inf)
+        maximum = np.full(n_groups, -np.inf)
+
+        # Welford update per group keeps the variance stable in one pass
+        for i in range(codes.shape[0]):
+            g = codes[i]
+            x = values[i]
+            if g < 0 or np.isnan(x):
+                continue
+            count[g] += 1
+            d = x - mean[g]
+            mean[g] += d / count[g]
+            m2[g] += d * (x - mean[g])
+            if x < minimum[g]:
+                minimum[g] = x
+            if x > maximum[g]:
+                maximum[g] = x
+
+        return count, mean, m2, minimum, maximum
+
+
+def _grouped_moments_numpy(codes: np.ndarray, values: np.ndarray, n_groups: int):
+    valid = (codes >= 0) & ~np.isnan(values)
+    codes = codes[valid]
+    values = values[valid]
+
+    count = np.bincount(codes, minlength=n_groups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.bincount(codes, weights=values, minlength=n_groups) / count
+    deviations = values - mean[codes]
+    m2 = np.bincount(codes, weights=deviations * deviations, minlength=n_groups)
+
+    minimum = np.full(n_groups, np.inf)
+    maximum = np.full(n_groups, -np.inf)
+    np.minimum.at(minimum, codes, values)
+    np.maximum.at(maximum, codes, values)
+
+    return count, mean, m2, minimum, maximum
+
+
+def grouped_stats(codes: np.ndarray, values: np.ndarray, n_groups: int) -> Dict[str, np.ndarray]:
+    """
+    Compute count, mean, min, max and sample std per group in a single pass
+
+    NaN values and negative codes (missing group keys) are skipped, matching
+    pandas groupby aggregation semantics.
+
+    Args:
+        codes: Integer group code per observation, e.g. categorical codes
+        values: Observations aligned with codes
+        n_groups: Number of groups
+
+    Returns:
+        Dict[str, np.ndarray]: Arrays keyed by 'count', 'mean', 'min', 'max', 'std'
+    """
+    codes = np.ascontiguousarray(codes, dtype=np.int64)
+    values = np.ascontiguousarray(values, dtype=np.float64)
+
+    if NUMBA_AVAILABLE:
+        count, mean, m2, minimum, maximum = _grouped_moments_jit(codes, values, n_groups)
+    else:
+        count, mean, m2, minimum, maximum = _grouped_moments_numpy(codes, values, n_groups)
+
+    empty = count == 0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        std = np.where(count > 1, np.sqrt(m2 / (count - 1)), np.nan)
+
+    return {
+        'count': count,
+        'mean': np.where(empty, np.nan, mean),
+        'min': np.where(empty, np.nan, minimum),
+        'max': np.where(empty, np.nan, maximum),
+        'std': std
+    }
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _trend_correlation_jit(values: np.ndarray) -> float:
+        mean_x = 0.0
+        mean_y = 0.0
+        m2_x = 0.0
+        m2_y = 0.0
+        co_moment = 0.0
+
+        # Online co-moment update against x = 0..n-1, one pass and no x array
+        for i in range(values.shape[0]):
+            y = values[i]
+            dx = i - mean_x
+            dy = y - mean_y
+            mean_x += dx / (i + 1)
+            mean_y += dy / (i + 1)
+            m2_x += dx * (i - mean_x)
+            m2_y += dy * (y - mean_y)
+            co_moment += dx * (y - mean_y)
+
+        if m2_x == 0.0 or m2_y == 0.0:
+            return np.nan
+        return co_moment / math.sqrt(m2_x * m2_y)
+
+
+def trend_correlation(values: np.ndarray) -> float:
+    """
+    Pearson correlation of a series against its position (0, 1, ..., n-1)
+
+    Args:
+        values: 1-D array of observations in time order, without NaNs
+
+    Returns:
+        float: Correlation coefficient, NaN for constant or single-value series
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    if values.shape[0] < 2:
+        return float('nan')
+
+    if NUMBA_AVAILABLE:
+        return float(_trend_correlation_jit(values))
+
+    # Closed form: x = 0..n-1 has a known sum of squared deviations, n(n^2 - 1)/12,
+    # so only the centred y moments need computing
+    n = values.shape[0]
+    centred = values - values.mean()
+    ss_y = centred @ centred
+    if ss_y == 0:
+        return float('nan')
+    ss_x = n * (n * n - 1) / 12.0
+    co_moment = centred @ np.arange(n, dtype=np.float64)
+    return float(co_moment / math.sqrt(ss_x * ss_y))
@@ -0,0 +1,31 @@
+"""
+Timestamps Module
+Shared timestamp parsing for the analysis modules
+"""
+
+import pandas as pd
+
+# Timestamp layout of test tool output, the sample data generators and parsed log lines
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def parse_timestamps(values: pd.Series) -> pd.Series:
+    """
+    Parse a timestamp column, unparseable values becoming NaT
+
+    Columns in TIMESTAMP_FORMAT take pandas' fixed-format parser; anything
+    else falls back to format inference, as pd.to_datetime(errors='coerce').
+
+    Args:
+        values: Timestamp strings or datetimes
+
+    Returns:
+        pd.Series: datetime64 values aligned with the input
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+
+    try:
+        return pd.to_datetime(values, format=TIMESTAMP_FORMAT, cache=True)
+    except (ValueError, TypeError):
+        return pd.to_datetime(values, errors='coerce', cache=True)
@@ -0,0 +1,212 @@
+"""
+Async Database Module
+Non-blocking database access for server databases using SQLAlchemy's asyncio extension
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Optional, Dict, Any, Iterable, List
+import logging
+import os
+
+from sqlalchemy import insert, select
+from .models import TestRun, PerformanceMetric, LogEntry, Anomaly, Report
+from .database import (
+    BATCH_SIZE, _GET_TEST_RUN, _GET_TEST_RUNS_BY_STATUS, _GET_REPORTS_BY_TEST_RUN, _count_of
+)
+
+try:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    import greenlet  # noqa: F401  (required by SQLAlchemy's asyncio bridge)
+    ASYNC_DB_AVAILABLE = True
+except ImportError:
+    ASYNC_DB_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Sync driver prefixes rewritten to their asyncio counterparts
+ASYNC_DRIVERS = {
+    'postgresql+psycopg2://': 'postgresql+asyncpg://',
+    'postgresql://': 'postgresql+asyncpg://',
+}
+
+
+def to_async_url(database_url: str) -> str:
+    """Rewrite a sync database URL to use the matching asyncio driver"""
+    for prefix, async_prefix in ASYNC_DRIVERS.items():
+        if database_url.startswith(prefix):
+            return async_prefix + database_url[len(prefix):]
+    return database_url
+
+class AsyncDatabaseManager:
+    """Manages an async engine and sessions for server databases"""
+    
+    def __init__(self, database_url: str):
+        """
+        Initialize async database manager
+        
+        Args:
+            database_url: Server database URL; postgresql:// URLs use asyncpg
+        """
+        if not ASYNC_DB_AVAILABLE:
+            raise ImportError("Async database access requires SQLAlchemy's asyncio extras (greenlet) and asyncpg")
+        if database_url.startswith('sqlite'):
+            raise ValueError("AsyncDatabaseManager is for server databases; use DatabaseManager for SQLite")
+        
+        self.database_url = to_async_url(database_url)
+        self.engine = create_async_engine(
+            self.database_url,
+            pool_size=int(os.getenv('DB_POOL_SIZE', '10')),
+            max_overflow=int(os.getenv('DB_MAX_OVERFLOW', '5')),
+            pool_recycle=int(os.getenv('DB_POOL_RECYCLE', '60')),
+            pool_pre_ping=os.getenv('DB_POOL_PRE_PING', 'false').lower() == 'true',
+            pool_timeout=30,
+            insertmanyvalues_page_size=BATCH_SIZE,
+            echo=False
+        )
+        # Objects stay readable after commit; lazy loads are not possible in async code
+        self.SessionLocal = async_sessionmaker(self.engine, expire_on_commit=False, autoflush=False)
+        logger.info(f"Async database engine created successfully: {self.database_url}")
+    
+    @asynccontextmanager
+    async def get_session(self, session=None) -> AsyncGenerator:
+        """
+        Get async database session with automatic cleanup
+        
+        Args:
+            session: Session of an enclosing unit of work; yielded as-is
+        
+        Returns:
+            Async database session
+        """
+        if session is not None:
+            yield session
+            return
+        
+        async with self.SessionLocal() as session:
+            try:
+                yield session
+            except Exception as e:
+                await session.rollback()
+                logger.error(f"Database session error: {str(e)}")
+                raise
+    
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncGenerator:
+        """Run several repository operations in a single transaction, committed on exit"""
+        async with self.get_session() as session:
+            yield session
+            await session.commit()
+    
+    async def close_connections(self):
+        """Close all database connections"""
+        await self.engine.dispose()
+        logger.info("Async database connections closed")
+
+class AsyncTestRunRepository:
+    """Async repository for TestRun operations"""
+    
+    def __init__(self, db_manager: AsyncDatabaseManager):
+        self.db_manager = db_manager
+    
+    async def get_test_run(self, test_run_id: int, session=None) -> Optional[TestRun]:
+        """Get test run by ID"""
+        async with self.db_manager.get_session(session) as db:
+            return (await db.execute(_GET_TEST_RUN, {'id': test_run_id})).scalar_one_or_none()
+    
+    async def get_test_runs_by_status(self, status: str, session=None) -> List[TestRun]:
+        """Get test runs by status"""
+        async with self.db_manager.get_session(session) as db:
+            return (await db.execute(_GET_TEST_RUNS_BY_STATUS, {'status': status})).scalars().all()
+    
+    async def get_recent_test_runs_summary(self, limit: int = 10, session=None) -> List[Dict[str, Any]]:
+        """Get id, name, status, creation time and average response time of recent test runs"""
+        stmt = select(
+            TestRun.id,
+            TestRun.test_name,
+            TestRun.status,
+            TestRun.created_at,
+            TestRun.avg_response_time
+        ).order_by(TestRun.created_at.desc()).limit(limit)
+        async with self.db_manager.get_session(session) as db:
+            return (await db.execute(stmt)).mappings().all()
+
+class AsyncPerformanceMetricRepository:
+    """Async repository for PerformanceMetric operations"""
+    
+    def __init__(self, db_manager: AsyncDatabaseManager):
+        self.db_manager = db_manager
+    
+    async def bulk_add_metrics(self, metrics_data: Iterable[Dict[str, Any]], session=None) -> int:
+        """Add multiple performance metrics with batched INSERTs, returning the number of rows inserted"""
+        rows = list(metrics_data)
+        async with self.db_manager.get_session(session) as db:
+            for start in range(0, len(rows), BATCH_SIZE):
+                await db.execute(insert(PerformanceMetric), rows[start:start + BATCH_SIZE])
+            if session is None:
+                await db.commit()
+            return len(rows)
+    
+    async def get_metrics_timeseries(self, test_run_id: int, session=None) -> List[Dict[str, Any]]:
+        """Get timestamp, response time and throughput of a test run's metrics in time order"""
+        stmt = select(
+            PerformanceMetric.timestamp,
+            PerformanceMetric.response_time,
+            PerformanceMetric.throughput
+        ).where(PerformanceMetric.test_run_id == test_run_id).order_by(PerformanceMetric.timestamp)
+        async with self.db_manager.get_session(session) as db:
+            return (await db.execute(stmt)).mappings().all()
+
+class AsyncReportRepository:
+    """Async repository for Report operations"""
+    
+    def __init__(self, db_manager: AsyncDatabaseManager):
+        self.db_manager = db_manager
+    
+    async def get_reports_by_test_run(self, test_run_id: int, session=None) -> List[Report]:
+        """Get all reports for a test run"""
+        async with self.db_manager.get_session(session) as db:
+            return (await db.execute(_GET_REPORTS_BY_TEST_RUN, {'test_run_id': test_run_id})).scalars().all()
+
+class AsyncDatabaseService:
+    """High-level async database service for request handlers"""
+    
+    def __init__(self, database_url: str):
+        self.db_manager = AsyncDatabaseManager(database_url)
+        self.test_runs = AsyncTestRunRepository(self.db_manager)
+        self.metrics = AsyncPerformanceMetricRepository(self.db_manager)
+        self.reports = AsyncReportRepository(self.db_manager)
+    
+    async def health_check(self) -> bool:
+        """Check database connectivity"""
+        try:
+            async with self.db_manager.engine.connect() as conn:
+                conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+                await conn.exec_driver_sql("SELECT 1")
+            return True
+        except Exception as e:
+            logger.error(f"Database health check failed: {str(e)}")
+            return False
+    
+    async def get_database_stats(self) -> Dict[str, int]:
+        """Get database statistics"""
+        stats = {}
+        try:
+            stmt = select(
+                _count_of(TestRun).label('total_test_runs'),
+                _count_of(TestRun, TestRun.status == 'completed').label('completed_test_runs'),
+                _count_of(PerformanceMetric).label('total_metrics'),
+                _count_of(LogEntry).label('total_logs'),
+                _count_of(Anomaly).label('total_anomalies'),
+                _count_of(Report).label('total_reports')
+            )
+            async with self.db_manager.get_session() as session:
+                stats.update((await session.execute(stmt)).one()._asdict())
+        except Exception as e:
+            logger.error(f"Error getting database stats: {str(e)}")
+            stats['error'] = str(e)
+        
+        return stats
+    
+    async def close(self):
+        """Close database connections"""
+        await self.db_manager.close_connections()
@@ -3,17 +3,145 @@ Database Connection Module
 Handles database connections, sessions, and operations using SQLAlchemy
 """
 
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker, scoped_session
-from sqlalchemy.pool import StaticPool
+import sqlalchemy
+from sqlalchemy import bindparam, create_engine, delete, event, func, insert, lambda_stmt, select, tuple_, update
+from sqlalchemy.orm import raiseload, selectinload, sessionmaker, scoped_session
+from sqlalchemy.pool import QueuePool, StaticPool
 from contextlib import contextmanager
-from typing import Generator, Optional, Dict, Any, List
+from itertools import islice
+from typing import Generator, Iterable, Iterator, Optional, Dict, Any, List, Tuple, Union
 import logging
 import os
-from .models import Base, TestRun, PerformanceMetric, LogEntry, Anomaly, Report
+import numpy as np
+from .models import Base, TestRun, PerformanceMetric, LogEntry, Anomaly, Report, Alert
+from .migrations import upgrade_compressed_text_columns
+from .partitioning import drop_partitions_before, ensure_partitions, supports_partitioning
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT statement for bulk writes
+BATCH_SIZE = 1000
+
+# Rows fetched per round trip when streaming large result sets
+STREAM_BATCH_SIZE = 1000
+
+# Per-connection SQLite settings. foreign_keys enables the ON DELETE CASCADE
+# rules; WAL with synchronous=NORMAL makes a commit a single fsync and lets
+# readers run alongside the writer; the rest keep temp tables and pages in memory
+SQLITE_PRAGMAS = (
+    'foreign_keys=ON',
+    'journal_mode=WAL',
+    'synchronous=NORMAL',
+    'temp_store=MEMORY',
+    'cache_size=-65536',
+    'mmap_size=268435456'
+)
+
+# DEBUG_RAISELOAD=1 makes any lazy relationship load that would emit SQL raise,
+# so accidental N+1 access patterns fail loudly in tests and CI
+DEBUG_RAISELOAD = os.getenv('DEBUG_RAISELOAD', '0') == '1'
+
+# TestRun columns update_test_run may write; keys outside this set are ignored
+_UPDATABLE_TESTRUN_COLS = frozenset(c.key for c in TestRun.__table__.columns) - {'id', 'created_at'}
+
+
+def _load_options(*options) -> list:
+    """Loader options for a query, with raiseload('*') appended under DEBUG_RAISELOAD"""
+    options = list(options)
+    if DEBUG_RAISELOAD:
+        options.append(raiseload('*', sql_only=True))
+    return options
+
+# Hot lookups as lambda statements: SQLAlchemy caches their construction and
+# compiled SQL by code location, so repeat calls only bind new parameters
+_TEST_RUN_LOAD_OPTIONS = tuple(_load_options())
+_GET_TEST_RUN = lambda_stmt(
+    lambda: select(TestRun).options(*_TEST_RUN_LOAD_OPTIONS).where(TestRun.id == bindparam('id'))
+)
+_GET_TEST_RUNS_BY_STATUS = lambda_stmt(
+    lambda: select(TestRun).options(*_TEST_RUN_LOAD_OPTIONS).where(TestRun.status == bindparam('status'))
+)
+_GET_ERROR_LOGS = lambda_stmt(
+    lambda: select(LogEntry).where(
+        LogEntry.test_run_id == bindparam('test_run_id'),
+        LogEntry.log_level == 'ERROR'
+    ).order_by(LogEntry.timestamp)
+)
+_GET_REPORTS_BY_TEST_RUN = lambda_stmt(
+    lambda: select(Report).where(Report.test_run_id == bindparam('test_run_id')).order_by(Report.created_at.desc())
+)
+
+# SQLAlchemy 2.x sends executemany INSERTs as multi-row "insertmanyvalues"
+# statements; on 1.4 that path is a plain executemany, so mapped rows go
+# through bulk_insert_mappings instead, which skips the unit of work
+SQLALCHEMY_2 = int(sqlalchemy.__version__.split('.')[0]) >= 2
+BULK_ENGINE_OPTIONS = {'insertmanyvalues_page_size': BATCH_SIZE} if SQLALCHEMY_2 else {}
+
+if SQLALCHEMY_2:
+    def _bulk_insert(session, model, rows: List[Dict[str, Any]]):
+        session.execute(insert(model), rows)
+else:
+    def _bulk_insert(session, model, rows: List[Dict[str, Any]]):
+        if isinstance(model, type):
+            session.bulk_insert_mappings(model, rows)
+        else:
+            session.execute(insert(model), rows)
+
+
+def _insert_in_batches(session, model, rows: Iterable[Dict[str, Any]]) -> int:
+    """
+    Insert dict rows in bulk, BATCH_SIZE rows at a time
+    
+    Args:
+        session: Active database session
+        model: Mapped model class, or a Table to bypass the ORM bulk path entirely
+        rows: Column values per row
+        
+    Returns:
+        int: Number of rows inserted
+    """
+    rows = iter(rows)
+    count = 0
+    while True:
+        batch = list(islice(rows, BATCH_SIZE))
+        if not batch:
+            return count
+        _bulk_insert(session, model, batch)
+        count += len(batch)
+
+def _count_of(model, *criteria):
+    """Scalar subquery counting the rows of a model's table matching the criteria"""
+    return select(func.count()).select_from(model).where(*criteria).scalar_subquery()
+
+def _configure_sqlite_connection(dbapi_connection, connection_record):
+    """Apply foreign key enforcement and write-throughput pragmas to a new SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+def _column_values(values) -> list:
+    """
+    Convert a column array to Python values for a DBAPI executemany
+    
+    Datetimes become datetime objects (microsecond precision) and NaN/NaT
+    become None, so they are stored as NULL on every backend.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind == 'M':
+        values = values.astype('datetime64[us]')
+        missing = np.isnat(values)
+    elif values.dtype.kind == 'f':
+        missing = np.isnan(values)
+    else:
+        return values.tolist()
+    
+    result = values.tolist()
+    if missing.any():
+        for i in np.flatnonzero(missing).tolist():
+            result[i] = None
+    return result
+
 class DatabaseManager:
     """Manages database connections and operations"""
     
@@ -29,6 +157,15 @@ class DatabaseManager:
             database_url = "sqlite:///smarttest_insights.db"
         
         self.database_url = database_url
+        
+        # Server database pool settings; behind PgBouncer (transaction mode) set
+        # DB_POOL_PRE_PING=false and a short DB_POOL_RECYCLE such as 60, since the
+        # pre-ping SELECT 1 leaves its backends idle in transaction
+        self.pool_size = int(os.getenv('DB_POOL_SIZE', '10'))
+        self.max_overflow = int(os.getenv('DB_MAX_OVERFLOW', '5'))
+        self.pool_recycle = int(os.getenv('DB_POOL_RECYCLE', '3600'))
+        self.pool_pre_ping = os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true'
+        
         self.engine = None
         self.SessionLocal = None
         self._setup_database()
@@ -38,23 +175,43 @@ class DatabaseManager:
         try:
             # Create engine with appropriate settings
             if self.database_url.startswith('sqlite'):
+                if self.database_url in ('sqlite://', 'sqlite:///:memory:'):
+                    # An in-memory database lives in its one connection
+                    pool_options = {'poolclass': StaticPool}
+                else:
+                    # Default QueuePool sizing: under WAL, readers on other
+                    # threads run alongside the writer on their own connections
+                    pool_options = {'poolclass': QueuePool}
                 self.engine = create_engine(
                     self.database_url,
                     connect_args={"check_same_thread": False},
-                    poolclass=StaticPool,
-                    echo=False  # Set to True for SQL debugging
+                    **BULK_ENGINE_OPTIONS,
+                    echo=False,  # Set to True for SQL debugging
+                    **pool_options
                 )
+                event.listen(self.engine, 'connect', _configure_sqlite_connection)
             else:
+                engine_options = {}
+                if self.database_url.startswith(('postgresql://', 'postgresql+psycopg2://')):
+                    # Batch executemany statements that cannot use multi-row VALUES
+                    engine_options['executemany_mode'] = 'values_plus_batch'
                 self.engine = create_engine(
                     self.database_url,
-                    pool_pre_ping=True,
-                    pool_recycle=3600,
-                    echo=False
+                    poolclass=QueuePool,
+                    pool_size=self.pool_size,
+                    max_overflow=self.max_overflow,
+                    pool_recycle=self.pool_recycle,
+                    pool_pre_ping=self.pool_pre_ping,
+                    pool_timeout=30,
+                    **BULK_ENGINE_OPTIONS,
+                    echo=False,
+                    **engine_options
                 )
             
             # Create session factory
             self.SessionLocal = scoped_session(
-                sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+                # Objects stay loaded after commit, so returned instances need no reload
+                sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine)
             )
             
             logger.info(f"Database engine created successfully: {self.database_url}")
@@ -67,6 +224,9 @@ class DatabaseManager:
         """Create all database tables"""
         try:
             Base.metadata.create_all(bind=self.engine)
+            upgrade_compressed_text_columns(self.engine)
+            if supports_partitioning(self.engine):
+                ensure_partitions(self.engine)
             logger.info("Database tables created successfully")
         except Exception as e:
             logger.error(f"Error creating tables: {str(e)}")
@@ -82,13 +242,21 @@ class DatabaseManager:
             raise
     
     @contextmanager
-    def get_session(self) -> Generator:
+    def get_session(self, session=None) -> Generator:
         """
         Get database session with automatic cleanup
         
+        Args:
+            session: Session of an enclosing unit of work; yielded as-is and
+                left for the unit of work to commit and close
+        
         Returns:
             Database session
         """
+        if session is not None:
+            yield session
+            return
+        
         session = self.SessionLocal()
         try:
             yield session
@@ -99,6 +267,22 @@ class DatabaseManager:
         finally:
             session.close()
     
+    @contextmanager
+    def unit_of_work(self) -> Generator:
+        """
+        Run several repository operations in a single transaction
+        
+        Pass the yielded session to repository methods as session=...; they
+        then flush instead of committing, and everything is committed once
+        when the block exits (or rolled back if it raises).
+        
+        Returns:
+            Database session
+        """
+        with self.get_session() as session:
+            yield session
+            session.commit()
+    
     def get_session_sync(self):
         """Get synchronous database session"""
         return self.SessionLocal()
@@ -119,41 +303,112 @@ class TestRunRepository:
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
     
-    def create_test_run(self, test_data: Dict[str, Any]) -> TestRun:
+    def create_test_run(self, test_data: Dict[str, Any], session=None) -> TestRun:
         """Create a new test run"""
-        with self.db_manager.get_session() as session:
+        with self.db_manager.get_session(session) as db:
             test_run = TestRun(**test_data)
-            session.add(test_run)
-            session.commit()
-            session.refresh(test_run)
+            db.add(test_run)
+            if session is None:
+                db.commit()
+            else:
+                db.flush()
             return test_run
     
-    def get_test_run(self, test_run_id: int) -> Optional[TestRun]:
+    def get_test_run(self, test_run_id: int, session=None) -> Optional[TestRun]:
         """Get test run by ID"""
-        with self.db_manager.get_session() as session:
-            return session.query(TestRun).filter(TestRun.id == test_run_id).first()
-    
-    def update_test_run(self, test_run_id: int, update_data: Dict[str, Any]) -> Optional[TestRun]:
-        """Update test run"""
-        with self.db_manager.get_session() as session:
-            test_run = session.query(TestRun).filter(TestRun.id == test_run_id).first()
-            if test_run:
-                for key, value in update_data.items():
-                    if hasattr(test_run, key):
-                        setattr(test_run, key, value)
-                session.commit()
-                session.refresh(test_run)
-            return test_run
+        with self.db_manager.get_session(session) as db:
+            return db.execute(_GET_TEST_RUN, {'id': test_run_id}).scalar_one_or_none()
+    
+    def get_test_run_with_children(self, test_run_id: int, session=None) -> Optional[TestRun]:
+        """Get test run by ID with its metrics, logs, anomalies and reports loaded"""
+        with self.db_manager.get_session(session) as db:
+            return db.query(TestRun).options(*_load_options(
+                selectinload(TestRun.performance_metrics),
+                selectinload(TestRun.log_entries),
+                selectinload(TestRun.anomalies),
+                selectinload(TestRun.reports)
+            )).filter(TestRun.id == test_run_id).first()
+    
+    def update_test_run(self, test_run_id: int, update_data: Dict[str, Any], session=None,
+                        return_row: bool = True) -> Union[TestRun, bool, None]:
+        """
+        Update test run columns with a single UPDATE statement
+        
+        Args:
+            test_run_id: ID of the test run
+            update_data: Column values to set; unknown keys, id and created_at are ignored
+            session: Session of an enclosing unit of work
+            return_row: Load and return the updated TestRun; pass False to skip
+                the reload when only success matters
+            
+        Returns:
+            The updated TestRun (or None if it does not exist); with
+            return_row=False, whether the test run exists
+        """
+        clean = {k: v for k, v in update_data.items() if k in _UPDATABLE_TESTRUN_COLS}
+        with self.db_manager.get_session(session) as db:
+            if clean:
+                result = db.execute(update(TestRun).where(TestRun.id == test_run_id).values(**clean))
+                found = result.rowcount > 0
+                if session is None:
+                    db.commit()
+            else:
+                found = db.execute(select(TestRun.id).where(TestRun.id == test_run_id)).first() is not None
+            
+            if return_row:
+                return db.get(TestRun, test_run_id, populate_existing=True) if found else None
+            return found
     
-    def get_recent_test_runs(self, limit: int = 10) -> List[TestRun]:
+    def get_recent_test_runs(self, limit: int = 10, session=None) -> List[TestRun]:
         """Get recent test runs"""
-        with self.db_manager.get_session() as session:
-            return session.query(TestRun).order_by(TestRun.created_at.desc()).limit(limit).all()
-    
-    def get_test_runs_by_status(self, status: str) -> List[TestRun]:
+        with self.db_manager.get_session(session) as db:
+            return db.query(TestRun).options(*_load_options(
+                selectinload(TestRun.anomalies),
+                selectinload(TestRun.reports)
+            )).order_by(TestRun.created_at.desc()).limit(limit).all()
+    
+    def get_test_runs_before(self, cursor_created_at=None, cursor_id: Optional[int] = None, limit: int = 10,
+                             session=None) -> List[TestRun]:
+        """
+        Get one page of test runs, newest first, using keyset pagination
+        
+        Pass the created_at and id of the last run of the previous page as
+        the cursor; omit it for the first page. Each page is an index seek on
+        (created_at, id), so its cost does not grow with the page number as
+        OFFSET does.
+        
+        Args:
+            cursor_created_at: created_at of the last run already seen
+            cursor_id: id of the last run already seen
+            limit: Page size
+            session: Session of an enclosing unit of work
+            
+        Returns:
+            List[TestRun]: Test runs ordered by created_at, then id, descending
+        """
+        stmt = select(TestRun).options(*_load_options())
+        if cursor_created_at is not None:
+            stmt = stmt.where(tuple_(TestRun.created_at, TestRun.id) < tuple_(cursor_created_at, cursor_id))
+        stmt = stmt.order_by(TestRun.created_at.desc(), TestRun.id.desc()).limit(limit)
+        with self.db_manager.get_session(session) as db:
+            return db.execute(stmt).scalars().all()
+    
+    def get_recent_test_runs_summary(self, limit: int = 10, session=None) -> List[Dict[str, Any]]:
+        """Get id, name, status, creation time and average response time of recent test runs"""
+        with self.db_manager.get_session(session) as db:
+            stmt = select(
+                TestRun.id,
+                TestRun.test_name,
+                TestRun.status,
+                TestRun.created_at,
+                TestRun.avg_response_time
+            ).order_by(TestRun.created_at.desc()).limit(limit)
+            return db.execute(stmt).mappings().all()
+    
+    def get_test_runs_by_status(self, status: str, session=None) -> List[TestRun]:
         """Get test runs by status"""
-        with self.db_manager.get_session() as session:
-            return session.query(TestRun).filter(TestRun.status == status).all()
+        with self.db_manager.get_session(session) as db:
+            return db.execute(_GET_TEST_RUNS_BY_STATUS, {'status': status}).scalars().all()
 
 class PerformanceMetricRepository:
     """Repository for PerformanceMetric operations"""
@@ -161,29 +416,136 @@ class PerformanceMetricRepository:
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
     
-    def add_metrics(self, metrics_data: List[Dict[str, Any]]) -> List[PerformanceMetric]:
-        """Add multiple performance metrics"""
-        with self.db_manager.get_session() as session:
+    def add_metrics(self, metrics_data: Iterable[Dict[str, Any]], session=None) -> List[PerformanceMetric]:
+        """Add multiple performance metrics, returning the created instances"""
+        with self.db_manager.get_session(session) as db:
             metrics = [PerformanceMetric(**data) for data in metrics_data]
-            session.add_all(metrics)
-            session.commit()
+            db.add_all(metrics)
+            if session is None:
+                db.commit()
+            else:
+                db.flush()
             return metrics
     
-    def get_metrics_by_test_run(self, test_run_id: int) -> List[PerformanceMetric]:
+    def bulk_add_metrics(self, metrics_data: Iterable[Dict[str, Any]], session=None) -> int:
+        """Add multiple performance metrics with batched INSERTs, returning the number of rows inserted"""
+        with self.db_manager.get_session(session) as db:
+            count = _insert_in_batches(db, PerformanceMetric, metrics_data)
+            if session is None:
+                db.commit()
+            return count
+    
+    def add_metrics_columnar(self, test_run_id: int, timestamps: np.ndarray, response_times: np.ndarray,
+                             throughputs: Optional[np.ndarray] = None, session=None, **columns: np.ndarray) -> int:
+        """
+        Add metrics given as column arrays, without building ORM objects
+        
+        Args:
+            test_run_id: ID of the test run the metrics belong to
+            timestamps: datetime64 (or datetime) array, one entry per metric
+            response_times: Response times aligned with timestamps
+            throughputs: Optional throughputs aligned with timestamps
+            session: Session of an enclosing unit of work
+            **columns: Further PerformanceMetric columns as aligned arrays,
+                e.g. cpu_usage=..., status_code=...
+            
+        Returns:
+            int: Number of rows inserted
+        """
+        columns = {'timestamp': timestamps, 'response_time': response_times, **columns}
+        if throughputs is not None:
+            columns['throughput'] = throughputs
+        
+        keys = ('test_run_id',) + tuple(columns)
+        values = [_column_values(column) for column in columns.values()]
+        rows = (dict(zip(keys, (test_run_id,) + row)) for row in zip(*values))
+        
+        with self.db_manager.get_session(session) as db:
+            count = _insert_in_batches(db, PerformanceMetric.__table__, rows)
+            if session is None:
+                db.commit()
+            return count
+    
+    def get_metrics_by_test_run(self, test_run_id: int, session=None) -> List[PerformanceMetric]:
         """Get all metrics for a test run"""
-        with self.db_manager.get_session() as session:
-            return session.query(PerformanceMetric).filter(
+        with self.db_manager.get_session(session) as db:
+            return db.query(PerformanceMetric).filter(
                 PerformanceMetric.test_run_id == test_run_id
             ).order_by(PerformanceMetric.timestamp).all()
     
-    def get_metrics_by_timerange(self, test_run_id: int, start_time, end_time) -> List[PerformanceMetric]:
-        """Get metrics within time range"""
-        with self.db_manager.get_session() as session:
-            return session.query(PerformanceMetric).filter(
-                PerformanceMetric.test_run_id == test_run_id,
-                PerformanceMetric.timestamp >= start_time,
-                PerformanceMetric.timestamp <= end_time
-            ).order_by(PerformanceMetric.timestamp).all()
+    def get_metrics_timeseries(self, test_run_id: int, session=None) -> List[Dict[str, Any]]:
+        """Get timestamp, response time and throughput of a test run's metrics in time order"""
+        with self.db_manager.get_session(session) as db:
+            stmt = select(
+                PerformanceMetric.timestamp,
+                PerformanceMetric.response_time,
+                PerformanceMetric.throughput
+            ).where(PerformanceMetric.test_run_id == test_run_id).order_by(PerformanceMetric.timestamp)
+            return db.execute(stmt).mappings().all()
+    
+    def get_metrics_by_timerange(self, test_run_id: int, start_time, end_time,
+                                 session=None) -> List[PerformanceMetric]:
+        """Get metrics within time range in time order"""
+        stmt = select(PerformanceMetric).where(
+            PerformanceMetric.test_run_id == test_run_id,
+            PerformanceMetric.timestamp >= start_time,
+            PerformanceMetric.timestamp <= end_time
+        ).order_by(PerformanceMetric.timestamp)
+        with self.db_manager.get_session(session) as db:
+            return db.execute(stmt).scalars().all()
+    
+    def iter_metrics_by_timerange(self, test_run_id: int, start_time, end_time,
+                                  session=None) -> Iterator[PerformanceMetric]:
+        """
+        Stream metrics within time range in time order
+        
+        Rows are fetched STREAM_BATCH_SIZE at a time (server-side cursor on
+        PostgreSQL), so a long run is never materialized as one list. The
+        session stays open until the iterator is exhausted or closed.
+        
+        Args:
+            test_run_id: ID of the test run
+            start_time: Inclusive lower timestamp bound
+            end_time: Inclusive upper timestamp bound
+            session: Session of an enclosing unit of work
+            
+        Returns:
+            Iterator over PerformanceMetric instances
+        """
+        stmt = select(PerformanceMetric).where(
+            PerformanceMetric.test_run_id == test_run_id,
+            PerformanceMetric.timestamp >= start_time,
+            PerformanceMetric.timestamp <= end_time
+        ).order_by(PerformanceMetric.timestamp).execution_options(yield_per=STREAM_BATCH_SIZE)
+        with self.db_manager.get_session(session) as db:
+            yield from db.execute(stmt).scalars()
+    
+    def get_metrics_by_timerange_arrays(self, test_run_id: int, start_time, end_time,
+                                        session=None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get timestamps and response times within time range as NumPy arrays
+        
+        Args:
+            test_run_id: ID of the test run
+            start_time: Inclusive lower timestamp bound
+            end_time: Inclusive upper timestamp bound
+            session: Session of an enclosing unit of work
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: datetime64[us] timestamps and float64
+                response times (NaN where missing), in time order
+        """
+        stmt = select(PerformanceMetric.timestamp, PerformanceMetric.response_time).where(
+            PerformanceMetric.test_run_id == test_run_id,
+            PerformanceMetric.timestamp >= start_time,
+            PerformanceMetric.timestamp <= end_time
+        ).order_by(PerformanceMetric.timestamp).execution_options(yield_per=STREAM_BATCH_SIZE)
+        with self.db_manager.get_session(session) as db:
+            records = np.fromiter(
+                ((ts, np.nan if rt is None else rt) for ts, rt in db.execute(stmt)),
+                dtype=[('timestamp', 'datetime64[us]'), ('response_time', np.float64)]
+            )
+        return records['timestamp'].copy(), records['response_time'].copy()
 
 class LogEntryRepository:
     """Repository for LogEntry operations"""
@@ -191,25 +553,37 @@ class LogEntryRepository:
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
     
-    def add_log_entries(self, log_data: List[Dict[str, Any]]) -> List[LogEntry]:
-        """Add multiple log entries"""
-        with self.db_manager.get_session() as session:
+    def add_log_entries(self, log_data: Iterable[Dict[str, Any]], session=None) -> List[LogEntry]:
+        """Add multiple log entries, returning the created instances"""
+        with self.db_manager.get_session(session) as db:
             logs = [LogEntry(**data) for data in log_data]
-            session.add_all(logs)
-            session.commit()
+            db.add_all(logs)
+            if session is None:
+                db.commit()
+            else:
+                db.flush()
             return logs
     
-    def get_logs_by_test_run(self, test_run_id: int, log_level: Optional[str] = None) -> List[LogEntry]:
+    def bulk_add_log_entries(self, log_data: Iterable[Dict[str, Any]], session=None) -> int:
+        """Add multiple log entries with batched INSERTs, returning the number of rows inserted"""
+        with self.db_manager.get_session(session) as db:
+            count = _insert_in_batches(db, LogEntry, log_data)
+            if session is None:
+                db.commit()
+            return count
+    
+    def get_logs_by_test_run(self, test_run_id: int, log_level: Optional[str] = None, session=None) -> List[LogEntry]:
         """Get logs for a test run, optionally filtered by level"""
-        with self.db_manager.get_session() as session:
-            query = session.query(LogEntry).filter(LogEntry.test_run_id == test_run_id)
+        with self.db_manager.get_session(session) as db:
+            query = db.query(LogEntry).filter(LogEntry.test_run_id == test_run_id)
             if log_level:
                 query = query.filter(LogEntry.log_level == log_level)
             return query.order_by(LogEntry.timestamp).all()
     
-    def get_error_logs(self, test_run_id: int) -> List[LogEntry]:
+    def get_error_logs(self, test_run_id: int, session=None) -> List[LogEntry]:
         """Get error logs for a test run"""
-        return self.get_logs_by_test_run(test_run_id, 'ERROR')
+        with self.db_manager.get_session(session) as db:
+            return db.execute(_GET_ERROR_LOGS, {'test_run_id': test_run_id}).scalars().all()
 
 class AnomalyRepository:
     """Repository for Anomaly operations"""
@@ -217,25 +591,36 @@ class AnomalyRepository:
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
     
-    def add_anomalies(self, anomaly_data: List[Dict[str, Any]]) -> List[Anomaly]:
-        """Add multiple anomalies"""
-        with self.db_manager.get_session() as session:
+    def add_anomalies(self, anomaly_data: Iterable[Dict[str, Any]], session=None) -> List[Anomaly]:
+        """Add multiple anomalies, returning the created instances"""
+        with self.db_manager.get_session(session) as db:
             anomalies = [Anomaly(**data) for data in anomaly_data]
-            session.add_all(anomalies)
-            session.commit()
+            db.add_all(anomalies)
+            if session is None:
+                db.commit()
+            else:
+                db.flush()
             return anomalies
     
-    def get_anomalies_by_test_run(self, test_run_id: int) -> List[Anomaly]:
+    def bulk_add_anomalies(self, anomaly_data: Iterable[Dict[str, Any]], session=None) -> int:
+        """Add multiple anomalies with batched INSERTs, returning the number of rows inserted"""
+        with self.db_manager.get_session(session) as db:
+            count = _insert_in_batches(db, Anomaly, anomaly_data)
+            if session is None:
+                db.commit()
+            return count
+    
+    def get_anomalies_by_test_run(self, test_run_id: int, session=None) -> List[Anomaly]:
         """Get all anomalies for a test run"""
-        with self.db_manager.get_session() as session:
-            return session.query(Anomaly).filter(
+        with self.db_manager.get_session(session) as db:
+            return db.query(Anomaly).filter(
                 Anomaly.test_run_id == test_run_id
             ).order_by(Anomaly.timestamp).all()
     
-    def get_unresolved_anomalies(self, test_run_id: int) -> List[Anomaly]:
+    def get_unresolved_anomalies(self, test_run_id: int, session=None) -> List[Anomaly]:
         """Get unresolved anomalies for a test run"""
-        with self.db_manager.get_session() as session:
-            return session.query(Anomaly).filter(
+        with self.db_manager.get_session(session) as db:
+            return db.query(Anomaly).filter(
                 Anomaly.test_run_id == test_run_id,
                 Anomaly.is_resolved == False
             ).order_by(Anomaly.timestamp).all()
@@ -246,35 +631,38 @@ class ReportRepository:
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
     
-    def create_report(self, report_data: Dict[str, Any]) -> Report:
+    def create_report(self, report_data: Dict[str, Any], session=None) -> Report:
         """Create a new report record"""
-        with self.db_manager.get_session() as session:
+        with self.db_manager.get_session(session) as db:
             report = Report(**report_data)
-            session.add(report)
-            session.commit()
-            session.refresh(report)
+            db.add(report)
+            if session is None:
+                db.commit()
+            else:
+                db.flush()
             return report
     
-    def update_report_status(self, report_id: int, status: str, file_path: str = None, error_message: str = None) -> Optional[Report]:
+    def update_report_status(self, report_id: int, status: str, file_path: str = None, error_message: str = None,
+                             session=None) -> Optional[Report]:
         """Update report status"""
-        with self.db_manager.get_session() as session:
-            report = session.query(Report).filter(Report.id == report_id).first()
+        with self.db_manager.get_session(session) as db:
+            report = db.query(Report).filter(Report.id == report_id).first()
             if report:
                 report.status = status
                 if file_path:
                     report.file_path = file_path
                 if error_message:
                     report.error_message = error_message
-                session.commit()
-                session.refresh(report)
+                if session is None:
+                    db.commit()
+                else:
+                    db.flush()
             return report
     
-    def get_reports_by_test_run(self, test_run_id: int) -> List[Report]:
+    def get_reports_by_test_run(self, test_run_id: int, session=None) -> List[Report]:
         """Get all reports for a test run"""
-        with self.db_manager.get_session() as session:
-            return session.query(Report).filter(
-                Report.test_run_id == test_run_id
-            ).order_by(Report.created_at.desc()).all()
+        with self.db_manager.get_session(session) as db:
+            return db.execute(_GET_REPORTS_BY_TEST_RUN, {'test_run_id': test_run_id}).scalars().all()
 
 class DatabaseService:
     """High-level database service combining all repositories"""
@@ -293,9 +681,12 @@ class DatabaseService:
     
     def health_check(self) -> bool:
         """Check database connectivity"""
+        engine = self.db_manager.engine
         try:
-            with self.db_manager.get_session() as session:
-                session.execute(text("SELECT 1"))
+            # Plain connection ping in autocommit: no ORM session and no BEGIN, so a
+            # transaction-pooling proxy never sees an idle-in-transaction backend
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                conn.exec_driver_sql("SELECT 1")
             return True
         except Exception as e:
             logger.error(f"Database health check failed: {str(e)}")
@@ -306,12 +697,16 @@ class DatabaseService:
         stats = {}
         try:
             with self.db_manager.get_session() as session:
-                stats['total_test_runs'] = session.query(TestRun).count()
-                stats['completed_test_runs'] = session.query(TestRun).filter(TestRun.status == 'completed').count()
-                stats['total_metrics'] = session.query(PerformanceMetric).count()
-                stats['total_logs'] = session.query(LogEntry).count()
-                stats['total_anomalies'] = session.query(Anomaly).count()
-                stats['total_reports'] = session.query(Report).count()
+                # All counts as scalar subqueries of one SELECT: a single round trip
+                stmt = select(
+                    _count_of(TestRun).label('total_test_runs'),
+                    _count_of(TestRun, TestRun.status == 'completed').label('completed_test_runs'),
+                    _count_of(PerformanceMetric).label('total_metrics'),
+                    _count_of(LogEntry).label('total_logs'),
+                    _count_of(Anomaly).label('total_anomalies'),
+                    _count_of(Report).label('total_reports')
+                )
+                stats.update(session.execute(stmt).one()._asdict())
         except Exception as e:
             logger.error(f"Error getting database stats: {str(e)}")
             stats['error'] = str(e)
@@ -323,14 +718,41 @@ class DatabaseService:
         from datetime import datetime, timedelta
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         
+        engine = self.db_manager.engine
+        try:
+            if supports_partitioning(engine):
+                # Whole expired months of metrics and logs go as partition drops;
+                # roll the partition window forward while at it
+                drop_partitions_before(engine, cutoff_date)
+                ensure_partitions(engine)
+        except Exception as e:
+            # The row deletes below still remove everything expired
+            logger.error(f"Error maintaining partitions: {str(e)}")
+        
         try:
             with self.db_manager.get_session() as session:
-                # Delete old test runs and related data
-                old_test_runs = session.query(TestRun).filter(TestRun.created_at < cutoff_date).all()
-                for test_run in old_test_runs:
-                    session.delete(test_run)
+                # Children are removed explicitly rather than left to ON DELETE rules,
+                # which databases created before those rules were added do not have
+                old_runs = select(TestRun.id).where(TestRun.created_at < cutoff_date)
+                for model in (PerformanceMetric, LogEntry, Anomaly, Report):
+                    session.execute(
+                        delete(model)
+                        .where(model.test_run_id.in_(old_runs))
+                        .execution_options(synchronize_session=False)
+                    )
+                session.execute(
+                    update(Alert)
+                    .where(Alert.test_run_id.in_(old_runs))
+                    .values(test_run_id=None)
+                    .execution_options(synchronize_session=False)
+                )
+                result = session.execute(
+                    delete(TestRun)
+                    .where(TestRun.created_at < cutoff_date)
+                    .execution_options(synchronize_session=False)
+                )
                 session.commit()
-                logger.info(f"Cleaned up {len(old_test_runs)} old test runs")
+                logger.info(f"Cleaned up {result.rowcount} old test runs")
         except Exception as e:
             logger.error(f"Error cleaning up old data: {str(e)}")
     
@@ -0,0 +1,73 @@
+"""
+Migrations Module
+In-place schema upgrades for databases created by earlier versions
+"""
+
+from typing import List, Tuple
+import logging
+
+from sqlalchemy import inspect, text
+from sqlalchemy.types import String
+from .models import Base, ZstdText
+
+logger = logging.getLogger(__name__)
+
+
+def compressed_text_columns() -> List[Tuple[str, str]]:
+    """(table, column) pairs of every ZstdText column"""
+    return [
+        (table.name, column.name)
+        for table in Base.metadata.sorted_tables
+        for column in table.columns
+        if isinstance(column.type, ZstdText)
+    ]
+
+def upgrade_compressed_text_columns(engine) -> List[str]:
+    """
+    Convert ZstdText columns still declared as TEXT to binary storage
+
+    Existing values are kept and tagged as raw UTF-8, so they read back
+    unchanged. Idempotent: columns that are already binary are skipped.
+    SQLite needs no change, because its columns accept either type and
+    ZstdText passes plain strings through.
+
+    Args:
+        engine: SQLAlchemy engine of the database to upgrade
+
+    Returns:
+        List[str]: table.column names that were converted
+    """
+    dialect = engine.dialect.name
+    if dialect == 'sqlite':
+        return []
+
+    inspector = inspect(engine)
+    upgraded = []
+    with engine.begin() as conn:
+        for table_name, column_name in compressed_text_columns():
+            if not inspector.has_table(table_name):
+                continue
+            column = next(c for c in inspector.get_columns(table_name) if c['name'] == column_name)
+            if not isinstance(column['type'], String):
+                continue
+
+            if dialect == 'postgresql':
+                conn.execute(text(
+                    f"ALTER TABLE {table_name} ALTER COLUMN {column_name} TYPE bytea "
+                    f"USING convert_to('R' || {column_name}, 'UTF8')"
+                ))
+            elif dialect in ('mysql', 'mariadb'):
+                null = "NULL" if column['nullable'] else "NOT NULL"
+                conn.execute(text(f"ALTER TABLE {table_name} MODIFY {column_name} BLOB {null}"))
+                conn.execute(text(
+                    f"UPDATE {table_name} SET {column_name} = CONCAT('R', {column_name}) "
+                    f"WHERE {column_name} IS NOT NULL"
+                ))
+            else:
+                logger.warning(f"No compressed text upgrade for {dialect}; {table_name}.{column_name} left as text")
+                continue
+            upgraded.append(f"{table_name}.{column_name}")
+
+    if upgraded:
+        logger.info(f"Converted {len(upgraded)} text columns to compressed storage: {', '.join(upgraded)}")
+    return upgraded
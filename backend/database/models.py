@@ -3,17 +3,87 @@ Database Models Module
 SQLAlchemy models for storing performance test data
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean, ForeignKey
+from sqlalchemy import (
+    Column, Integer, String, Float, DateTime, Text, Boolean, ForeignKey, Index, LargeBinary, PrimaryKeyConstraint
+)
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
+from sqlalchemy.types import TypeDecorator
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 import json
+import zlib
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Text shorter than this is stored uncompressed; frame overhead would outweigh the gain
+COMPRESS_MIN_BYTES = 64
+ZSTD_LEVEL = 3
+
+# Leading bytes of every zstd frame; not valid UTF-8, so never plain text
+ZSTD_FRAME_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# Tables range-partitioned by created_at on PostgreSQL (see partitioning.py)
+PARTITIONED_TABLES = frozenset({'performance_metrics', 'log_entries'})
 
 Base = declarative_base()
 
+class ZstdText(TypeDecorator):
+    """
+    Text stored compressed as binary: zstd when available, zlib otherwise
+    
+    Each value carries a one-byte tag (R raw UTF-8, Z zstd, D zlib). Raw and
+    zlib rows read back everywhere; zstd rows need zstandard installed, and
+    reading one without it raises a RuntimeError.
+    Untagged values from databases created before compression pass through:
+    strings as-is and bytes that do not decode under their leading tag as
+    plain UTF-8. Server databases are converted by migrations.py.
+    """
+    impl = LargeBinary
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        data = value.encode('utf-8')
+        if len(data) < COMPRESS_MIN_BYTES:
+            return b'R' + data
+        if ZSTD_AVAILABLE:
+            return b'Z' + zstandard.compress(data, ZSTD_LEVEL)
+        return b'D' + zlib.compress(data, ZSTD_LEVEL)
+    
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, str):
+            return value
+        value = bytes(value)
+        tag, data = value[:1], value[1:]
+        if tag == b'Z' and data[:4] == ZSTD_FRAME_MAGIC:
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError("Stored value is zstd-compressed but zstandard is not installed")
+            return zstandard.decompress(data).decode('utf-8')
+        if tag == b'D':
+            try:
+                return zlib.decompress(data).decode('utf-8')
+            except zlib.error:
+                pass
+        elif tag == b'R':
+            return data.decode('utf-8')
+        # Untagged text, including text that happens to start with Z or D
+        return value.decode('utf-8')
+
 class TestRun(Base):
     """Model for storing test run information"""
     __tablename__ = 'test_runs'
+    __table_args__ = (
+        # Newest-first listings and keyset pagination seek on (created_at, id)
+        Index('ix_testrun_created_id', 'created_at', 'id'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     test_name = Column(String(255), nullable=False)
@@ -34,22 +104,28 @@ class TestRun(Base):
     min_response_time = Column(Float, nullable=True)
     error_rate = Column(Float, nullable=True)
     throughput = Column(Float, nullable=True)
-    status = Column(String(50), nullable=False, default='running')  # running, completed, failed
+    status = Column(String(50), nullable=False, default='running', index=True)  # running, completed, failed
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    performance_metrics = relationship("PerformanceMetric", back_populates="test_run")
-    log_entries = relationship("LogEntry", back_populates="test_run")
-    anomalies = relationship("Anomaly", back_populates="test_run")
-    reports = relationship("Report", back_populates="test_run")
+    performance_metrics = relationship("PerformanceMetric", back_populates="test_run", passive_deletes=True)
+    log_entries = relationship("LogEntry", back_populates="test_run", passive_deletes=True)
+    anomalies = relationship("Anomaly", back_populates="test_run", passive_deletes=True)
+    reports = relationship("Report", back_populates="test_run", passive_deletes=True)
 
 class PerformanceMetric(Base):
     """Model for storing individual performance metrics"""
     __tablename__ = 'performance_metrics'
+    __table_args__ = (
+        # Metrics are always read per test run in time order
+        Index('ix_perfmetric_run_ts', 'test_run_id', 'timestamp'),
+        # Monthly range partitions on PostgreSQL, see partitioning.py; ignored elsewhere
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    test_run_id = Column(Integer, ForeignKey('test_runs.id'), nullable=False)
+    test_run_id = Column(Integer, ForeignKey('test_runs.id', ondelete='CASCADE'), nullable=False)
     timestamp = Column(DateTime, nullable=False)
     response_time = Column(Float, nullable=True)
     throughput = Column(Float, nullable=True)
@@ -69,12 +145,17 @@ class PerformanceMetric(Base):
 class LogEntry(Base):
     """Model for storing log entries"""
     __tablename__ = 'log_entries'
+    __table_args__ = (
+        Index('ix_log_run_ts', 'test_run_id', 'timestamp'),
+        Index('ix_log_run_level_ts', 'test_run_id', 'log_level', 'timestamp'),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    test_run_id = Column(Integer, ForeignKey('test_runs.id'), nullable=True)
+    test_run_id = Column(Integer, ForeignKey('test_runs.id', ondelete='CASCADE'), nullable=True)
     timestamp = Column(DateTime, nullable=False)
     log_level = Column(String(20), nullable=False)  # INFO, WARN, ERROR, DEBUG
-    message = Column(Text, nullable=False)
+    message = Column(ZstdText, nullable=False)
     source = Column(String(100), nullable=True)  # application, database, network, etc.
     request_id = Column(String(100), nullable=True)
     endpoint = Column(String(500), nullable=True)
@@ -83,7 +164,7 @@ class LogEntry(Base):
     response_time = Column(Float, nullable=True)
     status_code = Column(Integer, nullable=True)
     error_type = Column(String(100), nullable=True)
-    stack_trace = Column(Text, nullable=True)
+    stack_trace = Column(ZstdText, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationships
@@ -92,9 +173,13 @@ class LogEntry(Base):
 class Anomaly(Base):
     """Model for storing detected anomalies"""
     __tablename__ = 'anomalies'
+    __table_args__ = (
+        Index('ix_anomaly_run_ts', 'test_run_id', 'timestamp'),
+        Index('ix_anomaly_run_resolved_ts', 'test_run_id', 'is_resolved', 'timestamp'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    test_run_id = Column(Integer, ForeignKey('test_runs.id'), nullable=False)
+    test_run_id = Column(Integer, ForeignKey('test_runs.id', ondelete='CASCADE'), nullable=False)
     timestamp = Column(DateTime, nullable=False)
     anomaly_type = Column(String(50), nullable=False)  # response_time, throughput, error_rate
     metric_value = Column(Float, nullable=False)
@@ -115,7 +200,7 @@ class Report(Base):
     __tablename__ = 'reports'
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    test_run_id = Column(Integer, ForeignKey('test_runs.id'), nullable=False)
+    test_run_id = Column(Integer, ForeignKey('test_runs.id', ondelete='CASCADE'), nullable=False)
     report_type = Column(String(50), nullable=False)  # executive, detailed, trends
     format = Column(String(20), nullable=False)  # pdf, excel, html
     file_path = Column(String(500), nullable=True)
@@ -149,7 +234,7 @@ class Alert(Base):
     __tablename__ = 'alerts'
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    test_run_id = Column(Integer, ForeignKey('test_runs.id'), nullable=True)
+    test_run_id = Column(Integer, ForeignKey('test_runs.id', ondelete='SET NULL'), nullable=True)
     alert_type = Column(String(50), nullable=False)  # threshold_breach, anomaly, error_spike
     severity = Column(String(20), nullable=False)  # low, medium, high, critical
     title = Column(String(255), nullable=False)
@@ -211,12 +296,51 @@ class Baseline(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+@compiles(PrimaryKeyConstraint, 'postgresql')
+def _compile_partitioned_primary_key(constraint, compiler, **kw):
+    """
+    Extend the primary key of a range-partitioned table with its partition key
+    
+    PostgreSQL requires unique constraints on a partitioned table to include
+    the partition columns; id alone stays the ORM identity on every backend.
+    """
+    ddl = compiler.visit_primary_key_constraint(constraint, **kw)
+    if not ddl or constraint.table.name not in PARTITIONED_TABLES:
+        return ddl
+    partition_by = constraint.table.dialect_options['postgresql']['partition_by']
+    
+    partition_key = partition_by[partition_by.index('(') + 1:partition_by.rindex(')')].strip()
+    return ddl[:ddl.rindex(')')] + f", {partition_key})"
+
 # Utility functions for models
+@lru_cache(maxsize=None)
+def _column_keys(model_class):
+    """Column keys of a model's table, computed once per class"""
+    return tuple(c.key for c in model_class.__table__.columns)
+
+@lru_cache(maxsize=None)
+def _column_getter(model_class):
+    """Getter returning all column values of an instance in one C-level call"""
+    return attrgetter(*_column_keys(model_class))
+
 def to_dict(instance):
     """Convert SQLAlchemy instance to dictionary"""
-    return {c.key: getattr(instance, c.key) for c in instance.__table__.columns}
+    model_class = type(instance)
+    return dict(zip(_column_keys(model_class), _column_getter(model_class)(instance)))
+
+def make_from_dict(model_class):
+    """Build a from_dict constructor specialized to one model's column set"""
+    columns = frozenset(_column_keys(model_class))
+    
+    def _from_dict(data_dict):
+        return model_class(**{k: data_dict[k] for k in data_dict.keys() & columns})
+    
+    return _from_dict
 
 def from_dict(model_class, data_dict):
     """Create SQLAlchemy instance from dictionary"""
-    return model_class(**{k: v for k, v in data_dict.items() 
-                         if k in [c.key for c in model_class.__table__.columns]}) 
\ No newline at end of file
+    return model_class.from_dict(data_dict)
+
+# Give every model its specialized constructor, e.g. TestRun.from_dict(data)
+for _model_class in Base.__subclasses__():
+    _model_class.from_dict = staticmethod(make_from_dict(_model_class))
@@ -0,0 +1,136 @@
+"""
+Partitioning Module
+Monthly range partition maintenance for the high-volume tables on PostgreSQL
+"""
+
+from datetime import datetime
+from typing import List
+import logging
+
+from sqlalchemy import text
+from .models import Base
+
+logger = logging.getLogger(__name__)
+
+# Months of partitions created ahead of the current one
+PARTITION_MONTHS_AHEAD = 2
+
+
+def partitioned_tables() -> List[str]:
+    """Names of the tables declared with postgresql_partition_by"""
+    return [
+        table.name for table in Base.metadata.sorted_tables
+        if table.dialect_options['postgresql']['partition_by']
+    ]
+
+def existing_partitioned_tables(engine) -> List[str]:
+    """
+    Declared partitioned tables that really are partitioned in the database
+
+    Tables created before partitioning was declared stay plain tables;
+    partitions cannot be attached to them, so they are left out.
+
+    Args:
+        engine: SQLAlchemy engine
+
+    Returns:
+        List[str]: Table names, empty on databases other than PostgreSQL
+    """
+    if engine.dialect.name != 'postgresql':
+        return []
+
+    declared = partitioned_tables()
+    with engine.connect() as conn:
+        partitioned = set(conn.execute(text(
+            "SELECT c.relname FROM pg_partitioned_table p "
+            "JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = ANY(:names)"
+        ), {'names': declared}).scalars())
+
+    plain = [name for name in declared if name not in partitioned]
+    if plain:
+        logger.warning(
+            f"Tables created without partitioning, expired rows are deleted instead: {', '.join(plain)}"
+        )
+    return [name for name in declared if name in partitioned]
+
+def supports_partitioning(engine) -> bool:
+    """Whether the engine's database has any of the declared tables partitioned"""
+    return bool(existing_partitioned_tables(engine))
+
+def _month_start(value: datetime, offset: int = 0) -> datetime:
+    """First instant of the month offset months from value's month"""
+    month_index = value.year * 12 + value.month - 1 + offset
+    return datetime(month_index // 12, month_index % 12 + 1, 1)
+
+def partition_name(table_name: str, month_start: datetime) -> str:
+    """Name of a table's partition for one month, e.g. performance_metrics_202401"""
+    return f"{table_name}_{month_start:%Y%m}"
+
+def ensure_partitions(engine, months_ahead: int = PARTITION_MONTHS_AHEAD, now: datetime = None):
+    """
+    Create the default partition and monthly partitions up to months_ahead
+
+    Idempotent; run it at startup and periodically (cleanup_old_data does)
+    so inserts always land in a monthly partition. Rows outside the
+    created months go to the default partition. Tables that exist
+    unpartitioned are skipped.
+
+    Args:
+        engine: SQLAlchemy engine of a PostgreSQL database
+        months_ahead: Months after the current one to create
+        now: Reference time (defaults to the current UTC time)
+    """
+    now = now or datetime.utcnow()
+    tables = existing_partitioned_tables(engine)
+    with engine.begin() as conn:
+        for table_name in tables:
+            conn.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {table_name}_default PARTITION OF {table_name} DEFAULT"
+            ))
+            for offset in range(months_ahead + 1):
+                start, end = _month_start(now, offset), _month_start(now, offset + 1)
+                conn.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {partition_name(table_name, start)} "
+                    f"PARTITION OF {table_name} FOR VALUES FROM ('{start:%Y-%m-%d}') TO ('{end:%Y-%m-%d}')"
+                ))
+    logger.info(f"Ensured monthly partitions through {_month_start(now, months_ahead):%Y-%m}")
+
+def drop_partitions_before(engine, cutoff: datetime) -> List[str]:
+    """
+    Drop monthly partitions whose whole range lies before cutoff
+
+    Dropping a partition is a metadata operation, unlike deleting its rows.
+    The default partition is never dropped, and tables that exist
+    unpartitioned are skipped.
+
+    Args:
+        engine: SQLAlchemy engine of a PostgreSQL database
+        cutoff: Partitions ending at or before this time are dropped
+
+    Returns:
+        List[str]: Names of the dropped partitions
+    """
+    dropped = []
+    tables = existing_partitioned_tables(engine)
+    with engine.begin() as conn:
+        for table_name in tables:
+            partitions = conn.execute(text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = :table_name"
+            ), {'table_name': table_name}).scalars().all()
+
+            for name in partitions:
+                suffix = name[len(table_name) + 1:]
+                if not suffix.isdigit() or len(suffix) != 6:
+                    continue
+                month_end = _month_start(datetime.strptime(suffix, '%Y%m'), 1)
+                if month_end <= cutoff:
+                    conn.execute(text(f"DROP TABLE IF EXISTS {name}"))
+                    dropped.append(name)
+
+    if dropped:
+        logger.info(f"Dropped {len(dropped)} expired partitions: {', '.join(dropped)}")
+    return dropped
@@ -3,52 +3,189 @@ Excel Generator Module
 Handles Excel report generation using OpenPyXL
 """
 
-import pandas as pd
+import math
+import numbers
+import zipfile
+from xml.sax.saxutils import escape, quoteattr
+import numpy as np
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.chart import LineChart, BarChart, Reference
-from openpyxl.utils.dataframe import dataframe_to_rows
-from typing import Dict, List, Optional
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.styles import Font, PatternFill, Alignment, NamedStyle
+from openpyxl.utils import get_column_letter
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+from functools import lru_cache, partial
+from itertools import chain
 import logging
 from datetime import datetime
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+# Column letters A..XFD, looked up by index when writing sheet XML directly
+COLUMN_LETTERS = [get_column_letter(i) for i in range(1, 16385)]
+
+# Buffered sheet XML is flushed to the zip entry in chunks of this size
+XML_FLUSH_BYTES = 1 << 20
+
+# Cell formatting of the report's named styles; the style parts are immutable
+# and built once at import, only the NamedStyle wrappers are made per generator
+_STYLE_DEFINITIONS = {
+    'header': {
+        'font': Font(bold=True, color='FFFFFF'),
+        'fill': PatternFill(start_color='366092', end_color='366092', fill_type='solid'),
+        'alignment': Alignment(horizontal='center', vertical='center')
+    },
+    'subheader': {
+        'font': Font(bold=True, color='000000'),
+        'fill': PatternFill(start_color='D9E1F2', end_color='D9E1F2', fill_type='solid'),
+        'alignment': Alignment(horizontal='center', vertical='center')
+    },
+    'data': {
+        'font': Font(color='000000'),
+        'alignment': Alignment(horizontal='left', vertical='center')
+    },
+    'number': {
+        'font': Font(color='000000'),
+        'alignment': Alignment(horizontal='right', vertical='center')
+    }
+}
+
+# Sheets of the performance report, in workbook order
+REPORT_SHEETS = ("Executive Summary", "Detailed Metrics", "Trends Analysis", "Anomalies", "Recommendations")
+
+# General recommendations listed ahead of any from the analysis insights
+DEFAULT_RECOMMENDATIONS = (
+    "Monitor response time trends regularly",
+    "Set up alerting for performance degradation",
+    "Implement caching for frequently accessed data",
+    "Optimize database queries",
+    "Consider load balancing for high traffic",
+    "Regular performance testing in CI/CD pipeline"
+)
+
+# Minimal SpreadsheetML package parts around a single raw data sheet
+_CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+_ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Target="xl/workbook.xml" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+    '</Relationships>'
+)
+_WORKBOOK_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Target="worksheets/sheet1.xml" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"/>'
+    '</Relationships>'
+)
+_WORKBOOK_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name={name} sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+_SHEET_XML_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_XML_END = '</sheetData></worksheet>'
+
+
+@lru_cache(maxsize=None)
+def _metric_label(metric: str) -> str:
+    """Display label for a metric key, e.g. 'requests_per_second' -> 'Requests Per Second'"""
+    return metric.replace('_', ' ').title()
+
+def _round_values(values: Iterable, decimals: int = 2) -> List[float]:
+    """Round a batch of metric values in one vectorized call"""
+    return np.round(np.fromiter(values, dtype=np.float64), decimals).tolist()
+
+def _cell_len(value) -> int:
+    """Displayed length of a cell value, without formatting strings for the common types"""
+    if value is None:
+        return 0
+    if type(value) is str:
+        return len(value)
+    if type(value) in (int, float):
+        return len(repr(value))
+    return len(str(value))
+
+def _chain_header(columns, rows):
+    """Yield the header row followed by the data rows"""
+    yield [str(name) for name in columns]
+    yield from rows
+
+def _cell_xml(ref: str, value, missing: tuple = ()) -> bytes:
+    """
+    SpreadsheetML for one cell; missing (e.g. NaT, NA) and non-finite values
+    produce no cell, and XML-illegal control characters are stripped from text
+    """
+    if value is None:
+        return b''
+    if isinstance(value, (bool, np.bool_)):
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'.encode()
+    if isinstance(value, numbers.Number):
+        if isinstance(value, numbers.Real) and not math.isfinite(value):
+            return b''
+        return f'<c r="{ref}" t="n"><v>{value}</v></c>'.encode()
+    for marker in missing:
+        if value is marker:
+            return b''
+    
+    # Control characters are not allowed anywhere in XML; openpyxl refuses them
+    text = ILLEGAL_CHARACTERS_RE.sub('', str(value))
+    if any(ch in text for ch in '<>&"'):
+        text = escape(text, {'"': '&quot;'})
+    return f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'.encode()
+
+
 class ExcelReportGenerator:
     """Generates comprehensive Excel reports for performance testing"""
     
-    def __init__(self):
+    def __init__(self, streaming: bool = False):
+        """
+        Initialize Excel report generator
+        
+        Args:
+            streaming: Build workbooks in openpyxl's write-only mode, which streams
+                rows straight to the file instead of keeping every cell in memory.
+                A write-only workbook can be saved only once, so sheets cannot be
+                added after create_performance_report has saved it
+        """
+        self.streaming = streaming
         self.workbook = None
         self.styles = self._create_styles()
         
-    def _create_styles(self) -> Dict:
-        """Create Excel styles for formatting"""
-        return {
-            'header': {
-                'font': Font(bold=True, color='FFFFFF'),
-                'fill': PatternFill(start_color='366092', end_color='366092', fill_type='solid'),
-                'alignment': Alignment(horizontal='center', vertical='center')
-            },
-            'subheader': {
-                'font': Font(bold=True, color='000000'),
-                'fill': PatternFill(start_color='D9E1F2', end_color='D9E1F2', fill_type='solid'),
-                'alignment': Alignment(horizontal='center', vertical='center')
-            },
-            'data': {
-                'font': Font(color='000000'),
-                'alignment': Alignment(horizontal='left', vertical='center')
-            },
-            'number': {
-                'font': Font(color='000000'),
-                'alignment': Alignment(horizontal='right', vertical='center')
-            },
-            'border': Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-        }
+    def _create_styles(self) -> Dict[str, NamedStyle]:
+        """
+        Create named Excel styles for formatting
+        
+        Named styles are registered once per workbook and shared by every cell
+        that uses them, so cells are styled by name instead of per attribute.
+        """
+        return {name: NamedStyle(name=name, **attrs) for name, attrs in _STYLE_DEFINITIONS.items()}
+    
+    def _new_workbook(self) -> Workbook:
+        """Create a workbook with the report's named styles registered"""
+        workbook = Workbook(write_only=self.streaming)
+        for style in self.styles.values():
+            workbook.add_named_style(style)
+        return workbook
     
     def create_performance_report(self, data: Dict, output_path: str) -> str:
         """
@@ -62,18 +199,20 @@ class ExcelReportGenerator:
             str: Path to created Excel file
         """
         try:
-            self.workbook = Workbook()
+            self.workbook = self._new_workbook()
             
-            # Remove default sheet
-            if 'Sheet' in self.workbook.sheetnames:
-                self.workbook.remove(self.workbook['Sheet'])
-            
-            # Create different sheets
-            self._create_summary_sheet(data)
-            self._create_metrics_sheet(data)
-            self._create_trends_sheet(data)
-            self._create_anomalies_sheet(data)
-            self._create_recommendations_sheet(data)
+            # Create all sheets up front, then fill each in order
+            sheets = self._create_report_sheets()
+            generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            writers = (
+                partial(self._create_summary_sheet, generated_at=generated_at),
+                self._create_metrics_sheet,
+                self._create_trends_sheet,
+                self._create_anomalies_sheet,
+                self._create_recommendations_sheet
+            )
+            for ws, write_sheet in zip(sheets, writers):
+                write_sheet(ws, data)
             
             # Save workbook
             self.workbook.save(output_path)
@@ -84,315 +223,308 @@ class ExcelReportGenerator:
             logger.error(f"Error creating Excel report: {str(e)}")
             raise
     
-    def _create_summary_sheet(self, data: Dict) -> None:
+    def _create_report_sheets(self) -> List:
+        """Create the report's sheets in order, reusing a normal workbook's default sheet"""
+        names = iter(REPORT_SHEETS)
+        sheets = []
+        if not self.streaming:
+            # Write-only workbooks start empty; a normal one already has a sheet
+            ws = self.workbook.active
+            ws.title = next(names)
+            sheets.append(ws)
+        sheets.extend(self.workbook.create_sheet(name) for name in names)
+        return sheets
+    
+    def _create_summary_sheet(self, ws, data: Dict, generated_at: Optional[str] = None) -> None:
         """Create executive summary sheet"""
-        ws = self.workbook.create_sheet("Executive Summary", 0)
-        
         # Title
-        ws['A1'] = "Performance Test Report - Executive Summary"
-        ws.merge_cells('A1:F1')
-        self._apply_style(ws['A1'], 'header')
+        rows = [[self._styled(ws, "Performance Test Report - Executive Summary", 'header')], []]
         
         # Report info
-        row = 3
-        ws[f'A{row}'] = "Report Generated:"
-        ws[f'B{row}'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        rows.append(["Report Generated:", generated_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
         
         # Key metrics summary
-        row += 2
-        ws[f'A{row}'] = "Key Performance Metrics"
-        self._apply_style(ws[f'A{row}'], 'subheader')
+        rows.append([])
+        rows.append([self._styled(ws, "Key Performance Metrics", 'subheader')])
         
         if 'metrics' in data:
             metrics = data['metrics']
-            row += 2
+            rows.append([])
             
             # Response time metrics
             if 'response_time' in metrics:
                 rt = metrics['response_time']
-                ws[f'A{row}'] = "Average Response Time (ms):"
-                ws[f'B{row}'] = round(rt.get('mean', 0), 2)
-                row += 1
-                ws[f'A{row}'] = "95th Percentile (ms):"
-                ws[f'B{row}'] = round(rt.get('p95', 0), 2)
-                row += 1
-                ws[f'A{row}'] = "99th Percentile (ms):"
-                ws[f'B{row}'] = round(rt.get('p99', 0), 2)
-                row += 1
+                mean, p95, p99 = _round_values([rt.get('mean', 0), rt.get('p95', 0), rt.get('p99', 0)])
+                rows.append(["Average Response Time (ms):", mean])
+                rows.append(["95th Percentile (ms):", p95])
+                rows.append(["99th Percentile (ms):", p99])
             
             # Error metrics
             if 'errors' in metrics:
                 errors = metrics['errors']
-                ws[f'A{row}'] = "Error Rate (%):"
-                ws[f'B{row}'] = round(errors.get('error_rate', 0), 2)
-                row += 1
-                ws[f'A{row}'] = "Total Errors:"
-                ws[f'B{row}'] = errors.get('error_requests', 0)
-                row += 1
+                rows.append(["Error Rate (%):", round(errors.get('error_rate', 0), 2)])
+                rows.append(["Total Errors:", errors.get('error_requests', 0)])
         
         # Test summary
         if 'summary' in data:
             summary = data['summary']
-            row += 2
-            ws[f'A{row}'] = "Test Summary"
-            self._apply_style(ws[f'A{row}'], 'subheader')
-            row += 1
+            rows.extend([[]] * (2 if 'metrics' in data else 1))
+            rows.append([self._styled(ws, "Test Summary", 'subheader')])
             
-            ws[f'A{row}'] = "Total Records:"
-            ws[f'B{row}'] = summary.get('total_entries', 0)
-            row += 1
+            rows.append(["Total Records:", summary.get('total_entries', 0)])
             
             if 'time_range' in summary:
                 time_range = summary['time_range']
-                ws[f'A{row}'] = "Test Duration:"
-                ws[f'B{row}'] = f"{time_range.get('duration_hours', 0):.2f} hours"
-        
-        # Auto-fit columns
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+                rows.append(["Test Duration:", f"{time_range.get('duration_hours', 0):.2f} hours"])
+        
+        self._write_rows(ws, rows, merged='A1:F1', max_width=50)
     
-    def _create_metrics_sheet(self, data: Dict) -> None:
+    def _create_metrics_sheet(self, ws, data: Dict) -> None:
         """Create detailed metrics sheet"""
-        ws = self.workbook.create_sheet("Detailed Metrics")
-        
         # Title
-        ws['A1'] = "Detailed Performance Metrics"
-        ws.merge_cells('A1:D1')
-        self._apply_style(ws['A1'], 'header')
+        title = [self._styled(ws, "Detailed Performance Metrics", 'header')]
         
         if 'metrics' not in data:
+            self._write_rows(ws, [title], merged='A1:D1')
             return
             
         metrics = data['metrics']
-        row = 3
+        rows = [title, []]
         
         # Response time metrics
         if 'response_time' in metrics:
             rt = metrics['response_time']
-            ws[f'A{row}'] = "Response Time Metrics"
-            self._apply_style(ws[f'A{row}'], 'subheader')
-            row += 1
+            rows.append([self._styled(ws, "Response Time Metrics", 'subheader')])
             
             # Headers
-            ws[f'A{row}'] = "Metric"
-            ws[f'B{row}'] = "Value (ms)"
-            self._apply_style(ws[f'A{row}'], 'subheader')
-            self._apply_style(ws[f'B{row}'], 'subheader')
-            row += 1
+            rows.append([self._styled(ws, "Metric", 'subheader'), self._styled(ws, "Value (ms)", 'subheader')])
             
             # Data
-            for metric, value in rt.items():
-                ws[f'A{row}'] = metric.replace('_', ' ').title()
-                ws[f'B{row}'] = round(value, 2)
-                row += 1
+            for metric, value in zip(rt.keys(), _round_values(rt.values())):
+                rows.append([_metric_label(metric), value])
             
-            row += 1
+            rows.append([])
         
         # Throughput metrics
         if 'throughput' in metrics:
             tp = metrics['throughput']
-            ws[f'A{row}'] = "Throughput Metrics"
-            self._apply_style(ws[f'A{row}'], 'subheader')
-            row += 1
+            rows.append([self._styled(ws, "Throughput Metrics", 'subheader')])
             
-            ws[f'A{row}'] = "Metric"
-            ws[f'B{row}'] = "Value"
-            self._apply_style(ws[f'A{row}'], 'subheader')
-            self._apply_style(ws[f'B{row}'], 'subheader')
-            row += 1
+            rows.append([self._styled(ws, "Metric", 'subheader'), self._styled(ws, "Value", 'subheader')])
             
             for metric, value in tp.items():
-                ws[f'A{row}'] = metric.replace('_', ' ').title()
-                ws[f'B{row}'] = value
-                row += 1
-        
-        # Auto-fit columns
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 30)
-            ws.column_dimensions[column_letter].width = adjusted_width
+                rows.append([_metric_label(metric), value])
+        
+        self._write_rows(ws, rows, merged='A1:D1', max_width=30)
     
-    def _create_trends_sheet(self, data: Dict) -> None:
+    def _create_trends_sheet(self, ws, data: Dict) -> None:
         """Create trends analysis sheet"""
-        ws = self.workbook.create_sheet("Trends Analysis")
-        
-        ws['A1'] = "Performance Trends Analysis"
-        ws.merge_cells('A1:E1')
-        self._apply_style(ws['A1'], 'header')
+        rows = [[self._styled(ws, "Performance Trends Analysis", 'header')]]
         
-        if 'trends' not in data:
-            return
-            
-        trends = data['trends']
-        row = 3
-        
-        # Response time trends
-        if 'response_time_trend' in trends:
-            rt_trend = trends['response_time_trend']
-            ws[f'A{row}'] = "Response Time Trends"
-            self._apply_style(ws[f'A{row}'], 'subheader')
-            row += 1
+        if 'trends' in data:
+            trends = data['trends']
+            rows.append([])
             
-            if 'hourly_pattern' in rt_trend:
-                ws[f'A{row}'] = "Hourly Pattern"
-                self._apply_style(ws[f'A{row}'], 'subheader')
-                row += 1
-                
-                ws[f'A{row}'] = "Hour"
-                ws[f'B{row}'] = "Avg Response Time (ms)"
-                self._apply_style(ws[f'A{row}'], 'subheader')
-                self._apply_style(ws[f'B{row}'], 'subheader')
-                row += 1
+            # Response time trends
+            if 'response_time_trend' in trends:
+                rt_trend = trends['response_time_trend']
+                rows.append([self._styled(ws, "Response Time Trends", 'subheader')])
                 
-                for hour, avg_time in rt_trend['hourly_pattern'].items():
-                    ws[f'A{row}'] = hour
-                    ws[f'B{row}'] = round(avg_time, 2)
-                    row += 1
-                
-                row += 1
+                if 'hourly_pattern' in rt_trend:
+                    rows.append([self._styled(ws, "Hourly Pattern", 'subheader')])
+                    
+                    rows.append([
+                        self._styled(ws, "Hour", 'subheader'),
+                        self._styled(ws, "Avg Response Time (ms)", 'subheader')
+                    ])
+                    
+                    for hour, avg_time in rt_trend['hourly_pattern'].items():
+                        rows.append([hour, round(avg_time, 2)])
+        
+        self._write_rows(ws, rows, merged='A1:E1')
     
-    def _create_anomalies_sheet(self, data: Dict) -> None:
+    def _create_anomalies_sheet(self, ws, data: Dict) -> None:
         """Create anomalies analysis sheet"""
-        ws = self.workbook.create_sheet("Anomalies")
-        
-        ws['A1'] = "Performance Anomalies"
-        ws.merge_cells('A1:F1')
-        self._apply_style(ws['A1'], 'header')
-        
-        if 'anomalies' not in data:
-            return
-            
-        anomalies = data['anomalies']
-        row = 3
-        
-        # Anomaly summary
-        ws[f'A{row}'] = f"Total Anomalies Detected: {len(anomalies)}"
-        self._apply_style(ws[f'A{row}'], 'subheader')
-        row += 2
+        rows = [[self._styled(ws, "Performance Anomalies", 'header')]]
         
-        if anomalies:
-            # Headers
-            ws[f'A{row}'] = "Index"
-            ws[f'B{row}'] = "Value"
-            ws[f'C{row}'] = "Z-Score"
-            ws[f'D{row}'] = "Timestamp"
-            
-            for col in ['A', 'B', 'C', 'D']:
-                self._apply_style(ws[f'{col}{row}'], 'subheader')
+        if 'anomalies' in data:
+            anomalies = data['anomalies']
+            rows.append([])
             
-            row += 1
+            # Anomaly summary
+            rows.append([self._styled(ws, f"Total Anomalies Detected: {len(anomalies)}", 'subheader')])
+            rows.append([])
             
-            # Data
-            for anomaly in anomalies:
-                ws[f'A{row}'] = anomaly.get('index', '')
-                ws[f'B{row}'] = round(anomaly.get('value', 0), 2)
-                ws[f'C{row}'] = round(anomaly.get('z_score', 0), 2)
-                ws[f'D{row}'] = anomaly.get('timestamp', '')
-                row += 1
+            if anomalies:
+                # Headers
+                rows.append([self._styled(ws, header, 'subheader') for header in ("Index", "Value", "Z-Score", "Timestamp")])
+                
+                # Data
+                for anomaly in anomalies:
+                    rows.append([
+                        anomaly.get('index', ''),
+                        round(anomaly.get('value', 0), 2),
+                        round(anomaly.get('z_score', 0), 2),
+                        anomaly.get('timestamp', '')
+                    ])
+        
+        self._write_rows(ws, rows, merged='A1:F1')
     
-    def _create_recommendations_sheet(self, data: Dict) -> None:
+    def _create_recommendations_sheet(self, ws, data: Dict) -> None:
         """Create recommendations sheet"""
-        ws = self.workbook.create_sheet("Recommendations")
-        
-        ws['A1'] = "Performance Recommendations"
-        ws.merge_cells('A1:D1')
-        self._apply_style(ws['A1'], 'header')
+        rows = [[self._styled(ws, "Performance Recommendations", 'header')], []]
         
-        row = 3
+        insights = data.get('insights', {})
+        recommendations = chain(DEFAULT_RECOMMENDATIONS, insights.get('recommendations', ()))
         
-        # General recommendations
-        recommendations = [
-            "Monitor response time trends regularly",
-            "Set up alerting for performance degradation",
-            "Implement caching for frequently accessed data",
-            "Optimize database queries",
-            "Consider load balancing for high traffic",
-            "Regular performance testing in CI/CD pipeline"
-        ]
-        
-        if 'insights' in data and 'recommendations' in data['insights']:
-            recommendations.extend(data['insights']['recommendations'])
-        
-        ws[f'A{row}'] = "Recommendations"
-        self._apply_style(ws[f'A{row}'], 'subheader')
-        row += 1
+        rows.append([self._styled(ws, "Recommendations", 'subheader')])
         
         for i, rec in enumerate(recommendations, 1):
-            ws[f'A{row}'] = f"{i}."
-            ws[f'B{row}'] = rec
-            row += 1
+            rows.append([f"{i}.", rec])
         
         # Risk areas
-        if 'insights' in data and 'risk_areas' in data['insights']:
-            row += 2
-            ws[f'A{row}'] = "Risk Areas"
-            self._apply_style(ws[f'A{row}'], 'subheader')
-            row += 1
+        if 'risk_areas' in insights:
+            rows.extend([[], []])
+            rows.append([self._styled(ws, "Risk Areas", 'subheader')])
             
-            for i, risk in enumerate(data['insights']['risk_areas'], 1):
-                ws[f'A{row}'] = f"{i}."
-                ws[f'B{row}'] = risk
-                row += 1
+            for i, risk in enumerate(insights['risk_areas'], 1):
+                rows.append([f"{i}.", risk])
+        
+        self._write_rows(ws, rows, merged='A1:D1')
     
-    def _apply_style(self, cell, style_name: str) -> None:
-        """Apply predefined style to a cell"""
-        if style_name in self.styles:
-            style = self.styles[style_name]
-            if 'font' in style:
-                cell.font = style['font']
-            if 'fill' in style:
-                cell.fill = style['fill']
-            if 'alignment' in style:
-                cell.alignment = style['alignment']
-            if 'border' in style:
-                cell.border = style['border']
+    def _styled(self, ws, value, style_name: str) -> Cell:
+        """Create a cell with a predefined style, ready to append to a sheet row"""
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style_name
+        return cell
     
-    def create_raw_data_sheet(self, df: pd.DataFrame, sheet_name: str = "Raw Data") -> None:
+    def _write_rows(self, ws, rows: List[List], merged: Optional[str] = None,
+                    max_width: Optional[int] = None) -> None:
+        """
+        Append rows to a sheet in order
+        
+        Column widths are fitted from the rows before anything is written,
+        since a write-only sheet emits its column settings ahead of the data.
+        
+        Args:
+            ws: Worksheet to write
+            rows: Row value lists; cells from _styled keep their style
+            merged: Cell range to merge, e.g. the title row 'A1:F1'
+            max_width: Fit columns to their content, capped at this width
+        """
+        if max_width:
+            self._fit_columns(ws, rows, max_width)
+        
+        for row in rows:
+            ws.append(row)
+        
+        if merged:
+            if self.streaming:
+                ws.merged_cells.add(merged)
+            else:
+                ws.merge_cells(merged)
+    
+    def _fit_columns(self, ws, rows: List[List], max_width: int) -> None:
+        """Size each column to its longest value plus padding; blank columns keep the default width"""
+        widths = [0] * max(len(row) for row in rows)
+        for row in rows:
+            for i, value in enumerate(row):
+                if type(value) is Cell:
+                    value = value.value
+                length = _cell_len(value)
+                if length > widths[i]:
+                    widths[i] = length
+        
+        for i, width in enumerate(widths):
+            if width:
+                ws.column_dimensions[COLUMN_LETTERS[i]].width = min(width + 2, max_width)
+    
+    def create_raw_data_sheet(self, df: 'pd.DataFrame', sheet_name: str = "Raw Data") -> None:
         """
         Create sheet with raw performance data
         
+        In streaming mode the sheet must be added before the workbook is saved,
+        and columns are sized from the header names alone.
+        
         Args:
             df: DataFrame with raw data
             sheet_name: Name of the sheet
         """
         if self.workbook is None:
-            self.workbook = Workbook()
+            self.workbook = self._new_workbook()
             
         ws = self.workbook.create_sheet(sheet_name)
         
+        # Styled header row
+        header = [self._styled(ws, name, 'header') for name in df.columns.tolist()]
+        
+        # Column widths: header names only when streaming, otherwise the longest
+        # value per column from one vectorized pass over the frame
+        widths = [len(str(name)) for name in df.columns]
+        if not self.streaming and not df.empty:
+            value_widths = df.astype(str).apply(lambda s: s.str.len().max())
+            widths = [max(w, int(v)) for w, v in zip(widths, value_widths)]
+        
+        for letter, width in zip(COLUMN_LETTERS, widths):
+            ws.column_dimensions[letter].width = min(width + 2, 30)
+        
         # Add dataframe to sheet
-        for r in dataframe_to_rows(df, index=False, header=True):
-            ws.append(r)
-        
-        # Style header row
-        for cell in ws[1]:
-            self._apply_style(cell, 'header')
-        
-        # Auto-fit columns
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 30)
-            ws.column_dimensions[column_letter].width = adjusted_width
\ No newline at end of file
+        ws.append(header)
+        
+        # Numeric-only frames convert to Python rows in one NumPy call
+        from pandas.api.types import is_numeric_dtype
+        if all(is_numeric_dtype(dtype) for dtype in df.dtypes):
+            rows = df.to_numpy().tolist()
+        else:
+            rows = df.itertuples(index=False, name=None)
+        
+        for row in rows:
+            ws.append(row)
+    
+    def create_raw_data_sheet_fast(self, df: 'pd.DataFrame', output_path: str,
+                                   sheet_name: str = "Raw Data") -> str:
+        """
+        Write a DataFrame to its own single-sheet Excel file without openpyxl cells
+        
+        The sheet XML is generated as text and streamed into the zip package,
+        which keeps memory flat for very large dumps. Cells are unstyled: numbers
+        and booleans are stored natively, everything else as inline text, and
+        missing values are left empty.
+        
+        Args:
+            df: DataFrame with raw data
+            output_path: Path to save the Excel file
+            sheet_name: Name of the sheet
+            
+        Returns:
+            str: Path to created Excel file
+        """
+        from pandas import NA, NaT
+        missing = (NaT, NA)
+        letters = COLUMN_LETTERS[:len(df.columns)]
+        
+        with zipfile.ZipFile(output_path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr('[Content_Types].xml', _CONTENT_TYPES_XML)
+            zf.writestr('_rels/.rels', _ROOT_RELS_XML)
+            zf.writestr('xl/workbook.xml', _WORKBOOK_XML.format(name=quoteattr(sheet_name)))
+            zf.writestr('xl/_rels/workbook.xml.rels', _WORKBOOK_RELS_XML)
+            
+            with zf.open('xl/worksheets/sheet1.xml', 'w') as sheet:
+                buffer = bytearray(_SHEET_XML_START.encode())
+                rows = df.itertuples(index=False, name=None)
+                
+                for r, row in enumerate(_chain_header(df.columns, rows), 1):
+                    buffer += f'<row r="{r}">'.encode()
+                    for letter, value in zip(letters, row):
+                        buffer += _cell_xml(f'{letter}{r}', value, missing)
+                    buffer += b'</row>'
+                    
+                    if len(buffer) >= XML_FLUSH_BYTES:
+                        sheet.write(buffer)
+                        buffer.clear()
+                
+                buffer += _SHEET_XML_END.encode()
+                sheet.write(buffer)
+        
+        logger.info(f"Raw data written to {output_path} ({len(df)} rows)")
+        return output_path
@@ -1,29 +1,306 @@
 """
 PDF Report Generator Module
-Handles PDF report generation using PDFkit
+Handles PDF report generation using PDFkit or WeasyPrint
 """
 
-import pdfkit
-from jinja2 import Template
+from jinja2 import DictLoader, Environment
+from markupsafe import Markup
 from typing import Dict, List, Optional
+import numbers
 import os
+import tempfile
 import logging
 from datetime import datetime
+from importlib.util import find_spec
+
+# PDF engines are imported where they are used; only check WeasyPrint is installed
+WEASYPRINT_AVAILABLE = find_spec('weasyprint') is not None
 
 logger = logging.getLogger(__name__)
 
+# Shared document shell; report bodies are rendered as fragments and wrapped
+# in it, separated by page breaks when several reports share one document
+_DOCUMENT_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>{{ title }}</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { background-color: #2c3e50; color: white; padding: 20px; text-align: center; }
+        .section { margin: 20px 0; }
+        .metric { background-color: #f8f9fa; padding: 15px; margin: 10px 0; border-radius: 5px; }
+        .metric-title { font-weight: bold; color: #2c3e50; }
+        .metric-value { font-size: 18px; color: #27ae60; }
+        .error { color: #e74c3c; }
+        .warning { color: #f39c12; }
+        .success { color: #27ae60; }
+        table { width: 100%; border-collapse: collapse; margin: 10px 0; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+        .chart-container { margin: 20px 0; }
+        .summary-box { background-color: #ecf0f1; padding: 20px; margin: 20px 0; border-radius: 5px; }
+        .key-metric { font-size: 24px; font-weight: bold; color: #2c3e50; }
+        .status { padding: 5px 10px; border-radius: 3px; color: white; }
+        .status.pass { background-color: #27ae60; }
+        .status.fail { background-color: #e74c3c; }
+        .status.warning { background-color: #f39c12; }
+    </style>
+</head>
+<body>
+{% for fragment in fragments %}
+{% if not loop.first %}<div style="page-break-before: always"></div>{% endif %}
+{{ fragment }}
+{% endfor %}
+</body>
+</html>
+"""
+
+_PERFORMANCE_HTML = """
+<div class="header">
+    <h1>Performance Test Report</h1>
+    <p>Generated on {{ generation_time }}</p>
+</div>
+
+<div class="section">
+    <h2>Test Overview</h2>
+    <div class="metric">
+        <div class="metric-title">Test Duration</div>
+        <div class="metric-value">{{ test_duration }}</div>
+    </div>
+    <div class="metric">
+        <div class="metric-title">Total Requests</div>
+        <div class="metric-value">{{ total_requests }}</div>
+    </div>
+    <div class="metric">
+        <div class="metric-title">Error Rate</div>
+        <div class="metric-value {{ error_rate_class }}">{{ error_rate }}%</div>
+    </div>
+</div>
+
+<div class="section">
+    <h2>Response Time Analysis</h2>
+    <table>
+        <tr>
+            <th>Metric</th>
+            <th>Value (ms)</th>
+        </tr>
+        <tr><td>Minimum</td><td>{{ response_time.min|ms }}</td></tr>
+        <tr><td>Maximum</td><td>{{ response_time.max|ms }}</td></tr>
+        <tr><td>Average</td><td>{{ response_time.mean|ms }}</td></tr>
+        <tr><td>Median</td><td>{{ response_time.median|ms }}</td></tr>
+        <tr><td>90th Percentile</td><td>{{ response_time.p90|ms }}</td></tr>
+        <tr><td>95th Percentile</td><td>{{ response_time.p95|ms }}</td></tr>
+        <tr><td>99th Percentile</td><td>{{ response_time.p99|ms }}</td></tr>
+    </table>
+</div>
+
+<div class="section">
+    <h2>Throughput Analysis</h2>
+    <table>
+        <tr>
+            <th>Metric</th>
+            <th>Value</th>
+        </tr>
+        <tr><td>Average RPS</td><td>{{ throughput.mean }}</td></tr>
+        <tr><td>Peak RPS</td><td>{{ throughput.max }}</td></tr>
+        <tr><td>Total Requests</td><td>{{ throughput.total_requests }}</td></tr>
+    </table>
+</div>
+
+{% if anomalies %}
+<div class="section">
+    <h2>Anomalies Detected</h2>
+    <table>
+        <tr>
+            <th>Timestamp</th>
+            <th>Value</th>
+            <th>Z-Score</th>
+        </tr>
+        {% for anomaly in anomalies %}
+        <tr>
+            <td>{{ anomaly.timestamp }}</td>
+            <td>{{ anomaly.value }}</td>
+            <td>{{ anomaly.z_score }}</td>
+        </tr>
+        {% endfor %}
+    </table>
+</div>
+{% endif %}
+
+<div class="section">
+    <h2>Recommendations</h2>
+    <ul>
+        {% for recommendation in recommendations %}
+        <li>{{ recommendation }}</li>
+        {% endfor %}
+    </ul>
+</div>
+"""
+
+_EXECUTIVE_HTML = """
+<div class="header">
+    <h1>Executive Summary</h1>
+    <p>Performance Test Results</p>
+</div>
+
+<div class="summary-box">
+    <h2>Overall Status</h2>
+    <div class="status {{ overall_status }}">{{ overall_status.upper() }}</div>
+</div>
+
+<div class="summary-box">
+    <h2>Key Metrics</h2>
+    <div class="key-metric">Average Response Time: {{ avg_response_time|ms }}ms</div>
+    <div class="key-metric">Throughput: {{ throughput }} RPS</div>
+    <div class="key-metric">Error Rate: {{ error_rate }}%</div>
+</div>
+
+<div class="summary-box">
+    <h2>Key Findings</h2>
+    <ul>
+        {% for finding in key_findings %}
+        <li>{{ finding }}</li>
+        {% endfor %}
+    </ul>
+</div>
+
+<div class="summary-box">
+    <h2>Recommendations</h2>
+    <ul>
+        {% for recommendation in recommendations %}
+        <li>{{ recommendation }}</li>
+        {% endfor %}
+    </ul>
+</div>
+"""
+
+_LOG_ANALYSIS_HTML = """
+<div class="header">
+    <h1>Log Analysis Report</h1>
+    <p>Generated on {{ generation_time }}</p>
+</div>
+
+<div class="section">
+    <h2>Log Summary</h2>
+    <div class="metric">
+        <strong>Total Entries:</strong> {{ total_entries }}
+    </div>
+    <div class="metric">
+        <strong>Error Rate:</strong> {{ error_rate }}%
+    </div>
+    <div class="metric">
+        <strong>Time Range:</strong> {{ time_range }}
+    </div>
+</div>
+
+<div class="section">
+    <h2>Error Analysis</h2>
+    <table>
+        <tr>
+            <th>Error Message</th>
+            <th>Count</th>
+        </tr>
+        {% for error in top_errors %}
+        <tr>
+            <td>{{ error.message }}</td>
+            <td>{{ error.count }}</td>
+        </tr>
+        {% endfor %}
+    </table>
+</div>
+
+<div class="section">
+    <h2>Performance Analysis</h2>
+    <table>
+        <tr>
+            <th>Metric</th>
+            <th>Value</th>
+        </tr>
+        <tr><td>Average Response Time</td><td>{{ avg_response_time|ms }}ms</td></tr>
+        <tr><td>Max Response Time</td><td>{{ max_response_time|ms }}ms</td></tr>
+        <tr><td>Min Response Time</td><td>{{ min_response_time|ms }}ms</td></tr>
+    </table>
+</div>
+
+{% if anomalies %}
+<div class="section">
+    <h2>Detected Anomalies</h2>
+    <table>
+        <tr>
+            <th>Timestamp</th>
+            <th>Value</th>
+            <th>Z-Score</th>
+        </tr>
+        {% for anomaly in anomalies %}
+        <tr>
+            <td>{{ anomaly.timestamp }}</td>
+            <td>{{ anomaly.value }}</td>
+            <td>{{ anomaly.z_score }}</td>
+        </tr>
+        {% endfor %}
+    </table>
+</div>
+{% endif %}
+"""
+
+def _generation_time() -> str:
+    """Timestamp printed in report headers"""
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+# Placeholder marking where a streamed report body goes in the document shell
+_FRAGMENT_SLOT = '<!-- report body -->'
+
+# Log analysis reports with more table rows than this are streamed through a temp file
+STREAM_TABLE_ROWS = 1000
+
+def _format_ms(value):
+    """Template filter showing a millisecond value with two decimals; non-numbers pass through"""
+    if isinstance(value, numbers.Real) and not isinstance(value, bool):
+        return f'{value:.2f}'
+    return value
+
+# Report templates are compiled once at import and reused for every render;
+# autoescape keeps log messages and other free text from breaking the markup
+_TEMPLATE_ENV = Environment(
+    loader=DictLoader({
+        'document': _DOCUMENT_HTML,
+        'performance': _PERFORMANCE_HTML,
+        'executive': _EXECUTIVE_HTML,
+        'log_analysis': _LOG_ANALYSIS_HTML
+    }),
+    autoescape=True,
+    auto_reload=False,
+    cache_size=-1
+)
+_TEMPLATE_ENV.filters['ms'] = _format_ms
+
+_DOCUMENT_TEMPLATE = _TEMPLATE_ENV.get_template('document')
+_PERFORMANCE_TEMPLATE = _TEMPLATE_ENV.get_template('performance')
+_EXECUTIVE_TEMPLATE = _TEMPLATE_ENV.get_template('executive')
+_LOG_ANALYSIS_TEMPLATE = _TEMPLATE_ENV.get_template('log_analysis')
+
 class PDFReportGenerator:
     """Generates PDF reports for performance test analysis"""
     
-    def __init__(self, wkhtmltopdf_path: Optional[str] = None):
+    def __init__(self, wkhtmltopdf_path: Optional[str] = None, use_weasyprint: bool = False):
         """
         Initialize PDF generator
         
         Args:
             wkhtmltopdf_path: Path to wkhtmltopdf executable
+            use_weasyprint: Render in-process with WeasyPrint instead of starting
+                a wkhtmltopdf process for every report
         """
+        if use_weasyprint and not WEASYPRINT_AVAILABLE:
+            raise ImportError("use_weasyprint requires the weasyprint package")
+        
+        self.use_weasyprint = use_weasyprint
         self.wkhtmltopdf_path = wkhtmltopdf_path
-        self.config = pdfkit.configuration(wkhtmltopdf=wkhtmltopdf_path) if wkhtmltopdf_path else None
+        self.config = None
+        if wkhtmltopdf_path:
+            import pdfkit
+            self.config = pdfkit.configuration(wkhtmltopdf=wkhtmltopdf_path)
         
     def generate_performance_report(self, data: Dict, output_path: str) -> str:
         """
@@ -38,7 +315,7 @@ class PDFReportGenerator:
         """
         try:
             html_content = self._create_performance_html(data)
-            pdfkit.from_string(html_content, output_path, configuration=self.config)
+            self._write_pdf(html_content, output_path)
             logger.info(f"Performance report generated: {output_path}")
             return output_path
         except Exception as e:
@@ -58,7 +335,7 @@ class PDFReportGenerator:
         """
         try:
             html_content = self._create_executive_html(data)
-            pdfkit.from_string(html_content, output_path, configuration=self.config)
+            self._write_pdf(html_content, output_path)
             logger.info(f"Executive summary generated: {output_path}")
             return output_path
         except Exception as e:
@@ -77,124 +354,104 @@ class PDFReportGenerator:
             str: Path to generated PDF file
         """
         try:
-            html_content = self._create_log_analysis_html(log_data)
-            pdfkit.from_string(html_content, output_path, configuration=self.config)
+            template_data = self._log_analysis_data(log_data)
+            if len(template_data['anomalies']) + len(template_data['top_errors']) > STREAM_TABLE_ROWS:
+                self._write_pdf_streamed("Log Analysis Report", _LOG_ANALYSIS_TEMPLATE, template_data, output_path)
+            else:
+                html_content = self._wrap_document("Log Analysis Report", [_LOG_ANALYSIS_TEMPLATE.render(**template_data)])
+                self._write_pdf(html_content, output_path)
             logger.info(f"Log analysis report generated: {output_path}")
             return output_path
         except Exception as e:
             logger.error(f"Error generating log analysis report: {str(e)}")
             raise
     
-    def _create_performance_html(self, data: Dict) -> str:
-        """Create HTML content for performance report"""
-        template = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Performance Test Report</title>
-            <style>
-                body { font-family: Arial, sans-serif; margin: 20px; }
-                .header { background-color: #2c3e50; color: white; padding: 20px; text-align: center; }
-                .section { margin: 20px 0; }
-                .metric { background-color: #f8f9fa; padding: 15px; margin: 10px 0; border-radius: 5px; }
-                .metric-title { font-weight: bold; color: #2c3e50; }
-                .metric-value { font-size: 18px; color: #27ae60; }
-                .error { color: #e74c3c; }
-                .warning { color: #f39c12; }
-                .success { color: #27ae60; }
-                table { width: 100%; border-collapse: collapse; margin: 10px 0; }
-                th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
-                th { background-color: #f2f2f2; }
-                .chart-container { margin: 20px 0; }
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>Performance Test Report</h1>
-                <p>Generated on {{ generation_time }}</p>
-            </div>
-            
-            <div class="section">
-                <h2>Test Overview</h2>
-                <div class="metric">
-                    <div class="metric-title">Test Duration</div>
-                    <div class="metric-value">{{ test_duration }}</div>
-                </div>
-                <div class="metric">
-                    <div class="metric-title">Total Requests</div>
-                    <div class="metric-value">{{ total_requests }}</div>
-                </div>
-                <div class="metric">
-                    <div class="metric-title">Error Rate</div>
-                    <div class="metric-value {{ error_rate_class }}">{{ error_rate }}%</div>
-                </div>
-            </div>
-            
-            <div class="section">
-                <h2>Response Time Analysis</h2>
-                <table>
-                    <tr>
-                        <th>Metric</th>
-                        <th>Value (ms)</th>
-                    </tr>
-                    <tr><td>Minimum</td><td>{{ response_time.min }}</td></tr>
-                    <tr><td>Maximum</td><td>{{ response_time.max }}</td></tr>
-                    <tr><td>Average</td><td>{{ response_time.mean }}</td></tr>
-                    <tr><td>Median</td><td>{{ response_time.median }}</td></tr>
-                    <tr><td>90th Percentile</td><td>{{ response_time.p90 }}</td></tr>
-                    <tr><td>95th Percentile</td><td>{{ response_time.p95 }}</td></tr>
-                    <tr><td>99th Percentile</td><td>{{ response_time.p99 }}</td></tr>
-                </table>
-            </div>
-            
-            <div class="section">
-                <h2>Throughput Analysis</h2>
-                <table>
-                    <tr>
-                        <th>Metric</th>
-                        <th>Value</th>
-                    </tr>
-                    <tr><td>Average RPS</td><td>{{ throughput.mean }}</td></tr>
-                    <tr><td>Peak RPS</td><td>{{ throughput.max }}</td></tr>
-                    <tr><td>Total Requests</td><td>{{ throughput.total_requests }}</td></tr>
-                </table>
-            </div>
+    def _write_pdf(self, html_content: str, output_path: str) -> None:
+        """Render HTML content to a PDF file with the configured engine"""
+        if self.use_weasyprint:
+            from weasyprint import HTML
+            HTML(string=html_content).write_pdf(output_path)
+        else:
+            import pdfkit
+            pdfkit.from_string(html_content, output_path, configuration=self.config)
+    
+    def generate_combined_report(self, perf_data: Optional[Dict], exec_data: Optional[Dict],
+                                 log_data: Optional[Dict], output_path: str) -> str:
+        """
+        Generate the performance, executive and log analysis reports as one PDF
+        
+        The reports share one HTML document, each starting on a new page, so the
+        PDF engine is started and the stylesheet parsed only once.
+        
+        Args:
+            perf_data: Performance test data and metrics, or None to omit
+            exec_data: Summary data, or None to omit
+            log_data: Log analysis data, or None to omit
+            output_path: Path to save the PDF file
             
-            {% if anomalies %}
-            <div class="section">
-                <h2>Anomalies Detected</h2>
-                <table>
-                    <tr>
-                        <th>Timestamp</th>
-                        <th>Value</th>
-                        <th>Z-Score</th>
-                    </tr>
-                    {% for anomaly in anomalies %}
-                    <tr>
-                        <td>{{ anomaly.timestamp }}</td>
-                        <td>{{ anomaly.value }}</td>
-                        <td>{{ anomaly.z_score }}</td>
-                    </tr>
-                    {% endfor %}
-                </table>
-            </div>
-            {% endif %}
+        Returns:
+            str: Path to generated PDF file
+        """
+        try:
+            generation_time = _generation_time()
+            fragments = []
+            if exec_data is not None:
+                fragments.append(self._executive_fragment(exec_data))
+            if perf_data is not None:
+                fragments.append(self._performance_fragment(perf_data, generation_time))
+            if log_data is not None:
+                fragments.append(self._log_analysis_fragment(log_data, generation_time))
             
-            <div class="section">
-                <h2>Recommendations</h2>
-                <ul>
-                    {% for recommendation in recommendations %}
-                    <li>{{ recommendation }}</li>
-                    {% endfor %}
-                </ul>
-            </div>
-        </body>
-        </html>
+            html_content = self._wrap_document("Performance Test Report", fragments)
+            self._write_pdf(html_content, output_path)
+            logger.info(f"Combined report generated: {output_path}")
+            return output_path
+        except Exception as e:
+            logger.error(f"Error generating combined report: {str(e)}")
+            raise
+    
+    def _write_pdf_streamed(self, title: str, template, template_data: Dict, output_path: str) -> None:
+        """
+        Render a report through a temporary HTML file instead of an in-memory string
+        
+        The template output is written chunk by chunk and the PDF engine reads
+        the file, so a report with very large tables is never held as one string.
+        
+        Args:
+            title: Document title
+            template: Compiled report body template
+            template_data: Variables for the template
+            output_path: Path to save the PDF file
         """
+        head, tail = self._wrap_document(title, [_FRAGMENT_SLOT]).split(_FRAGMENT_SLOT)
+        with tempfile.NamedTemporaryFile('w', suffix='.html', encoding='utf-8', delete=False) as html_file:
+            html_file.write(head)
+            html_file.writelines(template.generate(**template_data))
+            html_file.write(tail)
         
+        try:
+            if self.use_weasyprint:
+                from weasyprint import HTML
+                HTML(filename=html_file.name).write_pdf(output_path)
+            else:
+                import pdfkit
+                pdfkit.from_file(html_file.name, output_path, configuration=self.config)
+        finally:
+            os.remove(html_file.name)
+    
+    def _wrap_document(self, title: str, fragments: List[str]) -> str:
+        """Wrap rendered report bodies in the shared HTML document, one page each"""
+        return _DOCUMENT_TEMPLATE.render(title=title, fragments=[Markup(f) for f in fragments])
+    
+    def _create_performance_html(self, data: Dict) -> str:
+        """Create HTML content for performance report"""
+        return self._wrap_document("Performance Test Report", [self._performance_fragment(data)])
+    
+    def _performance_fragment(self, data: Dict, generation_time: Optional[str] = None) -> str:
+        """Render the body of the performance report, stamped with generation_time (default now)"""
         # Prepare template data
         template_data = {
-            'generation_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'generation_time': generation_time or _generation_time(),
             'test_duration': data.get('test_duration', 'N/A'),
             'total_requests': data.get('total_requests', 0),
             'error_rate': data.get('error_rate', 0),
@@ -205,65 +462,14 @@ class PDFReportGenerator:
             'recommendations': data.get('recommendations', [])
         }
         
-        return Template(template).render(**template_data)
+        return _PERFORMANCE_TEMPLATE.render(**template_data)
     
     def _create_executive_html(self, data: Dict) -> str:
         """Create HTML content for executive summary"""
-        template = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Executive Summary</title>
-            <style>
-                body { font-family: Arial, sans-serif; margin: 20px; }
-                .header { background-color: #2c3e50; color: white; padding: 20px; text-align: center; }
-                .summary-box { background-color: #ecf0f1; padding: 20px; margin: 20px 0; border-radius: 5px; }
-                .key-metric { font-size: 24px; font-weight: bold; color: #2c3e50; }
-                .status { padding: 5px 10px; border-radius: 3px; color: white; }
-                .status.pass { background-color: #27ae60; }
-                .status.fail { background-color: #e74c3c; }
-                .status.warning { background-color: #f39c12; }
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>Executive Summary</h1>
-                <p>Performance Test Results</p>
-            </div>
-            
-            <div class="summary-box">
-                <h2>Overall Status</h2>
-                <div class="status {{ overall_status }}">{{ overall_status.upper() }}</div>
-            </div>
-            
-            <div class="summary-box">
-                <h2>Key Metrics</h2>
-                <div class="key-metric">Average Response Time: {{ avg_response_time }}ms</div>
-                <div class="key-metric">Throughput: {{ throughput }} RPS</div>
-                <div class="key-metric">Error Rate: {{ error_rate }}%</div>
-            </div>
-            
-            <div class="summary-box">
-                <h2>Key Findings</h2>
-                <ul>
-                    {% for finding in key_findings %}
-                    <li>{{ finding }}</li>
-                    {% endfor %}
-                </ul>
-            </div>
-            
-            <div class="summary-box">
-                <h2>Recommendations</h2>
-                <ul>
-                    {% for recommendation in recommendations %}
-                    <li>{{ recommendation }}</li>
-                    {% endfor %}
-                </ul>
-            </div>
-        </body>
-        </html>
-        """
-        
+        return self._wrap_document("Executive Summary", [self._executive_fragment(data)])
+    
+    def _executive_fragment(self, data: Dict) -> str:
+        """Render the body of the executive summary"""
         template_data = {
             'overall_status': data.get('overall_status', 'pass'),
             'avg_response_time': data.get('avg_response_time', 0),
@@ -273,98 +479,20 @@ class PDFReportGenerator:
             'recommendations': data.get('recommendations', [])
         }
         
-        return Template(template).render(**template_data)
+        return _EXECUTIVE_TEMPLATE.render(**template_data)
     
     def _create_log_analysis_html(self, log_data: Dict) -> str:
         """Create HTML content for log analysis report"""
-        template = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Log Analysis Report</title>
-            <style>
-                body { font-family: Arial, sans-serif; margin: 20px; }
-                .header { background-color: #2c3e50; color: white; padding: 20px; text-align: center; }
-                .section { margin: 20px 0; }
-                .metric { background-color: #f8f9fa; padding: 15px; margin: 10px 0; border-radius: 5px; }
-                table { width: 100%; border-collapse: collapse; margin: 10px 0; }
-                th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
-                th { background-color: #f2f2f2; }
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>Log Analysis Report</h1>
-                <p>Generated on {{ generation_time }}</p>
-            </div>
-            
-            <div class="section">
-                <h2>Log Summary</h2>
-                <div class="metric">
-                    <strong>Total Entries:</strong> {{ total_entries }}
-                </div>
-                <div class="metric">
-                    <strong>Error Rate:</strong> {{ error_rate }}%
-                </div>
-                <div class="metric">
-                    <strong>Time Range:</strong> {{ time_range }}
-                </div>
-            </div>
-            
-            <div class="section">
-                <h2>Error Analysis</h2>
-                <table>
-                    <tr>
-                        <th>Error Message</th>
-                        <th>Count</th>
-                    </tr>
-                    {% for error in top_errors %}
-                    <tr>
-                        <td>{{ error.message }}</td>
-                        <td>{{ error.count }}</td>
-                    </tr>
-                    {% endfor %}
-                </table>
-            </div>
-            
-            <div class="section">
-                <h2>Performance Analysis</h2>
-                <table>
-                    <tr>
-                        <th>Metric</th>
-                        <th>Value</th>
-                    </tr>
-                    <tr><td>Average Response Time</td><td>{{ avg_response_time }}ms</td></tr>
-                    <tr><td>Max Response Time</td><td>{{ max_response_time }}ms</td></tr>
-                    <tr><td>Min Response Time</td><td>{{ min_response_time }}ms</td></tr>
-                </table>
-            </div>
-            
-            {% if anomalies %}
-            <div class="section">
-                <h2>Detected Anomalies</h2>
-                <table>
-                    <tr>
-                        <th>Timestamp</th>
-                        <th>Value</th>
-                        <th>Z-Score</th>
-                    </tr>
-                    {% for anomaly in anomalies %}
-                    <tr>
-                        <td>{{ anomaly.timestamp }}</td>
-                        <td>{{ anomaly.value }}</td>
-                        <td>{{ anomaly.z_score }}</td>
-                    </tr>
-                    {% endfor %}
-                </table>
-            </div>
-            {% endif %}
-        </body>
-        </html>
-        """
-        
-        template_data = {
-            'generation_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        return self._wrap_document("Log Analysis Report", [self._log_analysis_fragment(log_data)])
+    
+    def _log_analysis_fragment(self, log_data: Dict, generation_time: Optional[str] = None) -> str:
+        """Render the body of the log analysis report, stamped with generation_time (default now)"""
+        return _LOG_ANALYSIS_TEMPLATE.render(**self._log_analysis_data(log_data, generation_time))
+    
+    def _log_analysis_data(self, log_data: Dict, generation_time: Optional[str] = None) -> Dict:
+        """Template variables for the log analysis report"""
+        return {
+            'generation_time': generation_time or _generation_time(),
             'total_entries': log_data.get('total_entries', 0),
             'error_rate': log_data.get('error_rate', 0),
             'time_range': log_data.get('time_range', 'N/A'),
@@ -373,6 +501,4 @@ class PDFReportGenerator:
             'max_response_time': log_data.get('max_response_time', 0),
             'min_response_time': log_data.get('min_response_time', 0),
             'anomalies': log_data.get('anomalies', [])
-        }
-        
-        return Template(template).render(**template_data)
\ No newline at end of file
+        }
\ No newline at end of file
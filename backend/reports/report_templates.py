@@ -3,17 +3,36 @@ Report Templates Module
 Contains HTML and text templates for generating performance reports
 """
 
-from typing import Dict, Any
+import re
+from typing import Dict, Any, Iterable, Tuple
 from datetime import datetime
 
+from jinja2 import Environment
 
-class ReportTemplates:
-    """HTML and text templates for performance reports"""
-    
-    @staticmethod
-    def get_html_template() -> str:
-        """Get HTML template for performance reports"""
-        return """
+
+_STYLE_BLOCK = re.compile(r'(<style>)(.*?)(</style>)', re.S)
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE_AROUND = re.compile(r'\s*([{};])\s*')
+_CSS_SPACE_AFTER = re.compile(r'([:,])\s+')
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and optional whitespace from a stylesheet"""
+    css = _CSS_COMMENT.sub('', css)
+    css = ' '.join(css.split())
+    css = _CSS_SPACE_AROUND.sub(r'\1', css)
+    css = _CSS_SPACE_AFTER.sub(r'\1', css)
+    return css.replace(';}', '}')
+
+
+def _minify_styles(html: str) -> str:
+    """Minify the CSS of every <style> block in an HTML source"""
+    return _STYLE_BLOCK.sub(lambda m: m.group(1) + _minify_css(m.group(2)) + m.group(3), html)
+
+
+# Template sources; the HTML report's *_rows/*_content slots take HTML built
+# by the format_* helpers and are marked safe so autoescape leaves them intact
+_HTML_SOURCE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -207,7 +226,7 @@ class ReportTemplates:
                             </tr>
                         </thead>
                         <tbody>
-                            {{ performance_metrics_rows }}
+                            {{ performance_metrics_rows|safe }}
                         </tbody>
                     </table>
                 </div>
@@ -216,7 +235,7 @@ class ReportTemplates:
             <!-- Error Analysis -->
             <div class="section">
                 <h2>🚨 Error Analysis</h2>
-                {{ error_alerts }}
+                {{ error_alerts|safe }}
                 <div class="table-container">
                     <table>
                         <thead>
@@ -227,7 +246,7 @@ class ReportTemplates:
                             </tr>
                         </thead>
                         <tbody>
-                            {{ error_analysis_rows }}
+                            {{ error_analysis_rows|safe }}
                         </tbody>
                     </table>
                 </div>
@@ -239,13 +258,13 @@ class ReportTemplates:
                 <div class="chart-placeholder">
                     Response Time Trend Chart (Placeholder)
                 </div>
-                {{ insights_content }}
+                {{ insights_content|safe }}
             </div>
 
             <!-- Recommendations -->
             <div class="section">
                 <h2>💡 Recommendations</h2>
-                {{ recommendations_content }}
+                {{ recommendations_content|safe }}
             </div>
         </div>
         
@@ -257,11 +276,11 @@ class ReportTemplates:
 </body>
 </html>
         """
-    
-    @staticmethod
-    def get_executive_summary_template() -> str:
-        """Get executive summary template"""
-        return """
+
+# Minified once at import; every generated report embeds the stylesheet
+_HTML_SOURCE = _minify_styles(_HTML_SOURCE)
+
+_EXECUTIVE_SUMMARY_SOURCE = """
 # Performance Test Executive Summary
 
 **Report Date:** {{ report_date }}
@@ -289,11 +308,8 @@ class ReportTemplates:
 ---
 *Generated by Smart Test Insight Generator*
         """
-    
-    @staticmethod
-    def get_detailed_report_template() -> str:
-        """Get detailed performance report template"""
-        return """
+
+_DETAILED_REPORT_SOURCE = """
 # Detailed Performance Analysis Report
 
 Generated: {{ report_date }}
@@ -351,68 +367,8 @@ Generated: {{ report_date }}
 ---
 *Detailed analysis generated by Smart Test Insight Generator*
         """
-    
-    @staticmethod
-    def format_metric_row(metric: str, value: Any, status: str = "OK") -> str:
-        """Format a metric row for HTML table"""
-        status_class = {
-            "OK": "alert-success",
-            "WARNING": "alert-warning", 
-            "CRITICAL": "alert-danger"
-        }.get(status, "")
-        
-        return f"""
-            <tr>
-                <td>{metric}</td>
-                <td>{value}</td>
-                <td><span class="alert {status_class}">{status}</span></td>
-            </tr>
-        """
-    
-    @staticmethod
-    def format_error_alert(message: str, alert_type: str = "warning") -> str:
-        """Format error alert for HTML"""
-        return f'<div class="alert alert-{alert_type}">{message}</div>'
-    
-    @staticmethod
-    def format_recommendations_list(recommendations: list) -> str:
-        """Format recommendations as HTML list"""
-        if not recommendations:
-            return "<p>No specific recommendations at this time.</p>"
-        
-        html = "<ul>"
-        for rec in recommendations:
-            html += f"<li>{rec}</li>"
-        html += "</ul>"
-        return html
-    
-    @staticmethod
-    def format_insights_content(insights: Dict) -> str:
-        """Format insights content for HTML"""
-        content = ""
-        
-        if 'key_findings' in insights and insights['key_findings']:
-            content += "<h3>🔍 Key Findings</h3><ul>"
-            for finding in insights['key_findings']:
-                content += f"<li>{finding}</li>"
-            content += "</ul>"
-        
-        if 'risk_areas' in insights and insights['risk_areas']:
-            content += "<h3>⚠️ Risk Areas</h3><ul>"
-            for risk in insights['risk_areas']:
-                content += f"<li>{risk}</li>"
-            content += "</ul>"
-        
-        return content if content else "<p>No specific insights available.</p>"
 
-
-class EmailTemplates:
-    """Email templates for automated reporting"""
-    
-    @staticmethod
-    def get_alert_template() -> str:
-        """Get email alert template"""
-        return """
+_ALERT_EMAIL_SOURCE = """
 Subject: 🚨 Performance Test Alert - {{ alert_type }}
 
 Dear Team,
@@ -439,11 +395,8 @@ Please investigate immediately if this is a critical alert.
 Best regards,
 Smart Test Insight Generator
         """
-    
-    @staticmethod
-    def get_daily_summary_template() -> str:
-        """Get daily summary email template"""
-        return """
+
+_DAILY_SUMMARY_EMAIL_SOURCE = """
 Subject: 📊 Daily Performance Summary - {{ date }}
 
 Hello Team,
@@ -465,4 +418,145 @@ View the full report: {{ report_link }}
 
 Best regards,
 Smart Test Insight Generator
-        """ 
\ No newline at end of file
+        """
+
+# Performance table rows, rendered over the whole list at once
+_METRIC_ROWS_SOURCE = (
+    "{% for metric, value, status in rows %}"
+    "<tr><td>{{ metric }}</td><td>{{ value }}</td>"
+    "<td><span class=\"alert {{ status_class.get(status, '') }}\">{{ status }}</span></td></tr>"
+    "{% endfor %}"
+)
+
+# Insight sections, one heading and bullet list per non-empty section
+_INSIGHTS_SOURCE = (
+    "{% for title, items in sections %}"
+    "<h3>{{ title }}</h3><ul>"
+    "{% for item in items %}<li>{{ item }}</li>{% endfor %}"
+    "</ul>"
+    "{% endfor %}"
+)
+
+# Alert box and recommendations list fragments
+_ERROR_ALERT_SOURCE = '<div class="alert alert-{{ alert_type }}">{{ message }}</div>'
+_RECOMMENDATIONS_SOURCE = (
+    "{% if recommendations %}"
+    "<ul>{% for rec in recommendations %}<li>{{ rec }}</li>{% endfor %}</ul>"
+    "{% else %}<p>No specific recommendations at this time.</p>{% endif %}"
+)
+
+# Insight keys rendered as HTML sections, in display order
+_INSIGHT_SECTIONS = [
+    ("key_findings", "🔍 Key Findings"),
+    ("risk_areas", "⚠️ Risk Areas")
+]
+
+# CSS class of each metric status in the HTML report
+STATUS_CLASS = {
+    "OK": "alert-success",
+    "WARNING": "alert-warning",
+    "CRITICAL": "alert-danger"
+}
+
+# HTML is autoescaped, the markdown and email text templates are not
+_HTML_ENV = Environment(autoescape=True, auto_reload=False, cache_size=-1)
+_TEXT_ENV = Environment(autoescape=False, auto_reload=False, cache_size=-1)
+
+# Templates compiled once at import, keyed by name
+TEMPLATES = {
+    'html_report': _HTML_ENV.from_string(_HTML_SOURCE),
+    'metric_rows': _HTML_ENV.from_string(_METRIC_ROWS_SOURCE),
+    'insights': _HTML_ENV.from_string(_INSIGHTS_SOURCE),
+    'error_alert': _HTML_ENV.from_string(_ERROR_ALERT_SOURCE),
+    'recommendations': _HTML_ENV.from_string(_RECOMMENDATIONS_SOURCE),
+    'executive_summary': _TEXT_ENV.from_string(_EXECUTIVE_SUMMARY_SOURCE),
+    'detailed_report': _TEXT_ENV.from_string(_DETAILED_REPORT_SOURCE),
+    'alert_email': _TEXT_ENV.from_string(_ALERT_EMAIL_SOURCE),
+    'daily_summary_email': _TEXT_ENV.from_string(_DAILY_SUMMARY_EMAIL_SOURCE)
+}
+
+
+class ReportTemplates:
+    """HTML and text templates for performance reports"""
+    
+    @staticmethod
+    def get_html_template() -> str:
+        """Get HTML template for performance reports"""
+        return _HTML_SOURCE
+    
+    @staticmethod
+    def get_executive_summary_template() -> str:
+        """Get executive summary template"""
+        return _EXECUTIVE_SUMMARY_SOURCE
+    
+    @staticmethod
+    def get_detailed_report_template() -> str:
+        """Get detailed performance report template"""
+        return _DETAILED_REPORT_SOURCE
+    
+    @staticmethod
+    def render_html(context: Dict[str, Any]) -> str:
+        """Render the HTML performance report"""
+        return TEMPLATES['html_report'].render(**context)
+    
+    @staticmethod
+    def render_executive_summary(context: Dict[str, Any]) -> str:
+        """Render the markdown executive summary"""
+        return TEMPLATES['executive_summary'].render(**context)
+    
+    @staticmethod
+    def render_detailed_report(context: Dict[str, Any]) -> str:
+        """Render the markdown detailed performance report"""
+        return TEMPLATES['detailed_report'].render(**context)
+    
+    @staticmethod
+    def format_metric_row(metric: str, value: Any, status: str = "OK") -> str:
+        """Format a metric row for HTML table"""
+        return ReportTemplates.format_metric_rows([(metric, value, status)])
+    
+    @staticmethod
+    def format_metric_rows(rows: Iterable[Tuple[str, Any, str]]) -> str:
+        """Format (metric, value, status) tuples as HTML table rows in one render"""
+        return TEMPLATES['metric_rows'].render(rows=rows, status_class=STATUS_CLASS)
+    
+    @staticmethod
+    def format_error_alert(message: str, alert_type: str = "warning") -> str:
+        """Format error alert for HTML"""
+        return TEMPLATES['error_alert'].render(message=message, alert_type=alert_type)
+    
+    @staticmethod
+    def format_recommendations_list(recommendations: list) -> str:
+        """Format recommendations as HTML list"""
+        return TEMPLATES['recommendations'].render(recommendations=recommendations)
+    
+    @staticmethod
+    def format_insights_content(insights: Dict) -> str:
+        """Format insights content for HTML"""
+        sections = [(title, insights[key]) for key, title in _INSIGHT_SECTIONS if insights.get(key)]
+        if not sections:
+            return "<p>No specific insights available.</p>"
+        return TEMPLATES['insights'].render(sections=sections)
+
+
+class EmailTemplates:
+    """Email templates for automated reporting"""
+    
+    @staticmethod
+    def get_alert_template() -> str:
+        """Get email alert template"""
+        return _ALERT_EMAIL_SOURCE
+    
+    @staticmethod
+    def get_daily_summary_template() -> str:
+        """Get daily summary email template"""
+        return _DAILY_SUMMARY_EMAIL_SOURCE
+    
+    @staticmethod
+    def render_alert(context: Dict[str, Any]) -> str:
+        """Render the alert email"""
+        return TEMPLATES['alert_email'].render(**context)
+    
+    @staticmethod
+    def render_daily_summary(context: Dict[str, Any]) -> str:
+        """Render the daily summary email"""
+        return TEMPLATES['daily_summary_email'].render(**context) 
\ No newline at end of file
@@ -5,17 +5,167 @@ Utility functions for file I/O operations
 
 import os
 import json
+import math
+import time
+import fnmatch
 import csv
-import pandas as pd
-from typing import Dict, List, Any, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Union
 from pathlib import Path
 import logging
+from functools import lru_cache
+from importlib.util import find_spec
 from datetime import datetime
 import zipfile
 import shutil
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    # Datetimes pass through to default=str so they are written as json.dump wrote them
+    ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY |
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Excel engines: xlsxwriter and calamine (pandas >= 2.2) are much faster than
+# openpyxl, which stays the fallback when they are not installed
+EXCEL_WRITE_ENGINE = 'xlsxwriter' if find_spec('xlsxwriter') else 'openpyxl'
+EXCEL_READ_ENGINE = 'calamine' if find_spec('python_calamine') else None
+
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+# Subdirectories created under every base directory
+SUBDIRECTORIES = ("logs", "reports", "test_data", "exports", "temp")
+
+# Write buffer for log dumps, so large files take few write calls
+LOG_WRITE_BUFFER_BYTES = 1024 * 1024
+
+# Report archives below this total size are stored uncompressed
+ARCHIVE_STORE_BELOW_BYTES = 1024 * 1024
+
+# Deflate level for larger archives: favours speed, reports are mostly pre-compressed
+ARCHIVE_COMPRESSLEVEL = 1
+
+# Format validation reads at most this much of a file
+SNIFF_BYTES = 64 * 1024
+
+# Leading bytes of zip (xlsx) and OLE2 (legacy xls) containers
+XLSX_MAGIC = b'PK\x03\x04'
+XLS_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+# Linux FICLONE ioctl: shares extents on reflink-capable filesystems (btrfs, xfs)
+FICLONE = 0x40049409
+
+
+def _ensure_directories(base_directory: str) -> None:
+    """Create any missing standard subdirectories of a base directory"""
+    for name in SUBDIRECTORIES:
+        os.makedirs(os.path.join(base_directory, name), exist_ok=True)
+
+@lru_cache(maxsize=1024)
+def _resolve_path(base_directory: str, subdirectory: str, filename: str, extension: str) -> Path:
+    """Full path of a file, adding the extension when the name lacks it"""
+    if extension and not filename.endswith(f".{extension}"):
+        filename = f"{filename}.{extension}"
+    return Path(base_directory).joinpath(subdirectory, filename)
+
+def _loads_json(data: bytes) -> Any:
+    """Parse JSON bytes; files with NaN/Infinity tokens, which orjson rejects, go through json"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+def _finite_or_none(value):
+    """Copy of nested dicts/lists/tuples with NaN and infinite floats as None, as orjson writes them"""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite_or_none(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_or_none(item) for item in value]
+    return value
+
+def _csv_cell(value):
+    """A value as DataFrame.to_csv writes it: None, NaN, NaT and NA become empty"""
+    try:
+        if value is None or value != value:
+            return ''
+    except TypeError:
+        # pd.NA has no truth value
+        return ''
+    except ValueError:
+        # Array-like values compare elementwise
+        pass
+    return value
+
+def _sniff_csv(file_path: str) -> bool:
+    """Check that the first row of a file parses as CSV"""
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        sample = f.read(SNIFF_BYTES)
+    try:
+        dialect = csv.Sniffer().sniff(sample)
+    except csv.Error:
+        # Single-column files give the sniffer nothing to detect
+        dialect = csv.excel
+    header = next(csv.reader(sample.splitlines(), dialect), [])
+    return any(field.strip() for field in header)
+
+def _sniff_json(file_path: str) -> bool:
+    """Parse the whole file, so only documents load_json_data can read pass"""
+    with open(file_path, 'rb') as f:
+        _loads_json(f.read())
+    return True
+
+def _sniff_excel(file_path: str) -> bool:
+    """Check the container signature, and for zips that a workbook part is present"""
+    with open(file_path, 'rb') as f:
+        head = f.read(len(XLS_MAGIC))
+    if head == XLS_MAGIC:
+        return True
+    if head[:4] != XLSX_MAGIC:
+        return False
+    # Only the central directory is read, not the sheet data
+    with zipfile.ZipFile(file_path) as zf:
+        return any(name.startswith('xl/') for name in zf.namelist())
+
+def _copy_file_fast(source: Path, destination: Path) -> None:
+    """Copy file contents in-kernel: reflink, then copy_file_range, then shutil.copyfile"""
+    try:
+        with open(source, 'rb') as src, open(destination, 'wb') as dst:
+            if fcntl is not None:
+                try:
+                    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                    return
+                except OSError:
+                    pass
+            if hasattr(os, 'copy_file_range'):
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                else:
+                    return
+    except OSError:
+        pass
+    # Unsupported filesystem or platform: shutil uses sendfile where it can
+    shutil.copyfile(source, destination)
+
+
 class FileHandler:
     """Handles file operations for the application"""
     
@@ -31,21 +181,14 @@ class FileHandler:
     
     def _ensure_directories(self):
         """Ensure required directories exist"""
-        directories = [
-            self.base_directory / "logs",
-            self.base_directory / "reports", 
-            self.base_directory / "test_data",
-            self.base_directory / "exports",
-            self.base_directory / "temp"
-        ]
-        
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+        _ensure_directories(str(self.base_directory))
     
     def save_json_data(self, data: Dict[str, Any], filename: str, subdirectory: str = "") -> str:
         """
         Save data as JSON file
         
+        NaN and infinite floats are written as null, with or without orjson.
+        
         Args:
             data: Data to save
             filename: Name of the file
@@ -57,8 +200,12 @@ class FileHandler:
         try:
             file_path = self._get_file_path(filename, subdirectory, "json")
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
+            if ORJSON_AVAILABLE:
+                with open(file_path, 'wb') as f:
+                    f.write(orjson.dumps(data, default=str, option=ORJSON_OPTIONS))
+            else:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(_finite_or_none(data), f, indent=2, default=str)
             
             logger.info(f"JSON data saved to {file_path}")
             return str(file_path)
@@ -81,8 +228,8 @@ class FileHandler:
         try:
             file_path = self._get_file_path(filename, subdirectory, "json")
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = _loads_json(f.read())
             
             logger.info(f"JSON data loaded from {file_path}")
             return data
@@ -91,12 +238,17 @@ class FileHandler:
             logger.error(f"Error loading JSON data: {str(e)}")
             raise
     
-    def save_csv_data(self, data: List[Dict[str, Any]], filename: str, subdirectory: str = "") -> str:
+    def save_csv_data(self, data: Union[List[Dict[str, Any]], 'pd.DataFrame'], filename: str,
+                      subdirectory: str = "") -> str:
         """
         Save data as CSV file
         
+        Rows are streamed with csv.DictWriter; the header is every key in order
+        of first appearance, and missing keys and values (None, NaN, NaT, NA)
+        are left empty as DataFrame.to_csv leaves them.
+        
         Args:
-            data: List of dictionaries to save
+            data: List of dictionaries to save, or a DataFrame
             filename: Name of the file
             subdirectory: Subdirectory to save in
             
@@ -106,12 +258,18 @@ class FileHandler:
         try:
             file_path = self._get_file_path(filename, subdirectory, "csv")
             
-            if not data:
+            if len(data) == 0:
                 logger.warning("No data to save")
                 return str(file_path)
             
-            df = pd.DataFrame(data)
-            df.to_csv(file_path, index=False)
+            if not isinstance(data, list):
+                data.to_csv(file_path, index=False)
+            else:
+                fieldnames = list(dict.fromkeys(key for row in data for key in row))
+                with open(file_path, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.DictWriter(f, fieldnames=fieldnames)
+                    writer.writeheader()
+                    writer.writerows({key: _csv_cell(value) for key, value in row.items()} for row in data)
             
             logger.info(f"CSV data saved to {file_path}")
             return str(file_path)
@@ -120,7 +278,7 @@ class FileHandler:
             logger.error(f"Error saving CSV data: {str(e)}")
             raise
     
-    def load_csv_data(self, filename: str, subdirectory: str = "") -> pd.DataFrame:
+    def load_csv_data(self, filename: str, subdirectory: str = "") -> 'pd.DataFrame':
         """
         Load data from CSV file
         
@@ -134,6 +292,7 @@ class FileHandler:
         try:
             file_path = self._get_file_path(filename, subdirectory, "csv")
             
+            import pandas as pd
             df = pd.read_csv(file_path)
             logger.info(f"CSV data loaded from {file_path}")
             return df
@@ -142,7 +301,7 @@ class FileHandler:
             logger.error(f"Error loading CSV data: {str(e)}")
             raise
     
-    def save_excel_data(self, data: Dict[str, pd.DataFrame], filename: str, subdirectory: str = "") -> str:
+    def save_excel_data(self, data: Dict[str, 'pd.DataFrame'], filename: str, subdirectory: str = "") -> str:
         """
         Save data as Excel file with multiple sheets
         
@@ -157,7 +316,8 @@ class FileHandler:
         try:
             file_path = self._get_file_path(filename, subdirectory, "xlsx")
             
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
+            import pandas as pd
+            with pd.ExcelWriter(file_path, engine=EXCEL_WRITE_ENGINE) as writer:
                 for sheet_name, df in data.items():
                     df.to_excel(writer, sheet_name=sheet_name, index=False)
             
@@ -168,7 +328,7 @@ class FileHandler:
             logger.error(f"Error saving Excel data: {str(e)}")
             raise
     
-    def load_excel_data(self, filename: str, subdirectory: str = "", sheet_name: Optional[str] = None) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    def load_excel_data(self, filename: str, subdirectory: str = "", sheet_name: Optional[str] = None) -> Union['pd.DataFrame', Dict[str, 'pd.DataFrame']]:
         """
         Load data from Excel file
         
@@ -183,12 +343,13 @@ class FileHandler:
         try:
             file_path = self._get_file_path(filename, subdirectory, "xlsx")
             
+            import pandas as pd
             if sheet_name:
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
+                df = pd.read_excel(file_path, sheet_name=sheet_name, engine=EXCEL_READ_ENGINE)
                 logger.info(f"Excel sheet '{sheet_name}' loaded from {file_path}")
                 return df
             else:
-                all_sheets = pd.read_excel(file_path, sheet_name=None)
+                all_sheets = pd.read_excel(file_path, sheet_name=None, engine=EXCEL_READ_ENGINE)
                 logger.info(f"All Excel sheets loaded from {file_path}")
                 return all_sheets
                 
@@ -210,12 +371,13 @@ class FileHandler:
         try:
             file_path = self._get_file_path(filename, "logs", "log")
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                for entry in log_entries:
-                    timestamp = entry.get('timestamp', datetime.now().isoformat())
-                    level = entry.get('log_level', 'INFO')
-                    message = entry.get('message', '')
-                    f.write(f"[{timestamp}] {level}: {message}\n")
+            # Entries without a timestamp are stamped with the save time
+            now = datetime.now().isoformat()
+            with open(file_path, 'w', encoding='utf-8', buffering=LOG_WRITE_BUFFER_BYTES) as f:
+                f.writelines(
+                    f"[{entry.get('timestamp', now)}] {entry.get('log_level', 'INFO')}: {entry.get('message', '')}\n"
+                    for entry in log_entries
+                )
             
             logger.info(f"Log file saved to {file_path}")
             return str(file_path)
@@ -238,10 +400,15 @@ class FileHandler:
         try:
             archive_path = self._get_file_path(archive_name, "exports", "zip")
             
-            with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for file_path in report_files:
-                    if os.path.exists(file_path):
-                        zipf.write(file_path, os.path.basename(file_path))
+            existing = [file_path for file_path in report_files if os.path.exists(file_path)]
+            
+            # Small bundles are stored as-is; larger ones use fast deflate
+            total_bytes = sum(os.path.getsize(file_path) for file_path in existing)
+            compression = zipfile.ZIP_STORED if total_bytes < ARCHIVE_STORE_BELOW_BYTES else zipfile.ZIP_DEFLATED
+            
+            with zipfile.ZipFile(archive_path, 'w', compression, compresslevel=ARCHIVE_COMPRESSLEVEL) as zipf:
+                for file_path in existing:
+                    zipf.write(file_path, os.path.basename(file_path))
             
             logger.info(f"Report archive created: {archive_path}")
             return str(archive_path)
@@ -259,14 +426,13 @@ class FileHandler:
         """
         try:
             temp_dir = self.base_directory / "temp"
-            current_time = datetime.now()
+            cutoff = time.time() - max_age_hours * 3600
             
-            for file_path in temp_dir.iterdir():
-                if file_path.is_file():
-                    file_age = current_time - datetime.fromtimestamp(file_path.stat().st_mtime)
-                    if file_age.total_seconds() > (max_age_hours * 3600):
-                        file_path.unlink()
-                        logger.info(f"Cleaned up temp file: {file_path}")
+            with os.scandir(temp_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                        logger.info(f"Cleaned up temp file: {entry.path}")
             
         except Exception as e:
             logger.error(f"Error cleaning up temp files: {str(e)}")
@@ -317,19 +483,30 @@ class FileHandler:
             dir_path = self.base_directory / subdirectory
             files = []
             
-            for file_path in dir_path.glob(pattern):
-                if file_path.is_file():
-                    stat = file_path.stat()
-                    files.append({
-                        "name": file_path.name,
-                        "size_bytes": stat.st_size,
-                        "size_mb": round(stat.st_size / (1024 * 1024), 2),
-                        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        "path": str(file_path)
-                    })
+            if '/' in pattern or '**' in pattern:
+                # Recursive and nested patterns need pathlib's glob
+                matches = ((p.name, str(p), p.stat()) for p in dir_path.glob(pattern) if p.is_file())
+            else:
+                with os.scandir(dir_path) as entries:
+                    matches = [
+                        (entry.name, entry.path, entry.stat())
+                        for entry in entries
+                        if entry.is_file() and fnmatch.fnmatch(entry.name, pattern)
+                    ]
+            
+            for name, path, stat in matches:
+                files.append({
+                    "name": name,
+                    "size_bytes": stat.st_size,
+                    "size_mb": round(stat.st_size / (1024 * 1024), 2),
+                    "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                    "path": path
+                })
             
             return sorted(files, key=lambda x: x["modified"], reverse=True)
             
+        except FileNotFoundError:
+            return []
         except Exception as e:
             logger.error(f"Error listing files: {str(e)}")
             return []
@@ -346,13 +523,7 @@ class FileHandler:
         Returns:
             Path: Full file path
         """
-        if not filename.endswith(f".{extension}") and extension:
-            filename = f"{filename}.{extension}"
-        
-        if subdirectory:
-            return self.base_directory / subdirectory / filename
-        else:
-            return self.base_directory / filename
+        return _resolve_path(str(self.base_directory), subdirectory, filename, extension)
     
     def validate_file_format(self, file_path: str, expected_format: str) -> bool:
         """
@@ -366,18 +537,16 @@ class FileHandler:
             bool: True if format is valid
         """
         try:
-            if expected_format.lower() == 'csv':
-                pd.read_csv(file_path, nrows=1)
-            elif expected_format.lower() == 'json':
-                with open(file_path, 'r') as f:
-                    json.load(f)
-            elif expected_format.lower() in ['xlsx', 'xls']:
-                pd.read_excel(file_path, nrows=1)
+            expected_format = expected_format.lower()
+            if expected_format == 'csv':
+                return _sniff_csv(file_path)
+            elif expected_format == 'json':
+                return _sniff_json(file_path)
+            elif expected_format in ['xlsx', 'xls']:
+                return _sniff_excel(file_path)
             else:
                 return False
             
-            return True
-            
         except Exception as e:
             logger.error(f"File format validation failed: {str(e)}")
             return False
@@ -397,7 +566,8 @@ class FileHandler:
             original_path = Path(file_path)
             backup_path = original_path.with_name(f"{original_path.stem}{backup_suffix}{original_path.suffix}")
             
-            shutil.copy2(original_path, backup_path)
+            _copy_file_fast(original_path, backup_path)
+            shutil.copystat(original_path, backup_path)
             logger.info(f"Backup created: {backup_path}")
             return str(backup_path)
             
@@ -290,9 +290,10 @@ def analyze_logs():
         # Analyze logs
         analyzer = LogAnalyzer()
         df = analyzer.parse_log_file(filepath)
-        error_analysis = analyzer.analyze_error_patterns(df)
+        stats = analyzer.compute_summary_stats(df)
+        error_analysis = analyzer.analyze_error_patterns(df, stats)
         performance_analysis = analyzer.analyze_performance_patterns(df)
-        summary = analyzer.generate_log_summary(df)
+        summary = analyzer.generate_log_summary(df, stats)
         
         # Clean up uploaded file
         os.remove(filepath)
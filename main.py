@@ -125,10 +125,11 @@ def analyze_logs(log_file_path: str) -> dict:
         logger.info(f"Parsed {len(df)} log entries")
         
         # Analyze logs
-        error_analysis = log_analyzer.analyze_error_patterns(df)
+        stats = log_analyzer.compute_summary_stats(df)
+        error_analysis = log_analyzer.analyze_error_patterns(df, stats)
         performance_analysis = log_analyzer.analyze_performance_patterns(df)
         anomalies = log_analyzer.detect_anomalies(df)
-        summary = log_analyzer.generate_log_summary(df)
+        summary = log_analyzer.generate_log_summary(df, stats)
         
         results = {
             'summary': summary,
@@ -0,0 +1,127 @@
+"""
+Database Tests
+Round trips through an in-memory SQLite database
+"""
+
+import unittest
+from datetime import datetime, timedelta
+
+from backend.database.database import DatabaseService
+from backend.database.migrations import upgrade_compressed_text_columns
+from backend.database.models import ZstdText, COMPRESS_MIN_BYTES, ZSTD_FRAME_MAGIC
+
+
+class DatabaseRoundTripTest(unittest.TestCase):
+    """Rows written through the repositories read back unchanged"""
+
+    def setUp(self):
+        self.db = DatabaseService('sqlite://')
+        self.db.initialize_database()
+        self.start = datetime(2024, 1, 1, 12, 0, 0)
+
+    def tearDown(self):
+        self.db.close()
+
+    def create_run(self, name: str = "Load test", **fields):
+        return self.db.test_runs.create_test_run({'test_name': name, 'start_time': self.start, **fields})
+
+    def test_test_run_round_trip(self):
+        run = self.create_run(environment='staging', total_requests=100)
+
+        loaded = self.db.test_runs.get_test_run(run.id)
+        self.assertEqual(loaded.test_name, "Load test")
+        self.assertEqual(loaded.environment, 'staging')
+        self.assertEqual(loaded.total_requests, 100)
+
+    def test_metrics_by_timerange(self):
+        run = self.create_run()
+        self.db.metrics.bulk_add_metrics(
+            {
+                'test_run_id': run.id,
+                'timestamp': self.start + timedelta(seconds=i),
+                'response_time': 100.0 + i,
+                'status_code': 200
+            }
+            for i in range(10)
+        )
+
+        metrics = self.db.metrics.get_metrics_by_timerange(
+            run.id, self.start + timedelta(seconds=2), self.start + timedelta(seconds=5)
+        )
+        self.assertEqual([m.response_time for m in metrics], [102.0, 103.0, 104.0, 105.0])
+
+    def test_log_messages_round_trip(self):
+        run = self.create_run()
+        short = "Connection refused"
+        long = "Traceback (most recent call last):\n" + "  File \"app.py\", line 1\n" * 200
+        self.db.logs.add_log_entries([
+            {'test_run_id': run.id, 'timestamp': self.start, 'log_level': 'ERROR',
+             'message': short, 'stack_trace': long},
+            {'test_run_id': run.id, 'timestamp': self.start, 'log_level': 'INFO',
+             'message': long, 'stack_trace': None},
+        ])
+
+        logs = self.db.logs.get_logs_by_test_run(run.id)
+        self.assertEqual(
+            sorted((log.message, log.stack_trace) for log in logs),
+            sorted([(short, long), (long, None)], key=lambda pair: pair[0])
+        )
+
+    def test_test_runs_before_pages_newest_first(self):
+        runs = [self.create_run(f"Run {i}", created_at=self.start + timedelta(minutes=i // 2)) for i in range(7)]
+        expected = [run.id for run in sorted(runs, key=lambda r: (r.created_at, r.id), reverse=True)]
+
+        seen = []
+        page = self.db.test_runs.get_test_runs_before(limit=3)
+        while page:
+            seen.extend(run.id for run in page)
+            last = page[-1]
+            page = self.db.test_runs.get_test_runs_before(last.created_at, last.id, limit=3)
+
+        self.assertEqual(seen, expected)
+
+    def test_upgrade_compressed_text_columns_is_noop_on_sqlite(self):
+        self.assertEqual(upgrade_compressed_text_columns(self.db.db_manager.engine), [])
+
+
+class ZstdTextTest(unittest.TestCase):
+    """ZstdText values survive bind and result processing"""
+
+    def setUp(self):
+        self.column_type = ZstdText()
+
+    def round_trip(self, value):
+        stored = self.column_type.process_bind_param(value, None)
+        return stored, self.column_type.process_result_value(stored, None)
+
+    def test_short_text_is_stored_raw(self):
+        stored, loaded = self.round_trip("short")
+        self.assertEqual(stored, b'Rshort')
+        self.assertEqual(loaded, "short")
+
+    def test_long_text_is_compressed(self):
+        value = "résumé line\n" * COMPRESS_MIN_BYTES
+        stored, loaded = self.round_trip(value)
+        self.assertIn(stored[:1], (b'Z', b'D'))
+        self.assertLess(len(stored), len(value.encode('utf-8')))
+        self.assertEqual(loaded, value)
+
+    def test_none_passes_through(self):
+        self.assertEqual(self.round_trip(None), (None, None))
+
+    def test_untagged_legacy_values(self):
+        result = self.column_type.process_result_value
+        self.assertEqual(result("plain text", None), "plain text")
+        self.assertEqual(result(b"Database timeout", None), "Database timeout")
+        self.assertEqual(result(b"Zero rows returned", None), "Zero rows returned")
+
+    def test_zstd_value_without_zstandard_raises(self):
+        from backend.database import models
+        if models.ZSTD_AVAILABLE:
+            self.skipTest("zstandard is installed")
+        with self.assertRaises(RuntimeError):
+            self.column_type.process_result_value(b'Z' + ZSTD_FRAME_MAGIC + b'\x00', None)
+
+
+if __name__ == '__main__':
+    unittest.main()
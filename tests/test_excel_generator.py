@@ -0,0 +1,55 @@
+"""
+Excel Generator Tests
+The hand-written raw data sheet must open in openpyxl with its values intact
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+from backend.reports.excel_generator import ExcelReportGenerator
+
+
+class RawDataSheetFastTest(unittest.TestCase):
+    """create_raw_data_sheet_fast writes a valid single-sheet workbook"""
+
+    def setUp(self):
+        handle, self.output_path = tempfile.mkstemp(suffix='.xlsx')
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.output_path)
+
+    def test_values_round_trip(self):
+        df = pd.DataFrame({
+            'endpoint': ['/api/users', '/api/<orders> & "items"', None],
+            'response_time': [123.45, np.nan, 7.0],
+            'status_code': [200, 500, 404],
+            'success': [True, False, True],
+        })
+
+        ExcelReportGenerator().create_raw_data_sheet_fast(df, self.output_path, sheet_name="Raw & Data")
+
+        wb = load_workbook(self.output_path)
+        self.assertEqual(wb.sheetnames, ["Raw & Data"])
+        rows = list(wb.active.iter_rows(values_only=True))
+        self.assertEqual(rows[0], ('endpoint', 'response_time', 'status_code', 'success'))
+        self.assertEqual(rows[1], ('/api/users', 123.45, 200, True))
+        self.assertEqual(rows[2], ('/api/<orders> & "items"', None, 500, False))
+        self.assertEqual(rows[3], (None, 7, 404, True))
+
+    def test_control_characters_are_stripped(self):
+        df = pd.DataFrame({'message': ['bad\x00byte\x1b[0m', 'tab\tkept']})
+
+        ExcelReportGenerator().create_raw_data_sheet_fast(df, self.output_path)
+
+        rows = list(load_workbook(self.output_path).active.iter_rows(values_only=True))
+        self.assertEqual(rows[1:], [('badbyte[0m',), ('tab\tkept',)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Stats Kernels Tests
+Check that the Numba kernels and the NumPy fallbacks agree
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from backend.core import stats_kernels
+
+
+@unittest.skipUnless(stats_kernels.NUMBA_AVAILABLE, "numba is not installed")
+class NumbaNumpyParityTest(unittest.TestCase):
+    """Each public kernel gives the same result on both paths"""
+
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.values = rng.gamma(2.0, 100.0, 5000)
+        self.values[::500] *= 20  # a few clear outliers
+
+    def both_paths(self, func, *args):
+        jit_result = func(*args)
+        with mock.patch.object(stats_kernels, 'NUMBA_AVAILABLE', False):
+            numpy_result = func(*args)
+        return jit_result, numpy_result
+
+    def test_zscore_outliers(self):
+        (jit_pos, jit_z), (np_pos, np_z) = self.both_paths(stats_kernels.zscore_outliers, self.values, 2.0)
+        np.testing.assert_array_equal(jit_pos, np_pos)
+        np.testing.assert_allclose(jit_z, np_z, rtol=1e-9)
+
+    def test_zscore_outliers_constant_series(self):
+        (jit_pos, _), (np_pos, _) = self.both_paths(stats_kernels.zscore_outliers, np.full(10, 5.0), 2.0)
+        self.assertEqual(len(jit_pos), 0)
+        self.assertEqual(len(np_pos), 0)
+
+    def test_summary_stats(self):
+        jit_stats, np_stats = self.both_paths(stats_kernels.summary_stats, self.values)
+        np.testing.assert_allclose(jit_stats, np_stats, rtol=1e-9)
+
+    def test_summary_stats_single_value(self):
+        jit_stats, np_stats = self.both_paths(stats_kernels.summary_stats, np.array([3.0]))
+        self.assertEqual(jit_stats[:3], np_stats[:3])
+        self.assertTrue(np.isnan(jit_stats[3]) and np.isnan(np_stats[3]))
+
+    def test_grouped_stats(self):
+        rng = np.random.default_rng(7)
+        codes = rng.integers(-1, 6, len(self.values))  # -1 is a missing key
+        values = self.values.copy()
+        values[::97] = np.nan
+        n_groups = 7  # the last group stays empty
+
+        jit_stats, np_stats = self.both_paths(stats_kernels.grouped_stats, codes, values, n_groups)
+        for key in ('count', 'mean', 'min', 'max', 'std'):
+            np.testing.assert_allclose(jit_stats[key], np_stats[key], rtol=1e-9, err_msg=key)
+        self.assertEqual(np_stats['count'][6], 0)
+        self.assertTrue(np.isnan(np_stats['mean'][6]))
+
+    def test_trend_correlation(self):
+        trending = self.values + np.arange(len(self.values)) * 0.5
+        jit_r, np_r = self.both_paths(stats_kernels.trend_correlation, trending)
+        self.assertAlmostEqual(jit_r, np_r, places=9)
+        self.assertAlmostEqual(np_r, np.corrcoef(np.arange(len(trending)), trending)[0, 1], places=9)
+
+    def test_trend_correlation_constant_series(self):
+        jit_r, np_r = self.both_paths(stats_kernels.trend_correlation, np.ones(50))
+        self.assertTrue(np.isnan(jit_r) and np.isnan(np_r))
+
+
+if __name__ == '__main__':
+    unittest.main()